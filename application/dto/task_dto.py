@@ -15,7 +15,7 @@ This module intentionally keeps conversions simple and deterministic to aid test
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, List, Optional
 import datetime
 
 
@@ -31,7 +31,10 @@ class TaskDTO:
         estimated_hours: float normalized to positive values
         importance: integer in allowed range
         dependencies: list of dependency ids as strings
-        raw: original raw input dict for traceability
+        raw: original raw input dict for traceability, or only the requested
+             passthrough fields when the caller opts out of retaining it
+        validation_issues: issues recorded by validation (the raw input is
+             never annotated)
     """
     id: Optional[str]
     title: str
@@ -40,15 +43,18 @@ class TaskDTO:
     importance: int
     dependencies: List[str]
     raw: dict
+    validation_issues: Optional[list] = None
 
 
-def to_task_dto(raw: dict, date_parser) -> TaskDTO:
+def to_task_dto(raw: dict, date_parser, passthrough: Optional[Iterable[str]] = None) -> TaskDTO:
     """
     Convert raw dict to TaskDTO.
 
     Inputs:
         raw: raw task dictionary from client
         date_parser: callable that accepts a raw date value and returns datetime.date
+        passthrough: when given, keep only these raw fields (in a new dict)
+                     instead of a reference to the whole raw mapping
 
     Output:
         TaskDTO with normalized fields
@@ -58,6 +64,7 @@ def to_task_dto(raw: dict, date_parser) -> TaskDTO:
         - coerces estimated hours to float and ensures positivity
         - coerces importance to int and relies on validators elsewhere to clamp
         - converts dependency entries to strings
+        - never mutates `raw`
     """
     tid = raw.get("id") or raw.get("task_id") or None
     title = (raw.get("title") or "Untitled Task").strip()
@@ -83,5 +90,5 @@ def to_task_dto(raw: dict, date_parser) -> TaskDTO:
         estimated_hours=est,
         importance=importance,
         dependencies=deps,
-        raw=raw
+        raw=raw if passthrough is None else {k: raw[k] for k in passthrough if k in raw}
     )
@@ -18,17 +18,30 @@ Outputs:
 - warnings list describing any issues found during processing
 """
 
-from typing import List, Dict, Tuple
+from collections import Counter
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from datetime import date, datetime, timedelta
 
 from application.dto.task_dto import to_task_dto, TaskDTO
-from application.services.config_service import merge_config, build_scoring_config
+from application.services.config_service import InvalidConfig, merge_config, build_scoring_config
+from application.services.facet_service import FacetAccumulator
 
 # domain imports (pure domain layer). These must be implemented in core.scoring modules.
 from core.models.dependency_graph import DependencyGraph
+from core.models.task_graph import TaskGraph
+from core.scoring.eisenhower import QUADRANTS
 from core.scoring.priority_engine import PriorityEngine
 from core.validators.task_validator import TaskValidator
 
+VALIDATION_POLICIES = ("collect", "budget", "reject")
+
+# stage names reported to analyze_tasks_service's stage_observer, in order
+ANALYZE_STAGES = ("dto", "validation", "graph", "scoring", "records")
+
+
+def _no_stage(name: str) -> None:
+    pass
+
 
 def _date_parser(raw_date):
     """
@@ -52,34 +65,58 @@ def _date_parser(raw_date):
             return date.today() + timedelta(days=3650)
 
 
-def _validate_and_collect(dtos: List[TaskDTO]) -> Tuple[List[TaskDTO], List[Dict]]:
+def _max_issues(policy: str, error_budget) -> Optional[int]:
+    """
+    Issue allowance of a validation policy (None: unlimited).
+
+    Raises:
+        InvalidConfig for an unknown policy or a non-integer error_budget
+    """
+    if policy not in VALIDATION_POLICIES:
+        raise InvalidConfig(f"validation_policy must be one of {', '.join(VALIDATION_POLICIES)}")
+    if not isinstance(error_budget, int) or isinstance(error_budget, bool):
+        raise InvalidConfig("validation_error_budget must be an integer")
+    if policy == "budget":
+        return max(error_budget, 0)
+    if policy == "reject":
+        return 0
+    return None
+
+
+def _validate_and_collect(
+    dtos: List[TaskDTO], policy: str = "collect", error_budget: int = 0
+) -> Tuple[List[TaskDTO], List[Dict]]:
     """
     Validate DTOs using domain validator and collect warnings.
 
     Inputs:
         dtos: list of TaskDTO instances
+        policy: "collect" keeps every task and reports all issues,
+                "budget" aborts once more than error_budget issues are found,
+                "reject" aborts on the first issue
+        error_budget: issue allowance for the "budget" policy
 
     Outputs:
         tuple(valid_dtos, warnings)
 
+    Raises:
+        InvalidConfig for an unknown policy or a non-integer error_budget
+        ValidationBudgetExceeded when the policy aborts the analysis
+
     Warnings are mappings with keys:
-        - id or index
-        - message
-        - field (optional)
+        - id: task id, or idx_<index> for id-less tasks
+        - index: position of the task in the payload
+        - issues: validation messages
     """
-    valid = []
+    max_issues = _max_issues(policy, error_budget)
+    issues_by_index = TaskValidator().validate_batch(dtos, max_issues=max_issues)
     warnings = []
-    validator = TaskValidator()
-    for idx, dto in enumerate(dtos):
-        ok, issues = validator.validate(dto)
-        if ok:
-            valid.append(dto)
-        else:
-            warnings.append({"id": dto.id or f"idx_{idx}", "issues": issues})
-            # still include the dto so the user can fix it; mark dto via attribute
-            dto.raw["_validation_issues"] = issues
-            valid.append(dto)
-    return valid, warnings
+    for idx, issues in issues_by_index.items():
+        dto = dtos[idx]
+        warnings.append({"id": dto.id or f"idx_{idx}", "index": idx, "issues": issues})
+        # still include the dto so the user can fix it; mark the dto, not the raw input
+        dto.validation_issues = issues
+    return dtos, warnings
 
 
 def _build_task_map(dtos: List[TaskDTO]) -> Dict[str, TaskDTO]:
@@ -99,13 +136,58 @@ def _build_task_map(dtos: List[TaskDTO]) -> Dict[str, TaskDTO]:
     return task_map
 
 
-def analyze_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = None) -> Dict:
+def _scoring_graph(tasks_payload: List[Dict]) -> Tuple[Dict[str, TaskDTO], TaskGraph, List[List[str]]]:
+    """
+    Shared preparation for services that score without validation output.
+
+    Outputs:
+        tuple(task_map, graph aligned with task_map, cycles as lists of keys)
+    """
+    dtos = [to_task_dto(raw, _date_parser) for raw in tasks_payload]
+    task_map = _build_task_map(dtos)
+    graph = TaskGraph.from_task_map(task_map)
+    return task_map, graph, DependencyGraph(task_map, graph=graph).get_cycles()
+
+
+def _scoring_inputs(tasks_payload: List[Dict]) -> Tuple[Dict[str, TaskDTO], TaskGraph, Set[str]]:
+    """
+    _scoring_graph with the cycles reduced to the keys they block.
+
+    Outputs:
+        tuple(task_map, graph aligned with task_map, keys blocked by cycles)
+    """
+    task_map, graph, cycles = _scoring_graph(tasks_payload)
+    return task_map, graph, {node for cycle in cycles for node in cycle}
+
+
+def _annotated_raw(dto: TaskDTO, blocked: bool) -> Dict:
+    """
+    Raw mapping echoed in a record, with validation/cycle flags added on a
+    copy so the client payload is never mutated.
+    """
+    if not dto.validation_issues and not blocked:
+        return dto.raw
+    raw = dict(dto.raw)
+    if dto.validation_issues:
+        raw["_validation_issues"] = dto.validation_issues
+    if blocked:
+        raw["_blocked_by_cycle"] = True
+    return raw
+
+
+def analyze_tasks_service(
+    tasks_payload: List[Dict],
+    config_overrides: Dict = None,
+    stage_observer: Optional[Callable[[str], None]] = None,
+) -> Dict:
     """
     Main application entrypoint for analyze use case.
 
     Inputs:
         tasks_payload: list of raw task dicts from client
         config_overrides: optional mapping to modify scoring parameters
+        stage_observer: optional callable invoked with each ANALYZE_STAGES
+                        name as that stage finishes (benchmarks, diagnostics)
 
     Outputs:
         result mapping containing:
@@ -113,40 +195,67 @@ def analyze_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = No
             - blocked_tasks: list of tasks part of cycles
             - needs_attention: list of tasks with validation warnings
             - warnings: list of validation messages
+            - quadrant_counts: number of tasks per Eisenhower quadrant
+            - critical_path: ids of the longest hours-weighted dependency chain
+              and its length in hours
+            - dependency_issues: dependencies on unknown ids and self dependencies
+            - component_timings_ms: time spent per scoring component
+            - facets: grouped counts, hours and max scores for the facets
+              named in config "facets" (only when some are requested)
             - config_used: resolved config mapping
+
+        With include_tasks false, priority_list, blocked_tasks and
+        needs_attention are empty and no records are built.
+
+    Raises:
+        InvalidConfig for config values the analysis cannot use
+        ValidationBudgetExceeded when validation_policy aborts the analysis
     """
     config_dict = merge_config(config_overrides or {})
     scoring_config = build_scoring_config(config_dict)
+    stage_done = stage_observer or _no_stage
+    policy = config_dict.get("validation_policy", "collect")
+    error_budget = config_dict.get("validation_error_budget", 0)
+    facets = FacetAccumulator(config_dict.get("facets") or [], config_dict.get("facet_max_groups", 1000))
+    include_tasks = config_dict.get("include_tasks", True)
+    if not isinstance(include_tasks, bool):
+        raise InvalidConfig("include_tasks must be true or false")
+    # validation settings are checked before any task is converted
+    _max_issues(policy, error_budget)
 
-    # convert raw tasks into DTOs
-    dtos: List[TaskDTO] = [to_task_dto(raw, _date_parser) for raw in tasks_payload]
+    # convert raw tasks into DTOs; without retain_raw only passthrough fields are copied
+    passthrough = None if config_dict.get("retain_raw", True) else list(config_dict.get("passthrough_fields") or [])
+    dtos: List[TaskDTO] = [to_task_dto(raw, _date_parser, passthrough) for raw in tasks_payload]
+    stage_done("dto")
 
     # validate and collect warnings
-    valid_dtos, warnings = _validate_and_collect(dtos)
+    valid_dtos, warnings = _validate_and_collect(dtos, policy=policy, error_budget=error_budget)
+    stage_done("validation")
 
     # dependency analysis
     task_map = _build_task_map(valid_dtos)
-    dep_graph = DependencyGraph(task_map)
+    graph = TaskGraph.from_task_map(task_map)
+    dep_graph = DependencyGraph(task_map, graph=graph)
     cycles = dep_graph.get_cycles()
     blocked_ids = set()
     for cycle in cycles:
         for node in cycle:
             blocked_ids.add(node)
+    stage_done("graph")
 
-    # mark blocked tasks
-    for tid, dto in task_map.items():
-        if tid in blocked_ids:
-            dto.raw["_blocked_by_cycle"] = True
-
-    # scoring
+    # scoring: one batch pass yields scores and their component breakdown
     engine = PriorityEngine(scoring_config)
+    tasks = list(task_map.values())
+    critical = engine.critical_path(tasks, graph=graph)
+    breakdowns = engine.score_breakdowns(tasks, task_map=task_map, graph=graph, critical=critical)
+    stage_done("scoring")
     scored_results = []
-    for tid, dto in task_map.items():
-        # convert dto into domain TaskEntity expected by engine
-        # the PriorityEngine is expected to accept an object with attributes oriented as TaskEntity;
-        # adapt or map fields if core expects different shape.
-        score = engine.score_task(dto, task_map)
-        explanation = engine.explain_task(dto, task_map) if hasattr(engine, "explain_task") else ""
+    for key, dto, breakdown in zip(task_map.keys(), tasks, breakdowns):
+        blocked = key in blocked_ids
+        if facets:
+            facets.add(dto, breakdown.quadrant, breakdown.score, blocked)
+        if not include_tasks:
+            continue
         scored_results.append({
             "id": dto.id,
             "title": dto.title,
@@ -154,10 +263,11 @@ def analyze_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = No
             "estimated_hours": dto.estimated_hours,
             "importance": dto.importance,
             "dependencies": dto.dependencies,
-            "score": score,
-            "explanation": explanation,
-            "raw": dto.raw,
-            "blocked": dto.raw.get("_blocked_by_cycle", False),
+            "score": breakdown.score,
+            "components": breakdown._asdict(),
+            "explanation": engine.describe(breakdown),
+            "raw": _annotated_raw(dto, blocked),
+            "blocked": blocked,
         })
 
     # sort by score descending, blocked tasks appended to blocked bucket
@@ -165,11 +275,23 @@ def analyze_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = No
     blocked_tasks = [r for r in scored_results if r["blocked"]]
     priority_list = [r for r in scored_results if not r["blocked"]]
     needs_attention = [r for r in scored_results if r["raw"].get("_validation_issues")]
+    quadrant_counts = Counter(b.quadrant for b in breakdowns)
 
-    return {
+    result = {
         "priority_list": priority_list,
         "blocked_tasks": blocked_tasks,
         "needs_attention": needs_attention,
         "warnings": warnings,
+        "quadrant_counts": {q: quadrant_counts.get(q, 0) for q in QUADRANTS},
+        "critical_path": {
+            "ids": [tasks[idx].id for idx in critical.path],
+            "length_hours": critical.length,
+        },
+        "dependency_issues": graph.issues(),
+        "component_timings_ms": {name: seconds * 1000.0 for name, seconds in engine.component_timings.items()},
         "config_used": config_dict
     }
+    if facets:
+        result["facets"] = facets.result()
+    stage_done("records")
+    return result
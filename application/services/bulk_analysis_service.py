@@ -0,0 +1,243 @@
+"""
+Application service for offline bulk analysis.
+
+Responsibilities:
+- split a large payload into independent parts (weakly connected components
+  of the dependency graph) so they can be analyzed in separate processes
+- run analyze_tasks_service per part and merge the results into the same
+  shape a single analyze call would produce
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- config_overrides: optional mapping to alter scoring behavior
+- workers: number of processes (1 runs in-process)
+
+Outputs:
+- analyze-style result mapping (priority_list, blocked_tasks, warnings,
+  quadrant_counts, critical_path, dependency_issues, config_used)
+
+Notes:
+- dependencies never cross parts, so cycles, dependent counts, slack and the
+  validation policy give the same answers as one analyze call
+- criticality is relative to the longest chain, which may live in another
+  part; it is rescaled after merging (and scores recombined when
+  weight_critical_path is non-zero)
+"""
+
+import gc
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+
+from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.config_service import merge_config, build_scoring_config
+from application.services.facet_service import merge_facets
+from core.scoring.components import BUILTIN_COMPONENTS
+from core.scoring.eisenhower import QUADRANTS
+from core.scoring.priority_engine import PriorityEngine, ScoreBreakdown
+from core.validators.task_validator import ValidationBudgetExceeded
+
+# payload shared with forked workers so parts are not pickled to them
+_FORK_PAYLOAD: List[Dict] = []
+
+
+def _task_key(raw: Dict) -> str:
+    """Task-map key of a raw task, as to_task_dto + _build_task_map derive it."""
+    tid = raw.get("id") or raw.get("task_id")
+    if tid is not None:
+        return str(tid)
+    return (raw.get("title") or "Untitled Task").strip()
+
+
+def _dependencies(raw: Dict) -> List[str]:
+    deps = raw.get("dependencies") or []
+    if not isinstance(deps, list):
+        return []
+    return [str(d) for d in deps if d is not None]
+
+
+def partition_tasks(tasks_payload: Sequence[Dict], parts: int) -> List[List[int]]:
+    """
+    Group task positions into at most `parts` lists so that no dependency
+    crosses two lists. Components are packed largest first onto the
+    lightest part; each list keeps input order.
+    """
+    keys = [_task_key(raw) for raw in tasks_payload]
+    index: Dict[str, int] = {}
+    for pos, key in enumerate(keys):
+        index.setdefault(key, pos)
+    parent = list(range(len(keys)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    get = index.get
+    for pos, raw in enumerate(tasks_payload):
+        # positions sharing a key (duplicate ids) stay with the first one
+        root = find(index[keys[pos]])
+        own = find(pos)
+        if own != root:
+            parent[own] = root
+        for dep in _dependencies(raw):
+            target = get(dep)
+            if target is not None:
+                other = find(target)
+                if other != root:
+                    parent[other] = root
+
+    components: Dict[int, List[int]] = {}
+    for pos in range(len(keys)):
+        components.setdefault(find(pos), []).append(pos)
+
+    loads = [(0, part) for part in range(max(1, min(parts, len(components))))]
+    assigned: List[List[int]] = [[] for _ in loads]
+    for members in sorted(components.values(), key=len, reverse=True):
+        load, part = heapq.heappop(loads)
+        assigned[part].extend(members)
+        heapq.heappush(loads, (load + len(members), part))
+    return [sorted(members) for members in assigned if members]
+
+
+def _analyze_part(job):
+    """
+    Analyze one part and tag records/warnings with their input position.
+    Unannotated raw inputs are not sent back; the caller still holds them.
+    """
+    positions, tasks, config_overrides = job
+    if tasks is None:
+        tasks = [_FORK_PAYLOAD[pos] for pos in positions]
+    result = analyze_tasks_service(tasks, config_overrides)
+
+    first = {}
+    for local, raw in enumerate(tasks):
+        first.setdefault(_task_key(raw), local)
+    for rec in result["priority_list"] + result["blocked_tasks"]:
+        local = first[rec["id"] if rec["id"] is not None else rec["title"]]
+        rec["_position"] = positions[local]
+        if rec["raw"] is tasks[local]:
+            rec["raw"] = None
+    for warning in result["warnings"]:
+        local = warning["index"]
+        warning["index"] = positions[local]
+        if warning["id"] == f"idx_{local}":
+            warning["id"] = f"idx_{positions[local]}"
+    return result
+
+
+def analyze_bulk_service(tasks_payload: List[Dict], config_overrides: Dict = None, workers: int = 1) -> Dict:
+    """
+    Analyze a large payload, optionally across `workers` processes.
+
+    Outputs:
+        analyze-style result mapping; records are ordered exactly as a
+        single analyze call would order them
+
+    Raises:
+        ValidationBudgetExceeded when validation_policy aborts the analysis
+    """
+    # records are always needed to merge parts and write the output
+    config_overrides = {**(config_overrides or {}), "include_tasks": True}
+    config_dict = merge_config(config_overrides)
+    parts = partition_tasks(tasks_payload, workers) if workers > 1 else [list(range(len(tasks_payload)))]
+    if len(parts) > 1:
+        results = _run_parts(tasks_payload, parts, config_overrides, workers)
+    else:
+        results = [_analyze_part((parts[0], tasks_payload, config_overrides))]
+
+    warnings = sorted((w for r in results for w in r["warnings"]), key=lambda w: w["index"])
+    if config_dict.get("validation_policy") in ("budget", "reject"):
+        max_issues = 0 if config_dict["validation_policy"] == "reject" else max(int(config_dict.get("validation_error_budget", 0)), 0)
+        issues = [issue for w in warnings for issue in w["issues"]]
+        if len(issues) > max_issues:
+            raise ValidationBudgetExceeded(issues, max_issues)
+
+    longest = max(results, key=lambda r: r["critical_path"]["length_hours"])
+    length = longest["critical_path"]["length_hours"]
+    records = [rec for r in results for rec in r["priority_list"] + r["blocked_tasks"]]
+    for rec in records:
+        if rec["raw"] is None:
+            rec["raw"] = tasks_payload[rec["_position"]]
+    if len(results) > 1:
+        _rescale_criticality(results, length, config_dict)
+    records.sort(key=lambda rec: (-rec["score"], rec.pop("_position")))
+
+    quadrant_counts = {q: sum(r["quadrant_counts"][q] for r in results) for q in QUADRANTS}
+    priority_list = [rec for rec in records if not rec["blocked"]]
+    merged = {
+        "priority_list": priority_list,
+        "blocked_tasks": [rec for rec in records if rec["blocked"]],
+        "needs_attention": [rec for rec in records if rec["raw"].get("_validation_issues")],
+        "warnings": warnings,
+        "quadrant_counts": quadrant_counts,
+        "critical_path": longest["critical_path"],
+        "dependency_issues": {
+            "unknown_dependencies": [i for r in results for i in r["dependency_issues"]["unknown_dependencies"]],
+            "self_dependencies": [i for r in results for i in r["dependency_issues"]["self_dependencies"]],
+        },
+        "parts": len(results),
+        "config_used": config_dict,
+    }
+    if "facets" in results[0]:
+        merged["facets"] = merge_facets(r["facets"] for r in results)
+    return merged
+
+
+def _run_parts(tasks_payload: List[Dict], parts: List[List[int]], config_overrides: Dict, workers: int) -> List[Dict]:
+    global _FORK_PAYLOAD
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    if fork:
+        _FORK_PAYLOAD = tasks_payload
+        jobs = [(positions, None, config_overrides) for positions in parts]
+        context = multiprocessing.get_context("fork")
+        # keep the inherited heap out of the children's collections (no copy-on-write)
+        gc.freeze()
+    else:
+        jobs = [(positions, [tasks_payload[pos] for pos in positions], config_overrides) for positions in parts]
+        context = None
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as pool:
+            return list(pool.map(_analyze_part, jobs))
+    finally:
+        if fork:
+            gc.unfreeze()
+            _FORK_PAYLOAD = []
+
+
+def _rescale_criticality(results: List[Dict], length: float, config_dict: Dict) -> None:
+    """Express every part's criticality against the overall longest chain."""
+    if length <= 0:
+        return
+    engine = PriorityEngine(build_scoring_config(config_dict))
+    rescore = bool(engine.config.weight_critical_path)
+    for result in results:
+        part_length = result["critical_path"]["length_hours"]
+        ratio = part_length / length
+        records = result["priority_list"] + result["blocked_tasks"]
+        if ratio == 1.0 or part_length <= 0 or not records:
+            continue
+        for rec in records:
+            rec["components"]["critical_path"] *= ratio
+        if rescore:
+            columns = _component_columns(records, engine)
+            for rec, score in zip(records, engine.combine(columns)):
+                rec["score"] = score
+                rec["components"]["score"] = score
+        for rec in records:
+            # only the "on critical path" note can change when criticality shrinks
+            if rec["components"]["critical_path"] < 1.0 - 1e-9 <= rec["components"]["critical_path"] / ratio:
+                rec["explanation"] = engine.describe(ScoreBreakdown(**rec["components"]))
+
+
+def _component_columns(records: List[Dict], engine: PriorityEngine) -> Dict[str, list]:
+    components = [rec["components"] for rec in records]
+    columns = {"quadrant": [c["quadrant"] for c in components]}
+    for component in engine.components:
+        if component in BUILTIN_COMPONENTS:
+            columns[component.name] = [c[component.name] for c in components]
+        else:
+            columns[component.name] = [(c["factors"] or {}).get(component.name, 0.0) for c in components]
+    return columns
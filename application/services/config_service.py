@@ -11,10 +11,13 @@ Outputs:
 - resolved config mapping to be consumed by domain scoring engine
 """
 
+import math
 from typing import Dict
 from copy import deepcopy
 from dataclasses import asdict
 
+from core.scoring.components import resolve_components
+from core.scoring.dependency_reach import DEPENDENCY_MODES
 from core.scoring.scoring_config import ScoringConfig
 
 _DEFAULT_SCORING_CFG = ScoringConfig()
@@ -29,16 +32,31 @@ DEFAULT_APP_CONFIG: Dict = {
     "min_importance": 1,
     "max_importance": 10,
     "far_future_days": 3650,
-    "enable_eisenhower": False,
-    "q_multipliers": {
-        "Q1_TOP": 1.3,
-        "Q2_URGENT": 1.1,
-        "Q3_IMPORTANT": 1.0,
-        "Q4_LOW": 0.9
-    }
+    # "collect" (report everything), "budget" (abort after validation_error_budget
+    # issues) or "reject" (abort on the first issue)
+    "validation_policy": "collect",
+    "validation_error_budget": 100,
+    # retain_raw=False drops the raw payload reference; only passthrough_fields
+    # are copied into each record's "raw"
+    "retain_raw": True,
+    "passthrough_fields": [],
+    # grouped aggregates computed while building records, see facet_service;
+    # include_tasks=False returns only aggregates (no per-task records)
+    "facets": [],
+    "facet_max_groups": 1000,
+    "include_tasks": True,
+    # enable_eisenhower, eisenhower_*_cutoff and q_multipliers come from ScoringConfig
 }
 
 
+class InvalidConfig(ValueError):
+    """A config override the services cannot use; views answer 400 invalid_config."""
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
 def merge_config(overrides: Dict) -> Dict:
     """
     Merge default configuration with overrides provided by user.
@@ -66,11 +84,42 @@ def merge_config(overrides: Dict) -> Dict:
     return cfg
 
 
+def _check_scoring_config(config: ScoringConfig) -> None:
+    if config.dependency_mode not in DEPENDENCY_MODES:
+        raise InvalidConfig(f"dependency_mode must be one of {', '.join(DEPENDENCY_MODES)}")
+    if not (_is_number(config.dependency_error) and 0 < config.dependency_error < 1):
+        raise InvalidConfig("dependency_error must be a number between 0 and 1")
+    weights = config.component_weights
+    if not isinstance(weights, dict) or not all(_is_number(w) for w in weights.values()):
+        raise InvalidConfig("component_weights must map component names to finite numbers")
+    try:
+        resolve_components(config)
+    except ValueError as exc:
+        raise InvalidConfig(str(exc)) from exc
+
+
+def _check_record_options(cfg: Dict) -> None:
+    if not isinstance(cfg.get("retain_raw", True), bool):
+        raise InvalidConfig("retain_raw must be true or false")
+    fields = cfg.get("passthrough_fields")
+    if fields is not None and not (isinstance(fields, list) and all(isinstance(f, str) for f in fields)):
+        raise InvalidConfig("passthrough_fields must be a list of field names")
+
+
 def build_scoring_config(cfg: Dict) -> ScoringConfig:
-    """Convert merged config mapping into ScoringConfig dataclass."""
+    """
+    Convert merged config mapping into ScoringConfig dataclass.
+
+    Raises:
+        InvalidConfig when a value cannot be used for scoring
+    """
 
     scoring_values = asdict(_DEFAULT_SCORING_CFG)
     for field in scoring_values:
         if field in cfg:
             scoring_values[field] = cfg[field]
-    return ScoringConfig(**scoring_values)
+    config = ScoringConfig(**scoring_values)
+    _check_scoring_config(config)
+    # record options travel in the same mapping; reject them before any task is read
+    _check_record_options(cfg)
+    return config
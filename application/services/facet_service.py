@@ -0,0 +1,144 @@
+"""
+Facet aggregation for analyze results.
+
+Groups scored tasks by the facets named in config "facets" and keeps per
+group the task count, the sum of estimated_hours and the highest score.
+analyze_tasks_service feeds every task through FacetAccumulator.add in the
+same loop that builds its records, so reports need neither the full
+priority_list nor a second traversal.
+
+Facets:
+- "quadrant": Eisenhower quadrant (every quadrant listed)
+- "due": due-date bucket: overdue, today, this_week (due within 6 days),
+  later (every bucket listed)
+- "blocked": "blocked" (part of a dependency cycle) or "unblocked"
+- "raw.<field>": value of a raw task field, e.g. "raw.project". Tasks
+  without the field group under "_missing"; past facet_max_groups distinct
+  values the rest group under "_other". With retain_raw false the field
+  must be listed in passthrough_fields.
+
+Output (per facet):
+    {"<group>": {"count": int, "hours": float, "max_score": float | None}}
+"""
+
+import json
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from application.services.config_service import InvalidConfig
+from core.scoring.eisenhower import QUADRANTS
+
+DUE_BUCKETS = ("overdue", "today", "this_week", "later")
+BLOCKED_GROUPS = ("blocked", "unblocked")
+RAW_PREFIX = "raw."
+MISSING = "_missing"
+OTHER = "_other"
+
+_FIXED_GROUPS = {"quadrant": QUADRANTS, "due": DUE_BUCKETS, "blocked": BLOCKED_GROUPS}
+
+
+def due_bucket(days_until_due: int) -> str:
+    if days_until_due < 0:
+        return "overdue"
+    if days_until_due == 0:
+        return "today"
+    if days_until_due < 7:
+        return "this_week"
+    return "later"
+
+
+def _group_key(value) -> str:
+    if value is None:
+        return MISSING
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _check_facets(facets: Iterable[str]) -> List[str]:
+    if not isinstance(facets, (list, tuple)):
+        raise InvalidConfig("facets must be a list of facet names")
+    names = []
+    for name in facets:
+        if not isinstance(name, str) or not (name in _FIXED_GROUPS or (name.startswith(RAW_PREFIX) and len(name) > len(RAW_PREFIX))):
+            raise InvalidConfig(f"unknown facet '{name}' (use quadrant, due, blocked or raw.<field>)")
+        if name not in names:
+            names.append(name)
+    return names
+
+
+class FacetAccumulator:
+    """
+    Running count / hours / max score per facet group.
+
+    Raises InvalidConfig for facets that are not a list of known names or a
+    max_groups that is not a positive integer.
+    """
+
+    def __init__(self, facets: Iterable[str], max_groups: int = 1000, today: Optional[date] = None):
+        self.facets = _check_facets(facets)
+        if not isinstance(max_groups, int) or isinstance(max_groups, bool) or max_groups < 1:
+            raise InvalidConfig("facet_max_groups must be a positive integer")
+        self.max_groups = max_groups
+        self.today = today or date.today()
+        self.raw_fields = [(name, name[len(RAW_PREFIX):]) for name in self.facets if name.startswith(RAW_PREFIX)]
+        # group -> [count, hours, max_score]
+        self.groups: Dict[str, Dict[str, list]] = {
+            name: {group: [0, 0.0, None] for group in _FIXED_GROUPS.get(name, ())} for name in self.facets
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.facets)
+
+    @staticmethod
+    def _bump(slot: list, hours: float, score: float) -> None:
+        slot[0] += 1
+        slot[1] += hours
+        if slot[2] is None or score > slot[2]:
+            slot[2] = score
+
+    def add(self, dto, quadrant: str, score: float, blocked: bool) -> None:
+        groups = self.groups
+        hours = dto.estimated_hours or 0.0
+        if "quadrant" in groups:
+            self._bump(groups["quadrant"][quadrant], hours, score)
+        if "due" in groups:
+            self._bump(groups["due"][due_bucket((dto.due_date - self.today).days)], hours, score)
+        if "blocked" in groups:
+            self._bump(groups["blocked"]["blocked" if blocked else "unblocked"], hours, score)
+        for name, field in self.raw_fields:
+            facet = groups[name]
+            key = _group_key(dto.raw.get(field))
+            slot = facet.get(key)
+            if slot is None:
+                if len(facet) >= self.max_groups:
+                    key = OTHER
+                slot = facet.setdefault(key, [0, 0.0, None])
+            self._bump(slot, hours, score)
+
+    def result(self) -> Dict[str, Dict[str, Dict]]:
+        return {
+            name: {
+                group: {"count": count, "hours": hours, "max_score": max_score}
+                for group, (count, hours, max_score) in facet.items()
+            }
+            for name, facet in self.groups.items()
+        }
+
+
+def merge_facets(results: Iterable[Dict[str, Dict[str, Dict]]]) -> Dict[str, Dict[str, Dict]]:
+    """Combine facet outputs of disjoint task sets (bulk analysis parts)."""
+    merged: Dict[str, Dict[str, Dict]] = {}
+    for facets in results:
+        for name, facet in facets.items():
+            target = merged.setdefault(name, {})
+            for group, stats in facet.items():
+                slot = target.get(group)
+                if slot is None:
+                    target[group] = dict(stats)
+                    continue
+                slot["count"] += stats["count"]
+                slot["hours"] += stats["hours"]
+                if stats["max_score"] is not None and (slot["max_score"] is None or stats["max_score"] > slot["max_score"]):
+                    slot["max_score"] = stats["max_score"]
+    return merged
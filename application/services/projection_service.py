@@ -0,0 +1,100 @@
+"""
+Application service that projects rankings over the coming days.
+
+Responsibilities:
+- score the payload once with the same engine and config as analyze
+- re-evaluate only the date-dependent components (urgency and registered
+  factors) for each future day
+- report top-K per day and the rank-change events between consecutive days
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- config_overrides: optional mapping to alter scoring behavior
+- days: number of days to project after today
+- top_k: size of the ranking window tracked per day
+
+Outputs:
+- mapping with dates, top-K ids per day, rank-change events and the first
+  date each task reaches rank one
+"""
+
+import heapq
+from datetime import date, timedelta
+from typing import Dict, List
+
+from application.services.analyze_tasks_service import _scoring_inputs
+from application.services.config_service import merge_config, build_scoring_config
+from core.scoring.priority_engine import PriorityEngine
+
+
+def project_rankings_service(
+    tasks_payload: List[Dict],
+    config_overrides: Dict = None,
+    days: int = 14,
+    top_k: int = 10,
+) -> Dict:
+    """
+    Project unblocked task rankings for today and the next `days` days.
+
+    Outputs:
+        result mapping containing:
+            - dates: ISO dates for day offsets 0..days
+            - top_by_day: top-K task ids per date
+            - events: {date, id, event, rank, previous_rank} where event is
+              "entered_top_k", "left_top_k", "moved" or "became_top"
+            - first_top: id -> first date the task ranks first (only tasks that do)
+            - config_used: resolved config mapping
+    """
+    config_dict = merge_config(config_overrides or {})
+    engine = PriorityEngine(build_scoring_config(config_dict))
+    today = date.today()
+
+    task_map, graph, blocked_ids = _scoring_inputs(tasks_payload)
+    all_tasks = list(task_map.values())
+    critical = engine.critical_path(all_tasks, today=today, graph=graph)
+    all_columns = engine.component_columns(all_tasks, today=today, graph=graph, critical=critical)
+    keep = [pos for pos, key in enumerate(graph.keys) if key not in blocked_ids]
+    ids = [all_tasks[pos].id for pos in keep]
+    projected = engine.project_scores(all_tasks, all_columns, days, today=today, graph=graph, critical=critical)
+
+    dates = [(today + timedelta(days=offset)).isoformat() for offset in range(days + 1)]
+    top_by_day = []
+    events = []
+    first_top: Dict[str, str] = {}
+    previous: Dict[int, int] = {}
+
+    for offset, all_scores in enumerate(projected):
+        scores = [all_scores[pos] for pos in keep]
+        top = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+        ranks = {idx: rank for rank, idx in enumerate(top, start=1)}
+        day = dates[offset]
+        top_by_day.append({"date": day, "ids": [ids[idx] for idx in top]})
+
+        if top and ids[top[0]] not in first_top:
+            first_top[ids[top[0]]] = day
+
+        if offset:
+            for idx, rank in ranks.items():
+                before = previous.get(idx)
+                if before == rank:
+                    continue
+                if rank == 1:
+                    event = "became_top"
+                elif before is None:
+                    event = "entered_top_k"
+                else:
+                    event = "moved"
+                events.append({"date": day, "id": ids[idx], "event": event, "rank": rank, "previous_rank": before})
+            for idx, before in previous.items():
+                if idx not in ranks:
+                    events.append({"date": day, "id": ids[idx], "event": "left_top_k", "rank": None, "previous_rank": before})
+        previous = ranks
+
+    return {
+        "dates": dates,
+        "top_by_day": top_by_day,
+        "events": events,
+        "first_top": first_top,
+        "task_count": len(ids),
+        "config_used": config_dict,
+    }
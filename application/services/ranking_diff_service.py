@@ -0,0 +1,134 @@
+"""
+Application service that diffs a task ranking against the previous one.
+
+Responsibilities:
+- score the payload with the same rules as analyze (cycle members are blocked)
+- reduce the outcome to a compact ranking: key -> rank, blocked keys, cycles
+- compare two compact rankings in O(n) with dictionary lookups
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- exchange: callable storing the new compact ranking and returning the
+  previous one for the same project (None on the first call)
+- config_overrides: optional mapping to alter scoring behavior
+- top_k: size of the top list whose membership changes are reported
+- rank_threshold: minimum rank movement reported under "moved"
+
+Outputs:
+- compact diff; the first call for a project only reports the top-K
+
+Tasks are identified by their analyze task-map key (id, else title).
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from application.services.analyze_tasks_service import _scoring_graph
+from application.services.config_service import merge_config, build_scoring_config
+from core.scoring.priority_engine import PriorityEngine
+
+
+def compact_ranking(tasks_payload: List[Dict], config_overrides: Dict = None) -> Dict:
+    """
+    Outputs:
+        mapping containing:
+            - ranks: key -> 1-based rank among unblocked tasks
+            - blocked: keys of tasks that are members of a cycle (tasks that
+              only depend on a cycle are ranked)
+            - cycles: each cycle as a sorted list of keys, sorted
+    """
+    engine = PriorityEngine(build_scoring_config(merge_config(config_overrides or {})))
+    task_map, graph, found = _scoring_graph(tasks_payload)
+    blocked_ids = {key for cycle in found for key in cycle}
+    keys = graph.keys
+    scores = engine.combine(engine.component_columns(list(task_map.values()), graph=graph))
+
+    order = sorted(
+        (pos for pos, key in enumerate(keys) if key not in blocked_ids),
+        key=scores.__getitem__, reverse=True,
+    )
+    cycles = sorted({tuple(sorted(set(cycle))) for cycle in found})
+    return {
+        "ranks": {keys[pos]: rank for rank, pos in enumerate(order, start=1)},
+        "blocked": sorted(blocked_ids),
+        "cycles": [list(cycle) for cycle in cycles],
+    }
+
+
+def diff_rankings(previous: Optional[Dict], current: Dict, top_k: int = 10, rank_threshold: int = 5) -> Dict:
+    """
+    Compare two compact rankings.
+
+    Outputs:
+        mapping containing:
+            - top: current top-K keys
+            - entered_top / left_top: keys joining / leaving the top-K, with ranks
+            - moved: keys present in both rankings whose rank changed by at
+              least rank_threshold (delta > 0 means moved up)
+            - newly_blocked / unblocked: keys that started / stopped being blocked
+            - added / removed: keys new to / missing from the payload
+            - new_cycles / resolved_cycles
+    """
+    ranks = current["ranks"]
+    top = [key for key, rank in ranks.items() if rank <= top_k]
+    top.sort(key=ranks.__getitem__)
+    if previous is None:
+        return {"baseline": True, "top": top}
+
+    before = previous["ranks"]
+    blocked, before_blocked = set(current["blocked"]), set(previous["blocked"])
+    present = ranks.keys() | blocked
+    was_present = before.keys() | before_blocked
+
+    moved = []
+    for key, rank in ranks.items():
+        old = before.get(key)
+        if old is not None and abs(old - rank) >= rank_threshold:
+            moved.append({"id": key, "previous_rank": old, "rank": rank, "delta": old - rank})
+    moved.sort(key=lambda m: m["rank"])
+
+    before_top = [key for key, rank in before.items() if rank <= top_k]
+    cycles = {tuple(c) for c in current["cycles"]}
+    before_cycles = {tuple(c) for c in previous["cycles"]}
+    return {
+        "baseline": False,
+        "top": top,
+        "entered_top": [
+            {"id": key, "rank": ranks[key], "previous_rank": before.get(key)}
+            for key in top if before.get(key, top_k + 1) > top_k
+        ],
+        "left_top": sorted(
+            ({"id": key, "rank": ranks.get(key), "previous_rank": before[key]}
+             for key in before_top if ranks.get(key, top_k + 1) > top_k),
+            key=lambda entry: entry["previous_rank"],
+        ),
+        "moved": moved,
+        "newly_blocked": sorted(blocked - before_blocked),
+        "unblocked": sorted(before_blocked & ranks.keys()),
+        "added": sorted(key for key in present if key not in was_present),
+        "removed": sorted(key for key in was_present if key not in present),
+        "new_cycles": [list(c) for c in sorted(cycles - before_cycles)],
+        "resolved_cycles": [list(c) for c in sorted(before_cycles - cycles)],
+    }
+
+
+def ranking_diff_service(
+    tasks_payload: List[Dict],
+    exchange: Callable[[Dict], Optional[Dict]],
+    config_overrides: Dict = None,
+    top_k: int = 10,
+    rank_threshold: int = 5,
+) -> Dict:
+    """
+    Rank the payload, store it through `exchange` and diff it against the
+    ranking it replaces; nothing is stored when scoring fails.
+
+    Outputs:
+        mapping with the diff_rankings keys plus task_count (ranked tasks)
+        and blocked_count
+    """
+    current = compact_ranking(tasks_payload, config_overrides)
+    previous = exchange(current)
+    result = diff_rankings(previous, current, top_k=top_k, rank_threshold=rank_threshold)
+    result["task_count"] = len(current["ranks"])
+    result["blocked_count"] = len(current["blocked"])
+    return result
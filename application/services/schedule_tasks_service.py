@@ -0,0 +1,109 @@
+"""
+Application service that plans tasks over multiple days.
+
+Responsibilities:
+- score the payload with the same engine and config as analyze
+- resolve dependency ids to task positions (unknown ids are ignored, as in scoring)
+- run the capacity scheduler with the caller's daily hour budget
+- flag tasks whose planned finish falls after their due date
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- config_overrides: optional mapping to alter scoring behavior
+- daily_hours: hours per day, either a number or 7 weekday values (Mon..Sun)
+- start_date: first planning day (defaults to today)
+- horizon_days: maximum number of calendar days to plan
+
+Outputs:
+- mapping with per-day plans, per-task placements, late tasks and the
+  tasks that could not be scheduled
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+from application.services.analyze_tasks_service import _scoring_inputs
+from application.services.config_service import merge_config, build_scoring_config
+from core.scheduling.capacity_scheduler import day_to_date, schedule_by_capacity
+from core.scoring.priority_engine import PriorityEngine
+
+
+def schedule_tasks_service(
+    tasks_payload: List[Dict],
+    config_overrides: Dict = None,
+    daily_hours=8.0,
+    start_date: Optional[date] = None,
+    horizon_days: int = 365,
+) -> Dict:
+    """
+    Build a multi-day plan for the given tasks.
+
+    Outputs:
+        result mapping containing:
+            - days: list of {date, planned_hours, tasks: [{id, title, hours}]}
+            - tasks: scheduled tasks in execution order with start/finish dates
+              and a late flag relative to due_date
+            - unscheduled: tasks blocked by cycles or beyond the horizon
+            - late_count: number of scheduled tasks finishing after their due date
+            - config_used: resolved config mapping
+    """
+    config_dict = merge_config(config_overrides or {})
+    engine = PriorityEngine(build_scoring_config(config_dict))
+    start_date = start_date or date.today()
+
+    task_map, graph, _ = _scoring_inputs(tasks_payload)
+    tasks = list(task_map.values())
+
+    scores = engine.combine(engine.component_columns(tasks, graph=graph))
+
+    plan = schedule_by_capacity(
+        [t.estimated_hours for t in tasks],
+        scores,
+        graph,
+        start_date,
+        daily_hours=daily_hours,
+        horizon_days=horizon_days,
+    )
+
+    days = []
+    for offset in sorted(plan.day_allocations):
+        allocations = plan.day_allocations[offset]
+        days.append({
+            "date": day_to_date(start_date, offset).isoformat(),
+            "planned_hours": sum(h for _, h in allocations),
+            "tasks": [
+                {"id": tasks[idx].id, "title": tasks[idx].title, "hours": h}
+                for idx, h in allocations
+            ],
+        })
+
+    entries = []
+    late_count = 0
+    for idx in plan.order:
+        dto = tasks[idx]
+        finish = day_to_date(start_date, plan.finish_day[idx])
+        days_late = (finish - dto.due_date).days
+        late = days_late > 0
+        late_count += late
+        entries.append({
+            "id": dto.id,
+            "title": dto.title,
+            "score": scores[idx],
+            "estimated_hours": dto.estimated_hours,
+            "start_date": day_to_date(start_date, plan.start_day[idx]).isoformat(),
+            "finish_date": finish.isoformat(),
+            "due_date": dto.due_date.isoformat(),
+            "late": late,
+            "days_late": max(days_late, 0),
+        })
+
+    return {
+        "days": days,
+        "tasks": entries,
+        "unscheduled": [
+            {"id": tasks[idx].id, "title": tasks[idx].title, "reason": reason}
+            for idx, reason in sorted(plan.unscheduled.items())
+        ],
+        "late_count": late_count,
+        "config_used": config_dict,
+    }
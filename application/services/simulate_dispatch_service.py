@@ -0,0 +1,119 @@
+"""
+Application service that simulates a team working through the backlog.
+
+Responsibilities:
+- score the payload with the same engine and config as analyze
+- run the multi-worker dispatch simulation over the dependency graph
+- turn work-hour offsets into calendar dates with the daily hour budget
+- flag tasks whose projected finish falls after their due date
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- config_overrides: optional mapping to alter scoring behavior
+- workers: number of people working in parallel
+- daily_hours: hours per worker per day, either a number or 7 weekday values (Mon..Sun)
+- start_date: first working day (defaults to today)
+
+Outputs:
+- mapping with per-worker timelines, per-task projected dates, the overall
+  completion date and the tasks blocked by cycles
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+from application.services.analyze_tasks_service import _scoring_inputs
+from application.services.config_service import merge_config, build_scoring_config
+from core.scheduling.capacity_scheduler import day_to_date, weekly_budget
+from core.scheduling.dispatch_simulator import simulate_dispatch, work_hours_to_day
+from core.scoring.priority_engine import PriorityEngine
+
+
+def simulate_dispatch_service(
+    tasks_payload: List[Dict],
+    config_overrides: Dict = None,
+    workers: int = 2,
+    daily_hours=8.0,
+    start_date: Optional[date] = None,
+) -> Dict:
+    """
+    Project how the tasks play out with `workers` people in parallel.
+
+    Outputs:
+        result mapping containing:
+            - workers: per worker its busy hours and timeline of
+              {id, title, start_date, finish_date, start_hour, finish_hour}
+            - tasks: scheduled tasks in dispatch order with worker, projected
+              dates and a late flag relative to due_date
+            - makespan_hours / completion_date: when the last task finishes
+            - unscheduled: tasks blocked by cycles
+            - late_count: number of tasks projected to finish after their due date
+            - config_used: resolved config mapping
+    """
+    config_dict = merge_config(config_overrides or {})
+    engine = PriorityEngine(build_scoring_config(config_dict))
+    start_date = start_date or date.today()
+    budget = weekly_budget(daily_hours)
+    weekday = start_date.weekday()
+
+    task_map, graph, _ = _scoring_inputs(tasks_payload)
+    tasks = list(task_map.values())
+    scores = engine.combine(engine.component_columns(tasks, graph=graph))
+
+    sim = simulate_dispatch([t.estimated_hours for t in tasks], scores, graph, workers)
+
+    def _dates(idx: int):
+        first = work_hours_to_day(sim.start[idx], budget, weekday)
+        last = work_hours_to_day(sim.finish[idx], budget, weekday, finishing=True)
+        return day_to_date(start_date, first), day_to_date(start_date, max(first, last))
+
+    entries = []
+    timelines = []
+    late_count = 0
+    for w, timeline in enumerate(sim.timelines):
+        items = []
+        for idx in timeline:
+            dto = tasks[idx]
+            started, finished = _dates(idx)
+            days_late = (finished - dto.due_date).days
+            late_count += days_late > 0
+            item = {
+                "id": dto.id,
+                "title": dto.title,
+                "start_date": started.isoformat(),
+                "finish_date": finished.isoformat(),
+                "start_hour": sim.start[idx],
+                "finish_hour": sim.finish[idx],
+            }
+            items.append(item)
+            entries.append((sim.start[idx], w, {
+                **item,
+                "worker": w,
+                "score": scores[idx],
+                "due_date": dto.due_date.isoformat(),
+                "late": days_late > 0,
+                "days_late": max(days_late, 0),
+            }))
+        timelines.append({
+            "worker": w,
+            "busy_hours": sum(sim.finish[idx] - sim.start[idx] for idx in timeline),
+            "tasks": items,
+        })
+    entries.sort(key=lambda e: (e[0], e[1]))
+
+    completion = None
+    if len(sim.unscheduled) < len(tasks):
+        completion = day_to_date(start_date, work_hours_to_day(sim.makespan, budget, weekday, finishing=True))
+
+    return {
+        "workers": timelines,
+        "tasks": [entry for _, _, entry in entries],
+        "makespan_hours": sim.makespan,
+        "completion_date": completion.isoformat() if completion else None,
+        "unscheduled": [
+            {"id": tasks[idx].id, "title": tasks[idx].title, "reason": reason}
+            for idx, reason in sorted(sim.unscheduled.items())
+        ],
+        "late_count": late_count,
+        "config_used": config_dict,
+    }
@@ -0,0 +1,73 @@
+"""
+Application service that prepares an analyzed project for a binary snapshot.
+
+Responsibilities:
+- run the same conversion, dependency graph and scoring as analyze
+- lay the result out as typed columns aligned with the task-map keys
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- config_overrides: optional mapping to alter scoring behavior
+
+Outputs:
+- mapping with keys, graph, columns ({name: (typecode, values)}), strings
+  and meta, ready for infrastructure.storage.snapshot.write_snapshot
+"""
+
+from typing import Dict, List
+
+from application.services.analyze_tasks_service import _scoring_inputs
+from application.services.config_service import merge_config, build_scoring_config
+from core.scoring.priority_engine import PriorityEngine
+
+# typecodes per stored column (see infrastructure.storage.snapshot)
+SNAPSHOT_COLUMNS = {
+    "due_ordinal": "i",
+    "estimated_hours": "d",
+    "importance": "q",
+    "has_id": "B",
+    "blocked": "B",
+    "urgency": "d",
+    "effort": "d",
+    "dependency": "q",
+    "critical_path": "d",
+    "score": "d",
+}
+
+
+def snapshot_project_service(tasks_payload: List[Dict], config_overrides: Dict = None) -> Dict:
+    """
+    Analyze the payload and return snapshot-ready sections.
+
+    Outputs:
+        mapping containing:
+            - keys: task-map keys (id, else title) in position order
+            - graph: TaskGraph over those keys
+            - columns: name -> (typecode, values), see SNAPSHOT_COLUMNS
+            - strings: {"titles": [...]}
+            - meta: config_used and task/blocked counts
+    """
+    config_dict = merge_config(config_overrides or {})
+    engine = PriorityEngine(build_scoring_config(config_dict))
+    task_map, graph, blocked_ids = _scoring_inputs(tasks_payload)
+    tasks = list(task_map.values())
+    components = engine.component_columns(tasks, graph=graph)
+    values = {
+        "due_ordinal": [t.due_date.toordinal() for t in tasks],
+        "estimated_hours": [t.estimated_hours for t in tasks],
+        "importance": [t.importance for t in tasks],
+        "has_id": [t.id is not None for t in tasks],
+        "blocked": [key in blocked_ids for key in graph.keys],
+        "urgency": components["urgency"],
+        "effort": components["effort"],
+        "dependency": components["dependency"],
+        "critical_path": components["critical_path"],
+        "score": engine.combine(components),
+    }
+    return {
+        "keys": graph.keys,
+        "graph": graph,
+        "columns": {name: (SNAPSHOT_COLUMNS[name], column) for name, column in values.items()},
+        "strings": {"titles": [t.title for t in tasks]},
+        "meta": {"config_used": config_dict, "task_count": len(tasks), "blocked_count": len(blocked_ids)},
+    }
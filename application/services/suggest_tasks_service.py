@@ -11,6 +11,7 @@ Inputs:
 - tasks_payload: list of raw task dicts
 - config_overrides: optional mapping
 - top_n: number of suggestions to return
+- available_hours: hour budget for the "fill my day" mode
 
 Outputs:
 - list of suggestion mappings with fields:
@@ -21,6 +22,7 @@ from typing import List, Dict
 from datetime import date
 
 from application.services.analyze_tasks_service import analyze_tasks_service
+from core.scheduling.knapsack import GREEDY_GUARANTEE, select_within_budget
 
 
 def _make_reason(task_rec: Dict) -> str:
@@ -36,7 +38,7 @@ def _make_reason(task_rec: Dict) -> str:
     if task_rec.get("blocked"):
         return "Task blocked by circular dependency"
     reasons = []
-    if "passed" in task_rec.get("explanation", "") or "overdue" in task_rec.get("explanation", ""):
+    if task_rec.get("components", {}).get("overdue_days", 0) > 0:
         reasons.append("past due")
     if task_rec.get("importance", 0) >= 8:
         reasons.append("high impact")
@@ -47,6 +49,19 @@ def _make_reason(task_rec: Dict) -> str:
     return ", ".join(reasons)
 
 
+def _suggestion(rec: Dict) -> Dict:
+    return {
+        "id": rec["id"],
+        "title": rec["title"],
+        "score": rec["score"],
+        "reason": _make_reason(rec),
+        "due_date": rec["due_date"],
+        "importance": rec["importance"],
+        "estimated_hours": rec["estimated_hours"],
+        "status": "blocked" if rec["blocked"] else "ok"
+    }
+
+
 def suggest_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = None, top_n: int = 3) -> List[Dict]:
     """
     Suggest top tasks to work on today.
@@ -67,14 +82,45 @@ def suggest_tasks_service(tasks_payload: List[Dict], config_overrides: Dict = No
     for rec in candidates:
         if len(suggestions) >= top_n:
             break
-        suggestions.append({
-            "id": rec["id"],
-            "title": rec["title"],
-            "score": rec["score"],
-            "reason": _make_reason(rec),
-            "due_date": rec["due_date"],
-            "importance": rec["importance"],
-            "estimated_hours": rec["estimated_hours"],
-            "status": "blocked" if rec["blocked"] else "ok"
-        })
+        suggestions.append(_suggestion(rec))
     return suggestions
+
+
+def fill_day_service(tasks_payload: List[Dict], available_hours: float, config_overrides: Dict = None) -> Dict:
+    """
+    Suggest the unblocked tasks that maximize total score within an hour budget.
+
+    Inputs:
+        tasks_payload: list of raw task dicts
+        available_hours: hours available today
+        config_overrides: optional mapping to customize scoring
+
+    Outputs:
+        mapping with:
+            - results: chosen suggestions in score order
+            - budget: available/planned hours, total score, selection method
+              ("exact", "grid" or "greedy", see core.scheduling.knapsack),
+              the score upper bound and the guaranteed fraction of the
+              optimum (1.0 only for "exact")
+    """
+    analysis = analyze_tasks_service(tasks_payload, config_overrides)
+    candidates = analysis["priority_list"]
+
+    selection = select_within_budget(
+        [rec["score"] for rec in candidates],
+        [rec["estimated_hours"] for rec in candidates],
+        float(available_hours),
+    )
+    # priority_list is already score-ordered; keep that order for display
+    chosen = sorted(selection.chosen)
+    return {
+        "results": [_suggestion(candidates[idx]) for idx in chosen],
+        "budget": {
+            "available_hours": float(available_hours),
+            "planned_hours": selection.total_weight,
+            "total_score": selection.total_value,
+            "method": selection.method,
+            "score_upper_bound": selection.upper_bound,
+            "guarantee": 1.0 if selection.method == "exact" else GREEDY_GUARANTEE,
+        },
+    }
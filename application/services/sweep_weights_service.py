@@ -0,0 +1,119 @@
+"""
+Application service that evaluates many weight vectors against one task set.
+
+Responsibilities:
+- convert and dependency-check the payload once (same rules as analyze)
+- compute per-task component scores once via PriorityEngine.component_columns
+- apply every weight vector to the shared component columns
+- report top-K and rank movement per weight vector relative to the base config
+
+Inputs:
+- tasks_payload: list of raw task dicts
+- weight_sets: list of mappings with any of the weight_* keys (or the names of
+  custom scoring components); missing keys fall back to the resolved base config
+- config_overrides: optional mapping applied before the sweep (modes, base weights)
+- top_k: number of ranked entries returned per weight vector
+
+Outputs:
+- mapping with the baseline top-K, one result per weight vector and the
+  resolved base config
+"""
+
+import heapq
+from typing import Dict, List
+
+from application.services.analyze_tasks_service import _scoring_inputs
+from application.services.config_service import merge_config, build_scoring_config
+from core.scoring.priority_engine import PriorityEngine
+
+
+def _resolve_weights(keys: tuple, base: tuple, weight_set: Dict) -> tuple:
+    """Overlay a partial weight mapping on the base weight vector."""
+    return tuple(
+        float(weight_set[key]) if key in weight_set else base[pos]
+        for pos, key in enumerate(keys)
+    )
+
+
+def _top_indices(scores: List[float], top_k: int) -> List[int]:
+    """Indices of the top_k scores, ties kept in input order like analyze's stable sort."""
+    return heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+
+
+def sweep_weights_service(
+    tasks_payload: List[Dict],
+    weight_sets: List[Dict],
+    config_overrides: Dict = None,
+    top_k: int = 10,
+) -> Dict:
+    """
+    Rank one task set under many weight vectors.
+
+    Inputs:
+        tasks_payload: list of raw task dicts from client
+        weight_sets: list of partial weight mappings
+        config_overrides: optional base config overrides
+        top_k: entries returned per weight vector
+
+    Outputs:
+        result mapping containing:
+            - baseline: top-K under the base config
+            - sweeps: per weight vector its weights, top-K with rank changes,
+              and ids that entered/left the baseline top-K
+            - config_used: resolved base config mapping
+    """
+    config_dict = merge_config(config_overrides or {})
+    engine = PriorityEngine(build_scoring_config(config_dict))
+
+    task_map, graph, blocked_ids = _scoring_inputs(tasks_payload)
+
+    # score every task against the full graph (as analyze does), then keep
+    # only the unblocked rows that analyze would rank
+    all_tasks = list(task_map.values())
+    all_columns = engine.component_columns(all_tasks, graph=graph)
+    keep = [pos for pos, key in enumerate(graph.keys) if key not in blocked_ids]
+    tasks = [all_tasks[pos] for pos in keep]
+    columns = {name: [column[pos] for pos in keep] for name, column in all_columns.items()}
+    weight_keys = engine.weight_keys()
+    base_weights = engine.weights()
+    base_scores = engine.combine(columns, base_weights)
+
+    # full baseline ranking once; every sweep only needs its own top-K
+    base_order = sorted(range(len(tasks)), key=base_scores.__getitem__, reverse=True)
+    base_rank = [0] * len(tasks)
+    for rank, idx in enumerate(base_order, start=1):
+        base_rank[idx] = rank
+    base_top = base_order[:top_k]
+    base_top_ids = {tasks[i].id for i in base_top}
+
+    def _entry(idx: int, score: float, rank: int) -> Dict:
+        return {
+            "id": tasks[idx].id,
+            "title": tasks[idx].title,
+            "score": score,
+            "rank": rank,
+            "baseline_rank": base_rank[idx],
+            "rank_change": base_rank[idx] - rank,
+        }
+
+    sweeps = []
+    for weight_set in weight_sets:
+        weights = _resolve_weights(weight_keys, base_weights, weight_set or {})
+        scores = engine.combine(columns, weights)
+        top = _top_indices(scores, top_k)
+        top_ids = [tasks[i].id for i in top]
+        top_id_set = set(top_ids)
+        sweeps.append({
+            "weights": dict(zip(weight_keys, weights)),
+            "top": [_entry(idx, scores[idx], rank) for rank, idx in enumerate(top, start=1)],
+            "entered_top": [tid for tid in top_ids if tid not in base_top_ids],
+            "left_top": [tasks[i].id for i in base_top if tasks[i].id not in top_id_set],
+        })
+
+    return {
+        "baseline": [_entry(idx, base_scores[idx], rank) for rank, idx in enumerate(base_top, start=1)],
+        "sweeps": sweeps,
+        "task_count": len(tasks),
+        "blocked_count": len(task_map) - len(tasks),
+        "config_used": config_dict,
+    }
@@ -0,0 +1,114 @@
+"""
+Dependency component cost and accuracy per dependency_mode on random DAGs.
+
+For each size this script builds a random acyclic graph (each task depends
+on up to --degree earlier tasks, mostly nearby ones so reaches grow deep)
+and reports:
+- seconds to build the TaskGraph
+- seconds for direct counts, exact transitive reach and approximate reach
+- bytes per sketch (2^p registers for the requested --error)
+- relative error of the approximate counts against exact (mean, p99, max)
+
+Usage:
+    python benchmarks/dependency_reach.py [--sizes 10000,100000] [--error 0.05] [--exact-limit 200000]
+
+Exact transitive reach holds a bitset per frontier task and is skipped above
+--exact-limit tasks (accuracy is then not reported).
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.models.task_graph import TaskGraph  # noqa: E402
+from core.scoring.dependency_reach import (  # noqa: E402
+    approximate_dependent_counts,
+    precision_for_error,
+    transitive_dependent_counts,
+)
+
+
+def random_dag(count: int, degree: int, seed: int) -> list:
+    rng = random.Random(seed)
+    prerequisites = []
+    for i in range(count):
+        deps = set()
+        for _ in range(rng.randint(0, degree) if i else 0):
+            # mostly recent tasks, sometimes anywhere earlier
+            deps.add(max(i - 1 - int(rng.expovariate(0.02)), 0) if rng.random() < 0.8 else rng.randrange(i))
+        prerequisites.append(sorted(deps))
+    return prerequisites
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def error_stats(exact, approx) -> dict:
+    errors = sorted(abs(a - e) / e for e, a in zip(exact, approx) if e)
+    if not errors:
+        return {"mean": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(errors) / len(errors),
+        "p99": errors[min(int(len(errors) * 0.99), len(errors) - 1)],
+        "max": errors[-1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000", help="comma-separated task counts")
+    parser.add_argument("--degree", type=int, default=5, help="maximum dependencies per task (mean is half)")
+    parser.add_argument("--error", type=float, default=0.05, help="dependency_error for approximate mode")
+    parser.add_argument("--exact-limit", type=int, default=200000, help="skip exact reach above this size")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print one JSON report per size")
+    args = parser.parse_args()
+
+    p = precision_for_error(args.error)
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        prerequisites = random_dag(size, args.degree, args.seed)
+        graph, build_s = _timed(TaskGraph.from_adjacency, prerequisites)
+        del prerequisites
+        _, direct_s = _timed(graph.dependent_counts)
+        approx, approx_s = _timed(approximate_dependent_counts, graph, args.error)
+        report = {
+            "tasks": size,
+            "edges": graph.edge_count,
+            "build_s": build_s,
+            "direct_s": direct_s,
+            "approximate_s": approx_s,
+            "sketch_bytes": 1 << p,
+            "transitive_s": None,
+            "relative_error": None,
+        }
+        if size <= args.exact_limit:
+            exact, report["transitive_s"] = _timed(transitive_dependent_counts, graph)
+            report["relative_error"] = error_stats(exact, approx)
+
+        if args.json:
+            print(json.dumps(report))
+            continue
+        print(f"\n{size} tasks, {graph.edge_count} edges, sketch {1 << p} B (error {args.error})")
+        print(f"  build graph   {build_s:8.2f}s")
+        print(f"  direct        {direct_s:8.2f}s")
+        print(f"  approximate   {approx_s:8.2f}s")
+        if report["transitive_s"] is None:
+            print(f"  transitive    skipped (> --exact-limit {args.exact_limit})")
+        else:
+            stats = report["relative_error"]
+            print(f"  transitive    {report['transitive_s']:8.2f}s")
+            print(f"  relative error mean {stats['mean']:.3f}  p99 {stats['p99']:.3f}  max {stats['max']:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
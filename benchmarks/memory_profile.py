@@ -0,0 +1,81 @@
+"""
+Per-stage memory footprint of analyze requests across payload sizes.
+
+For each size this script builds a synthetic payload (two dependencies per
+task, mixed due dates), runs it through the analyze stages with tracemalloc
+(see benchmarks/memory_stages.py) and reports per stage:
+- peak traced bytes (cumulative since the request started) and bytes/task
+- the budget from ANALYZE_MEMORY_BUDGETS
+- traced bytes still retained and process RSS when the stage ends
+
+Usage:
+    python benchmarks/memory_profile.py [--sizes 100,1000,10000] [--json] [--check]
+
+--check exits with status 1 when any stage exceeds its budget, so it can
+run in CI next to the latency benchmarks. RSS is Linux only and includes
+whatever earlier (smaller) sizes left behind in this process.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_analyzer.settings")
+
+
+def synthetic_body(count: int) -> bytes:
+    tasks = [
+        {"id": f"t{i}", "title": f"Task {i}", "due_date": f"2030-01-{1 + i % 28:02d}",
+         "estimated_hours": 1 + i % 8, "importance": 1 + i % 10,
+         "dependencies": [f"t{i - 1}", f"t{i // 2}"] if i else []}
+        for i in range(count)
+    ]
+    return json.dumps({"tasks": tasks}).encode("utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated task counts")
+    parser.add_argument("--json", action="store_true", help="print one JSON report per size")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a stage exceeds its budget")
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from benchmarks.memory_stages import ANALYZE_MEMORY_BUDGETS, check_memory_budgets, measure_analyze_memory
+
+    failures = []
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        body = synthetic_body(size)
+        gc.collect()
+        report = measure_analyze_memory(body)
+        over = check_memory_budgets(report)
+        failures += [f"{size} tasks: {message}" for message in over]
+        if args.json:
+            print(json.dumps({**report, "over_budget": over}))
+            continue
+
+        print(f"\n{size} tasks, request {len(body) / 1024:.0f} KiB, response {report['response_bytes'] / 1024:.0f} KiB")
+        print(f"{'stage':<12}{'peak KiB':>10}{'B/task':>9}{'budget B/task':>15}{'retained KiB':>14}{'RSS MiB':>9}{'ms':>9}")
+        for stage in report["stages"]:
+            fixed, per_task = ANALYZE_MEMORY_BUDGETS[stage["stage"]]
+            rss = f"{stage['rss_bytes'] / 2 ** 20:.1f}" if stage["rss_bytes"] is not None else "n/a"
+            print(
+                f"{stage['stage']:<12}{stage['peak_bytes'] / 1024:>10.0f}{stage['peak_bytes'] / size:>9.0f}"
+                f"{(fixed / size + per_task):>15.0f}{stage['retained_bytes'] / 1024:>14.0f}{rss:>9}"
+                f"{stage['seconds'] * 1000:>9.1f}"
+            )
+
+    for message in failures:
+        print(f"OVER BUDGET {message}", file=sys.stderr)
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Per-stage memory measurement of an analyze request.
+
+Runs one request body through the same steps as the analyze endpoint and
+records, at the end of each stage:
+- peak_bytes: highest traced (tracemalloc) allocation total during the
+  stage, relative to the start of the request
+- retained_bytes: traced allocations still alive when the stage ends
+- rss_bytes: process resident set size when the stage ends (Linux only)
+
+Stages: parse (JSON parsing and serializer validation), then the
+ANALYZE_STAGES of analyze_tasks_service (dto, validation, graph, scoring,
+records), then render (JSON response body).
+
+Peaks are cumulative: a stage's peak includes everything earlier stages
+still hold. ANALYZE_MEMORY_BUDGETS holds the allowed peak per stage as a
+fixed allowance plus a per-task amount (about 1.5x the measured cost of a
+synthetic payload); check_memory_budgets lists the stages that exceed it.
+Used by benchmarks/memory_profile.py and the test suite; it is development
+tooling and is not imported by the API (tracemalloc.reset_peak needs
+Python 3.9+).
+"""
+
+import io
+import os
+import time
+import tracemalloc
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from application.services.analyze_tasks_service import ANALYZE_STAGES, analyze_tasks_service
+from infrastructure.api.serializers.task_serializer import AnalyzePayloadSerializer
+
+REQUEST_STAGES = ("parse",) + ANALYZE_STAGES + ("render",)
+
+# stage -> (fixed bytes, bytes per task) allowed at the stage's traced peak
+ANALYZE_MEMORY_BUDGETS: Dict[str, Tuple[int, int]] = {
+    "parse": (256 * 1024, 1800),
+    "dto": (256 * 1024, 2100),
+    "validation": (256 * 1024, 2200),
+    "graph": (256 * 1024, 2400),
+    "scoring": (256 * 1024, 3000),
+    "records": (256 * 1024, 4200),
+    "render": (256 * 1024, 9500),
+}
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class StageMemoryTracker:
+    """Collects traced memory per stage; call mark(name) as each stage ends."""
+
+    def __init__(self):
+        self.stages: List[Dict] = []
+        self._owns_tracing = False
+        self._base = 0
+        self._clock = 0.0
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+        self._clock = time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        now = time.perf_counter()
+        self.stages.append({
+            "stage": name,
+            "peak_bytes": peak - self._base,
+            "retained_bytes": current - self._base,
+            "rss_bytes": _rss_bytes(),
+            "seconds": now - self._clock,
+        })
+        tracemalloc.reset_peak()
+        self._clock = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+
+def measure_analyze_memory(body: bytes) -> Dict:
+    """
+    Measure one analyze request body (JSON bytes, as sent by a client).
+
+    Outputs:
+        mapping with tasks (count), stages (list in REQUEST_STAGES order) and
+        peak_bytes (highest stage peak)
+    """
+    tracker = StageMemoryTracker()
+    tracker.start()
+    try:
+        data = JSONParser().parse(io.BytesIO(body))
+        serializer = AnalyzePayloadSerializer(data=data)
+        if not serializer.is_valid():
+            raise ValueError(f"invalid analyze payload: {serializer.errors}")
+        tasks = serializer.validated_data.get("tasks", [])
+        tracker.mark("parse")
+        result = analyze_tasks_service(tasks, serializer.validated_data.get("config", {}), stage_observer=tracker.mark)
+        rendered = JSONRenderer().render({"results": result})
+        tracker.mark("render")
+    finally:
+        tracker.stop()
+    return {
+        "tasks": len(tasks),
+        "response_bytes": len(rendered),
+        "stages": tracker.stages,
+        "peak_bytes": max(stage["peak_bytes"] for stage in tracker.stages),
+    }
+
+
+def check_memory_budgets(report: Mapping, budgets: Mapping[str, Tuple[int, int]] = None) -> List[str]:
+    """Stages whose peak exceeds fixed + per_task * tasks, as readable messages."""
+    budgets = ANALYZE_MEMORY_BUDGETS if budgets is None else budgets
+    tasks = report["tasks"]
+    over = []
+    for stage in report["stages"]:
+        budget = budgets.get(stage["stage"])
+        if budget is None:
+            continue
+        allowed = budget[0] + budget[1] * tasks
+        if stage["peak_bytes"] > allowed:
+            over.append(
+                f"{stage['stage']}: peak {stage['peak_bytes']} bytes > budget {allowed} bytes "
+                f"({stage['peak_bytes'] / max(tasks, 1):.0f} bytes/task at {tasks} tasks)"
+            )
+    return over
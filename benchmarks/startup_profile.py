@@ -0,0 +1,95 @@
+"""
+Cold-start and per-worker memory comparison between settings profiles.
+
+For each settings module this script runs a fresh interpreter that:
+- imports Django, runs setup() and loads the URL conf (cold start)
+- optionally freezes the GC heap, then forks a "worker" that serves a batch
+  of analyze requests through Django's test client
+- reports the worker's private (unshared) memory from /proc/<pid>/smaps_rollup
+
+Usage:
+    python benchmarks/startup_profile.py [--requests 50] [--tasks 500]
+
+Linux only for the memory columns (smaps_rollup); timings work everywhere.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = r"""
+import gc, json, os, sys, time
+t0 = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+startup = time.perf_counter() - t0
+
+def private_kb(pid):
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            fields = dict(line.split(":", 1) for line in fh if ":" in line)
+        return sum(int(fields[k].split()[0]) for k in ("Private_Clean", "Private_Dirty"))
+    except OSError:
+        return None
+
+def rss_kb():
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+freeze, n_requests, n_tasks = sys.argv[1] == "1", int(sys.argv[2]), int(sys.argv[3])
+tasks = [{"id": f"t{i}", "title": f"T{i}", "estimated_hours": 1 + i % 8, "importance": 1 + i % 10,
+          "dependencies": [f"t{i - 1}"] if i else []} for i in range(n_tasks)]
+body = json.dumps({"tasks": tasks})
+if freeze:
+    gc.freeze()
+read_fd, write_fd = os.pipe()
+pid = os.fork()
+if pid == 0:
+    from django.test import Client
+    client = Client()
+    for _ in range(n_requests):
+        client.post("/api/tasks/analyze/", data=body, content_type="application/json")
+    os.write(write_fd, json.dumps({"private_kb": private_kb(os.getpid())}).encode())
+    os._exit(0)
+os.waitpid(pid, 0)
+worker = json.loads(os.read(read_fd, 4096))
+print(json.dumps({"startup_s": startup, "master_rss_kb": rss_kb(), **worker}))
+"""
+
+
+def run(settings_module: str, freeze: bool, requests: int, tasks: int) -> dict:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module, "DEBUG": "false"}
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, "1" if freeze else "0", str(requests), str(tasks)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'profile':<28}{'gc.freeze':>10}{'startup ms':>12}{'master RSS MB':>15}{'worker private MB':>19}")
+    for settings_module in ("task_analyzer.settings", "task_analyzer.settings_api"):
+        for freeze in (False, True):
+            runs = [run(settings_module, freeze, args.requests, args.tasks) for _ in range(args.repeat)]
+            startup = min(r["startup_s"] for r in runs) * 1000
+            rss = min(r["master_rss_kb"] for r in runs) / 1024
+            private = [r["private_kb"] for r in runs if r["private_kb"] is not None]
+            private_txt = f"{min(private) / 1024:.1f}" if private else "n/a"
+            print(f"{settings_module:<28}{str(freeze):>10}{startup:>12.1f}{rss:>15.1f}{private_txt:>19}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,52 +6,34 @@ Responsible for detecting circular dependencies using DFS.
 
 Input:
 - tasks: Dict[id -> TaskEntity]
+- graph: optional prebuilt TaskGraph over the same mapping (shared with scoring)
 
 Output:
 - has_cycle(): bool
 - get_cycles(): list of lists of task IDs
 
+The search runs iteratively over the integer-indexed TaskGraph, so deep
+dependency chains do not hit the recursion limit.
 """
 
+from core.models.task_graph import TaskGraph
+
+
 class DependencyGraph:
 
-    def __init__(self, tasks_dict):
+    def __init__(self, tasks_dict, graph=None):
         self.tasks = tasks_dict
-        self.visited = set()
-        self.rec_stack = set()
+        self.graph = graph if graph is not None else TaskGraph.from_task_map(tasks_dict)
         self.cycles = []
 
     def _reset_state(self):
-        self.visited.clear()
-        self.rec_stack.clear()
         self.cycles.clear()
 
-    def _dfs(self, task_id, path):
-        if task_id in self.rec_stack:
-            cycle_start = path.index(task_id)
-            self.cycles.append(path[cycle_start:])
-            return
-
-        if task_id in self.visited:
-            return
-
-        self.visited.add(task_id)
-        self.rec_stack.add(task_id)
-
-        task = self.tasks.get(task_id)
-        if not task:
-            self.rec_stack.remove(task_id)
-            return
-
-        for dep in task.dependencies:
-            self._dfs(dep, path + [dep])
-
-        self.rec_stack.remove(task_id)
-
     def _detect_cycles(self):
         self._reset_state()
-        for task_id in self.tasks:
-            self._dfs(task_id, [task_id])
+        keys = self.graph.keys
+        for cycle in self.graph.find_cycles():
+            self.cycles.append([keys[pos] for pos in cycle])
 
     def has_cycle(self):
         self._detect_cycles()
@@ -0,0 +1,190 @@
+"""
+TaskGraph
+---------
+
+Dense, integer-indexed dependency graph shared by every dependency consumer
+(cycle detection, dependent counts, critical path, scheduling, explanations).
+
+Input:
+- keys: task keys in position order (the analyze task-map keys)
+- dependency_lists: for each position, the declared dependency ids
+
+Output:
+- forward adjacency (task -> its dependencies) and reverse adjacency
+  (task -> its dependents) as CSR offset/index arrays
+- unknown dependency references and self dependencies found while building
+
+Notes:
+- duplicate entries in one task's dependency list are collapsed (first
+  occurrence order is kept)
+- unknown ids are not edges; they are only reported
+- self dependencies stay in the adjacency (they are one-node cycles) and are
+  also reported
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class TaskGraph:
+
+    def __init__(self, keys, dep_offsets, dep_indices, rdep_offsets, rdep_indices, unknown, self_deps):
+        self.keys: List[str] = keys
+        self.dep_offsets = dep_offsets
+        self.dep_indices = dep_indices
+        self.rdep_offsets = rdep_offsets
+        self.rdep_indices = rdep_indices
+        self.unknown: List[Tuple[int, str]] = unknown
+        self.self_deps: List[int] = self_deps
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def build(cls, keys: Sequence[str], dependency_lists: Iterable[Sequence[str]]) -> "TaskGraph":
+        keys = list(keys)
+        index = {key: pos for pos, key in enumerate(keys)}
+        get = index.get
+
+        dep_offsets = array("l", [0])
+        dep_indices = array("l")
+        unknown: List[Tuple[int, str]] = []
+        self_deps: List[int] = []
+        for pos, deps in enumerate(dependency_lists):
+            if deps:
+                for dep in (dict.fromkeys(deps) if len(deps) > 1 else deps):
+                    target = get(dep)
+                    if target is None:
+                        unknown.append((pos, dep))
+                        continue
+                    if target == pos:
+                        self_deps.append(pos)
+                    dep_indices.append(target)
+            dep_offsets.append(len(dep_indices))
+
+        graph = cls(keys, dep_offsets, dep_indices, *_reverse(len(keys), dep_offsets, dep_indices), unknown, self_deps)
+        graph._index = index
+        return graph
+
+    @classmethod
+    def from_task_map(cls, task_map) -> "TaskGraph":
+        """Graph over an analyze task map (keys are ids, or titles for id-less tasks)."""
+        return cls.build(task_map.keys(), (t.dependencies for t in task_map.values()))
+
+    @classmethod
+    def from_tasks(cls, tasks) -> "TaskGraph":
+        """Graph over a task list keyed like _build_task_map (id, else title)."""
+        return cls.build((t.id if t.id is not None else t.title for t in tasks), (t.dependencies for t in tasks))
+
+    @classmethod
+    def from_adjacency(cls, prerequisites: Sequence[Sequence[int]]) -> "TaskGraph":
+        """Graph from position-based prerequisite lists (keys are the positions as strings)."""
+        return cls.build([str(i) for i in range(len(prerequisites))], ([str(d) for d in p] for p in prerequisites))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {key: pos for pos, key in enumerate(self.keys)}
+        return self._index
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.dep_indices)
+
+    def dependencies(self, pos: int):
+        """Positions `pos` depends on."""
+        return self.dep_indices[self.dep_offsets[pos]:self.dep_offsets[pos + 1]]
+
+    def dependents(self, pos: int):
+        """Positions that depend on `pos`."""
+        return self.rdep_indices[self.rdep_offsets[pos]:self.rdep_offsets[pos + 1]]
+
+    def dependent_counts(self) -> List[int]:
+        """Number of distinct tasks depending on each position."""
+        offsets = self.rdep_offsets
+        return [offsets[pos + 1] - offsets[pos] for pos in range(len(self.keys))]
+
+    def topological_order(self) -> List[int]:
+        """
+        Kahn order, dependencies before dependents. Positions on or behind a
+        cycle are omitted.
+        """
+        offsets = self.dep_offsets
+        indegree = [offsets[pos + 1] - offsets[pos] for pos in range(len(self.keys))]
+        r_off = self.rdep_offsets
+        r_idx = self.rdep_indices
+        order = [pos for pos, deg in enumerate(indegree) if deg == 0]
+        head = 0
+        while head < len(order):
+            node = order[head]
+            head += 1
+            for nxt in r_idx[r_off[node]:r_off[node + 1]]:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    order.append(nxt)
+        return order
+
+    def find_cycles(self) -> List[List[int]]:
+        """
+        Depth-first cycle search in position order (iterative, no recursion
+        limit). Each cycle is reported as the stack slice from the re-entered
+        node to the current node, followed by the re-entered node again.
+        """
+        n = len(self.keys)
+        offsets = self.dep_offsets
+        indices = self.dep_indices
+        visited = bytearray(n)
+        stack_pos = [-1] * n
+        cycles: List[List[int]] = []
+
+        for root in range(n):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            path = [root]
+            cursor = [offsets[root]]
+            stack_pos[root] = 0
+            while path:
+                node = path[-1]
+                ptr = cursor[-1]
+                if ptr < offsets[node + 1]:
+                    cursor[-1] = ptr + 1
+                    dep = indices[ptr]
+                    if stack_pos[dep] >= 0:
+                        cycles.append(path[stack_pos[dep]:] + [dep])
+                    elif not visited[dep]:
+                        visited[dep] = 1
+                        stack_pos[dep] = len(path)
+                        path.append(dep)
+                        cursor.append(offsets[dep])
+                else:
+                    stack_pos[node] = -1
+                    path.pop()
+                    cursor.pop()
+        return cycles
+
+    def issues(self) -> Dict[str, list]:
+        """Unknown and self dependencies keyed by task key."""
+        return {
+            "unknown_dependencies": [{"id": self.keys[pos], "dependency": dep} for pos, dep in self.unknown],
+            "self_dependencies": [self.keys[pos] for pos in self.self_deps],
+        }
+
+
+def _reverse(n: int, dep_offsets, dep_indices):
+    """Reverse CSR (task -> dependents) by counting sort over edge targets."""
+    counts = [0] * (n + 1)
+    for target in dep_indices:
+        counts[target + 1] += 1
+    for pos in range(n):
+        counts[pos + 1] += counts[pos]
+    rdep_offsets = array("l", counts)
+    fill = counts[:-1]
+    rdep_indices = array("l", bytes(rdep_offsets.itemsize * len(dep_indices)))
+    for source in range(n):
+        for ptr in range(dep_offsets[source], dep_offsets[source + 1]):
+            target = dep_indices[ptr]
+            rdep_indices[fill[target]] = source
+            fill[target] += 1
+    return rdep_offsets, rdep_indices
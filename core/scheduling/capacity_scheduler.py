@@ -0,0 +1,119 @@
+"""
+CapacityScheduler
+-----------------
+
+Lays tasks out over calendar days for a single worker with a daily hour
+budget, respecting dependency order.
+
+Input:
+- hours, scores: columns indexed by task position
+- graph: TaskGraph over the same positions
+- start_date and a per-weekday hour budget
+
+Output:
+- ScheduleResult with per-task start/finish day offsets, per-day allocations
+  and the tasks that could not be placed
+
+Ready tasks are picked from a max-heap on score (Kahn's algorithm), so a
+plan costs O((V + E) log V) plus one step per calendar day consumed.
+Tasks on or behind a dependency cycle never become ready and are reported
+as unscheduled.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class ScheduleResult:
+    start_day: List[Optional[int]]
+    finish_day: List[Optional[int]]
+    order: List[int] = field(default_factory=list)
+    day_allocations: Dict[int, List[Tuple[int, float]]] = field(default_factory=dict)
+    unscheduled: Dict[int, str] = field(default_factory=dict)
+
+
+def weekly_budget(daily_hours) -> List[float]:
+    """Normalize a scalar or per-weekday (Mon..Sun) budget into 7 values."""
+    if isinstance(daily_hours, (int, float)):
+        budget = [float(daily_hours)] * 7
+    else:
+        budget = [float(h) for h in daily_hours]
+        if len(budget) != 7:
+            raise ValueError("daily_hours must be a number or a list of 7 weekday values")
+    if any(h < 0 for h in budget) or not any(h > 0 for h in budget):
+        raise ValueError("daily_hours must be non-negative with at least one working day")
+    return budget
+
+
+def schedule_by_capacity(
+    hours: Sequence[float],
+    scores: Sequence[float],
+    graph,
+    start_date: date,
+    daily_hours=8.0,
+    horizon_days: int = 365,
+) -> ScheduleResult:
+    n = len(hours)
+    budget = weekly_budget(daily_hours)
+    start_weekday = start_date.weekday()
+
+    d_off = graph.dep_offsets
+    r_off, r_idx = graph.rdep_offsets, graph.rdep_indices
+    indegree = [d_off[i + 1] - d_off[i] for i in range(n)]
+
+    ready = [(-scores[i], i) for i in range(n) if indegree[i] == 0]
+    heapq.heapify(ready)
+
+    result = ScheduleResult(start_day=[None] * n, finish_day=[None] * n)
+    day = 0
+    used = 0.0
+    exhausted = False
+
+    while ready:
+        _, idx = heapq.heappop(ready)
+        if exhausted:
+            # keep releasing dependents so only cycle-blocked tasks stay "blocked"
+            result.unscheduled[idx] = "beyond_horizon"
+        else:
+            remaining = max(float(hours[idx]), 0.0)
+            first_day = None
+            while True:
+                capacity = budget[(start_weekday + day) % 7] - used
+                if capacity > 1e-9:
+                    if first_day is None:
+                        first_day = day
+                    take = min(capacity, remaining)
+                    if take > 0:
+                        result.day_allocations.setdefault(day, []).append((idx, take))
+                    used += take
+                    remaining -= take
+                    if remaining <= 1e-9:
+                        break
+                day += 1
+                used = 0.0
+                if day >= horizon_days:
+                    exhausted = True
+                    break
+            if exhausted:
+                result.unscheduled[idx] = "beyond_horizon"
+            else:
+                result.start_day[idx] = first_day
+                result.finish_day[idx] = day
+                result.order.append(idx)
+
+        for nxt in r_idx[r_off[idx]:r_off[idx + 1]]:
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                heapq.heappush(ready, (-scores[nxt], nxt))
+
+    for idx in range(n):
+        if result.finish_day[idx] is None and idx not in result.unscheduled:
+            result.unscheduled[idx] = "blocked_by_cycle"
+    return result
+
+
+def day_to_date(start_date: date, offset: int) -> date:
+    return start_date + timedelta(days=offset)
@@ -0,0 +1,102 @@
+"""
+Critical Path
+-------------
+
+Longest dependency chain weighted by estimated hours, plus per-task slack
+against due dates.
+
+Input:
+- hours: estimated hours per task position
+- graph: TaskGraph over the same positions
+- deadline_hours: optional per-task deadline expressed in work hours from now
+
+Output:
+- CriticalPathResult with earliest finish, longest chain through each task,
+  criticality (chain / project length) and slack per task
+
+One forward and one backward sweep over the graph's topological order, so
+the cost is O(V + E). Tasks on or behind a cycle are left out (values None,
+criticality 0).
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class CriticalPathResult:
+    path: List[int]
+    length: float
+    earliest_finish: List[Optional[float]]
+    criticality: List[float]
+    slack: List[Optional[float]]
+
+
+def compute_critical_path(
+    hours: Sequence[float],
+    graph,
+    deadline_hours: Optional[Sequence[float]] = None,
+) -> CriticalPathResult:
+    n = len(hours)
+    order = graph.topological_order()
+    d_off, d_idx = graph.dep_offsets, graph.dep_indices
+    r_off, r_idx = graph.rdep_offsets, graph.rdep_indices
+
+    # forward: earliest finish and the prerequisite that determines it
+    finish: List[Optional[float]] = [None] * n
+    via = [-1] * n
+    for node in order:
+        start = 0.0
+        for dep in d_idx[d_off[node]:d_off[node + 1]]:
+            if finish[dep] > start:
+                start = finish[dep]
+                via[node] = dep
+        finish[node] = start + hours[node]
+
+    # backward: longest remaining chain after each task and latest finish
+    tail = [0.0] * n
+    latest: List[Optional[float]] = [None] * n
+    for node in reversed(order):
+        best_tail = 0.0
+        bound = deadline_hours[node] if deadline_hours is not None else None
+        for nxt in r_idx[r_off[node]:r_off[node + 1]]:
+            if finish[nxt] is None:
+                continue
+            chain = hours[nxt] + tail[nxt]
+            if chain > best_tail:
+                best_tail = chain
+            if latest[nxt] is not None:
+                nxt_bound = latest[nxt] - hours[nxt]
+                if bound is None or nxt_bound < bound:
+                    bound = nxt_bound
+        tail[node] = best_tail
+        latest[node] = bound
+
+    length = 0.0
+    end = -1
+    for node in order:
+        if finish[node] > length:
+            length = finish[node]
+            end = node
+
+    path = []
+    while end != -1:
+        path.append(end)
+        end = via[end]
+    path.reverse()
+
+    criticality = [0.0] * n
+    slack: List[Optional[float]] = [None] * n
+    for node in order:
+        if length > 0:
+            criticality[node] = (finish[node] + tail[node]) / length
+        if latest[node] is not None:
+            slack[node] = latest[node] - finish[node]
+
+    return CriticalPathResult(
+        path=path,
+        length=length,
+        earliest_finish=finish,
+        criticality=criticality,
+        slack=slack,
+    )
@@ -0,0 +1,146 @@
+"""
+Knapsack Selection
+------------------
+
+Picks the subset of tasks with the highest total score whose hours fit a
+budget (0/1 knapsack).
+
+Input:
+- values: score per candidate
+- weights: hours per candidate; negative hours are invalid input and such
+  candidates are never chosen
+- capacity: available hours
+
+Output:
+- KnapsackResult with chosen positions, totals, the method used and the
+  LP-relaxation upper bound on the optimum
+
+Methods:
+- "exact": dynamic programming over hours in units of `resolution`; used
+  while candidates x capacity units stays under `exact_cell_limit` and every
+  weight is a whole number of units, where the DP optimum is the optimum
+- "grid": the same DP when some weight is off the grid. Those weights are
+  rounded up (so the chosen set always fits the real budget), which makes
+  the DP optimal only for the rounded weights; the better of the DP set and
+  the greedy fill is returned, so the 1/2 guarantee below still holds
+- "greedy": best of (score-density greedy fill, best single task). This is
+  the classic 1/2-approximation: total >= 0.5 * optimum.
+
+The LP bound is reported so callers can see the actual gap.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Sequence
+
+GREEDY_GUARANTEE = 0.5
+
+# float slack when summing hours against the budget (3 x 2.7h fits 8.1h)
+_FIT_EPSILON = 1e-9
+
+
+@dataclass
+class KnapsackResult:
+    chosen: List[int]
+    total_value: float
+    total_weight: float
+    method: str
+    upper_bound: float
+
+
+def _lp_bound(values, weights, items, capacity) -> float:
+    """Fractional knapsack optimum over `items` sorted by density."""
+    bound = 0.0
+    room = capacity
+    for i in items:
+        if weights[i] <= room:
+            bound += values[i]
+            room -= weights[i]
+        else:
+            bound += values[i] * room / weights[i]
+            break
+    return bound
+
+
+def _greedy(values, weights, items, capacity) -> List[int]:
+    chosen = []
+    room = capacity
+    for i in items:
+        if weights[i] <= room + _FIT_EPSILON:
+            chosen.append(i)
+            room -= weights[i]
+    best_single = max(items, key=values.__getitem__, default=None)
+    if best_single is not None and values[best_single] > sum(values[i] for i in chosen):
+        return [best_single]
+    return chosen
+
+
+def _on_grid(weight: float, resolution: float) -> bool:
+    units = weight / resolution
+    return abs(units - round(units)) < 1e-9
+
+
+def _exact(values, weights, items, capacity, resolution) -> List[int]:
+    units = int(math.floor(capacity / resolution + 1e-9))
+    sizes = [max(int(math.ceil(weights[i] / resolution - 1e-9)), 0) for i in items]
+    best = [0.0] * (units + 1)
+    taken = []
+    for value, size in zip((values[i] for i in items), sizes):
+        flags = bytearray(units + 1)
+        for c in range(units, size - 1, -1):
+            candidate = best[c - size] + value
+            if candidate > best[c]:
+                best[c] = candidate
+                flags[c] = 1
+        taken.append(flags)
+
+    chosen = []
+    c = units
+    for pos in range(len(items) - 1, -1, -1):
+        if taken[pos][c]:
+            chosen.append(items[pos])
+            c -= sizes[pos]
+    chosen.reverse()
+    return chosen
+
+
+def select_within_budget(
+    values: Sequence[float],
+    weights: Sequence[float],
+    capacity: float,
+    resolution: float = 0.25,
+    exact_cell_limit: int = 250_000,
+) -> KnapsackResult:
+    # zero-hour tasks with positive score are always worth taking; negative
+    # hours would count as free capacity, so those tasks are left out
+    free = [i for i in range(len(values)) if weights[i] == 0 and values[i] > 0]
+    items = [i for i in range(len(values)) if 0 < weights[i] <= capacity and values[i] > 0]
+    items.sort(key=lambda i: values[i] / weights[i], reverse=True)
+    upper = _lp_bound(values, weights, items, capacity) + sum(values[i] for i in free)
+
+    units = capacity / resolution
+    if not items:
+        # nothing to place: skip the DP table, whose size follows the capacity
+        method = "exact"
+        chosen = []
+    elif len(items) * units <= exact_cell_limit:
+        chosen = _exact(values, weights, items, capacity, resolution)
+        if all(_on_grid(weights[i], resolution) for i in items):
+            method = "exact"
+        else:
+            method = "grid"
+            greedy = _greedy(values, weights, items, capacity)
+            if sum(values[i] for i in greedy) > sum(values[i] for i in chosen):
+                chosen = greedy
+    else:
+        method = "greedy"
+        chosen = _greedy(values, weights, items, capacity)
+
+    chosen = free + chosen
+    return KnapsackResult(
+        chosen=chosen,
+        total_value=sum(values[i] for i in chosen),
+        total_weight=sum(weights[i] for i in chosen),
+        method=method,
+        upper_bound=upper,
+    )
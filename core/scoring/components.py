@@ -0,0 +1,228 @@
+"""
+Scoring Components
+------------------
+
+Registry of batch scoring components used by PriorityEngine.
+
+Each component turns the whole task list into one column of floats
+(`compute(context) -> List[float]`), so adding a factor adds one pass over
+the tasks instead of a Python call per task per factor.
+
+Input:
+- BatchContext: tasks, config, reference date, days-until-due column,
+  dependency graph, critical path and the columns computed so far
+
+Output:
+- ScoringComponent entries in registration order
+
+Weights:
+- built-in components read their `weight_*` field on ScoringConfig
+- every other component reads ScoringConfig.component_weights[name]
+  (missing means 0.0, i.e. computed and reported but not scored)
+
+Custom factors:
+- register_component(ScoringComponent(...)) for process-wide factors
+- ScoringConfig.raw_factors declares per-request factors read from extra
+  raw task fields, see raw_field_component()
+
+Dates:
+- components with dated=True read the reference date (context.today,
+  deltas or slack) and are recomputed for each day of a projection
+  (PriorityEngine.project_scores); registered components default to it,
+  pass dated=False for factors that only read task fields
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from .urgency import compute_urgency_column
+from .importance import compute_importance
+from .effort import compute_effort
+from .dependency_score import count_dependents
+from .dependency_reach import REACH_MODES, dependent_reach, reach_by_task
+from core.models.task_graph import TaskGraph
+
+
+@dataclass
+class BatchContext:
+    tasks: Sequence[Any]
+    config: Any
+    today: date
+    deltas: List[int]
+    task_map: Optional[Mapping] = None
+    graph: Any = None
+    critical: Any = None
+    columns: Optional[Dict[str, list]] = None
+
+
+@dataclass(frozen=True)
+class ScoringComponent:
+    name: str
+    compute: Callable[[BatchContext], List[float]]
+    weight_field: Optional[str] = None
+    dated: bool = True
+
+    def weight(self, config) -> float:
+        if self.weight_field is not None:
+            return getattr(config, self.weight_field)
+        return config.component_weights.get(self.name, 0.0)
+
+    @property
+    def weight_key(self) -> str:
+        """Key used for this component in weight mappings (sweeps, config_used)."""
+        return self.weight_field or self.name
+
+
+def _urgency(ctx: BatchContext) -> List[float]:
+    return compute_urgency_column(ctx.deltas, ctx.config)
+
+
+def _importance(ctx: BatchContext) -> List[float]:
+    return [compute_importance(t) for t in ctx.tasks]
+
+
+def _effort(ctx: BatchContext) -> List[float]:
+    return [compute_effort(t) for t in ctx.tasks]
+
+
+def _dependency(ctx: BatchContext) -> List[int]:
+    mode = ctx.config.dependency_mode
+    if mode in REACH_MODES:
+        error = ctx.config.dependency_error
+        if ctx.graph is None and ctx.task_map is not None:
+            # reach over the whole map, which may hold more than ctx.tasks
+            reach = reach_by_task(ctx.task_map, mode, error)
+            return [reach.get(id(t), 0) if t.id is not None else 0 for t in ctx.tasks]
+        graph = ctx.graph if ctx.graph is not None else TaskGraph.from_tasks(ctx.tasks)
+        return [
+            count if t.id is not None else 0
+            for t, count in zip(ctx.tasks, dependent_reach(graph, mode, error))
+        ]
+    if ctx.graph is not None:
+        return [
+            count if t.id is not None else 0
+            for t, count in zip(ctx.tasks, ctx.graph.dependent_counts())
+        ]
+    dependents = count_dependents(ctx.task_map.values() if ctx.task_map is not None else ctx.tasks)
+    return [dependents.get(t.id, 0) if t.id is not None else 0 for t in ctx.tasks]
+
+
+def _critical_path(ctx: BatchContext) -> List[float]:
+    return ctx.critical.criticality
+
+
+BUILTIN_COMPONENTS = (
+    ScoringComponent("urgency", _urgency, "weight_urgency"),
+    ScoringComponent("importance", _importance, "weight_importance", dated=False),
+    ScoringComponent("effort", _effort, "weight_effort", dated=False),
+    ScoringComponent("dependency", _dependency, "weight_dependency", dated=False),
+    # criticality is relative to the chain length, not to due dates
+    ScoringComponent("critical_path", _critical_path, "weight_critical_path", dated=False),
+)
+
+# non-component columns produced by PriorityEngine.component_columns
+RESERVED_NAMES = frozenset({"days_until_due", "overdue_days", "slack_hours", "quadrant", "score", "factors"})
+
+_REGISTRY: Dict[str, ScoringComponent] = {c.name: c for c in BUILTIN_COMPONENTS}
+
+
+def _check_name(name: str) -> None:
+    if not name or name in RESERVED_NAMES or name.startswith("weight_"):
+        raise ValueError(f"invalid scoring component name '{name}'")
+
+
+def register_component(component: ScoringComponent, replace: bool = False) -> None:
+    """Add a process-wide component; built-ins cannot be replaced."""
+    _check_name(component.name)
+    existing = _REGISTRY.get(component.name)
+    if existing is not None and (not replace or existing in BUILTIN_COMPONENTS):
+        raise ValueError(f"scoring component '{component.name}' is already registered")
+    _REGISTRY[component.name] = component
+
+
+def unregister_component(name: str) -> None:
+    if _REGISTRY.get(name) in BUILTIN_COMPONENTS:
+        raise ValueError(f"scoring component '{name}' is built in")
+    _REGISTRY.pop(name, None)
+
+
+def registered_components() -> tuple:
+    return tuple(_REGISTRY.values())
+
+
+def _to_float(value, default: float) -> float:
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    # "nan" / "inf" parse but would poison every score they touch
+    return number if math.isfinite(number) else default
+
+
+def _spec_number(name: str, what: str, value) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"raw factor '{name}': {what} must be a finite number")
+    return float(value)
+
+
+def _raw_column(tasks, field: str) -> list:
+    return [(getattr(t, "raw", None) or {}).get(field) for t in tasks]
+
+
+def raw_field_component(
+    name: str,
+    field: str,
+    values: Optional[Mapping[str, float]] = None,
+    default: float = 0.0,
+) -> ScoringComponent:
+    """
+    Component reading `field` from each task's raw mapping.
+
+    With `values`, the raw value is looked up as a category (e.g. customer
+    tier "gold" -> 2.0); otherwise it is used as a number (booleans count as
+    1/0). Missing or unusable values (including NaN and infinities) score
+    `default`.
+
+    Raises:
+        ValueError when `default` or a `values` entry is not a finite number
+    """
+    _check_name(name)
+    default = _spec_number(name, "default", default)
+
+    if values:
+        if not isinstance(values, Mapping):
+            raise ValueError(f"raw factor '{name}': values must map raw values to numbers")
+        table = {str(k): _spec_number(name, f"value for '{k}'", v) for k, v in values.items()}
+
+        def compute(ctx: BatchContext) -> List[float]:
+            get = table.get
+            return [get(str(v), default) if v is not None else default for v in _raw_column(ctx.tasks, field)]
+    else:
+        def compute(ctx: BatchContext) -> List[float]:
+            return [_to_float(v, default) for v in _raw_column(ctx.tasks, field)]
+
+    return ScoringComponent(name, compute, dated=False)
+
+
+def resolve_components(config) -> List[ScoringComponent]:
+    """
+    Registered components followed by the config's raw-field factors.
+
+    Raises:
+        ValueError for a malformed raw_factors spec
+    """
+    components = list(_REGISTRY.values())
+    raw_factors = config.raw_factors or {}
+    if not isinstance(raw_factors, Mapping):
+        raise ValueError("raw_factors must map factor names to specs")
+    for name, spec in raw_factors.items():
+        if name in _REGISTRY:
+            raise ValueError(f"raw factor '{name}' clashes with a registered scoring component")
+        if not isinstance(spec, Mapping) or not spec.get("field") or not isinstance(spec["field"], str):
+            raise ValueError(f"raw factor '{name}' needs a 'field'")
+        components.append(raw_field_component(name, spec["field"], spec.get("values"), spec.get("default", 0.0)))
+    return components
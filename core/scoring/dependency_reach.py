@@ -0,0 +1,220 @@
+"""
+Dependency Reach
+----------------
+
+Downstream reach of each task: how many distinct tasks depend on it
+directly or transitively. Used by the dependency component when
+ScoringConfig.dependency_mode is "transitive" (exact) or "approximate".
+
+Input:
+- graph: TaskGraph
+- mode / error: ScoringConfig.dependency_mode and dependency_error
+
+Output:
+- list of counts aligned with graph positions (dependent_reach)
+
+Both modes sweep the graph once in reverse topological order (dependents
+before their prerequisites) and merge each task's dependents into its reach.
+A reach is freed as soon as every prerequisite that reads it has been
+processed, so only the frontier of the sweep is held in memory.
+
+- transitive: exact reach as int bitsets; worst case O(V^2 / 8) bytes for
+  dense, deep graphs
+- approximate: small reaches are kept as exact sets; once a reach exceeds
+  `sparse_limit` tasks it becomes a HyperLogLog sketch of 2^p one-byte
+  registers (fixed size per task), with p chosen from the requested
+  relative standard error (1.04 / sqrt(2^p) <= error). Sketches are packed
+  into one int each so a merge is a handful of big-int operations.
+
+Tasks on or behind a cycle are not propagated through: their own reach is
+their direct dependent count, and the reach of their prerequisites counts
+them but not what lies behind them (those tasks are blocked anyway).
+"""
+
+import math
+from array import array
+from typing import Dict, List, Optional
+
+from core.models.task_graph import TaskGraph
+
+DEPENDENCY_MODES = ("direct", "transitive", "approximate")
+# modes that need the whole graph swept rather than direct dependent counts
+REACH_MODES = ("transitive", "approximate")
+
+_MIN_PRECISION = 4
+_MAX_PRECISION = 16
+_MASK64 = (1 << 64) - 1
+
+_popcount = getattr(int, "bit_count", None) or (lambda value: bin(value).count("1"))
+
+
+def precision_for_error(error: float) -> int:
+    """Smallest register-count exponent p whose standard error is within `error`."""
+    if not error > 0:
+        raise ValueError("dependency_error must be positive")
+    p = math.ceil(math.log2((1.04 / error) ** 2))
+    return min(max(p, _MIN_PRECISION), _MAX_PRECISION)
+
+
+def _sweep_setup(graph):
+    order = graph.topological_order()
+    acyclic = bytearray(len(graph))
+    for node in order:
+        acyclic[node] = 1
+    d_off = graph.dep_offsets
+    # readers left for each reach: one per prerequisite
+    pending = [d_off[pos + 1] - d_off[pos] for pos in range(len(graph))]
+    return order, acyclic, pending
+
+
+def transitive_dependent_counts(graph) -> List[int]:
+    counts = graph.dependent_counts()
+    order, acyclic, pending = _sweep_setup(graph)
+    r_off, r_idx = graph.rdep_offsets, graph.rdep_indices
+    reach = [0] * len(graph)
+    for node in reversed(order):
+        mask = 0
+        for dep in r_idx[r_off[node]:r_off[node + 1]]:
+            mask |= 1 << dep
+            if acyclic[dep]:
+                mask |= reach[dep]
+                pending[dep] -= 1
+                if not pending[dep]:
+                    reach[dep] = 0
+        counts[node] = _popcount(mask)
+        if pending[node]:
+            reach[node] = mask
+    return counts
+
+
+def _splitmix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class _Sketches:
+    """HyperLogLog arithmetic on registers packed 8 bits per lane into an int."""
+
+    def __init__(self, n: int, p: int):
+        self.m = m = 1 << p
+        bits = 64 - p
+        self.register = array("H", bytes(2 * n))
+        self.rank = array("B", bytes(n))
+        for pos in range(n):
+            h = _splitmix64(pos)
+            self.register[pos] = h & (m - 1)
+            self.rank[pos] = bits - (h >> p).bit_length() + 1
+        # lane guard bits: register values stay below 128
+        self.high = int.from_bytes(b"\x80" * m, "little")
+        self.inverse = [2.0 ** -value for value in range(128)]
+        alpha = 0.673 if m == 16 else 0.697 if m == 32 else 0.709 if m == 64 else 0.7213 / (1 + 1.079 / m)
+        self.scale = alpha * m * m
+
+    def from_positions(self, positions) -> int:
+        registers = bytearray(self.m)
+        register, rank = self.register, self.rank
+        for pos in positions:
+            if rank[pos] > registers[register[pos]]:
+                registers[register[pos]] = rank[pos]
+        return int.from_bytes(registers, "little")
+
+    def union(self, a: int, b: int) -> int:
+        """Lane-wise max: lanes where a >= b keep their guard bit after subtracting."""
+        keep_a = ((((a | self.high) - b) & self.high) >> 7) * 0xFF
+        return (a & keep_a) | (b & ~keep_a)
+
+    def estimate(self, sketch: int) -> float:
+        registers = sketch.to_bytes(self.m, "little")
+        # register values are small: one C-level count per value until all
+        # registers are accounted for
+        zeros = registers.count(0)
+        harmonic = float(zeros)
+        remaining = self.m - zeros
+        value = 0
+        inverse = self.inverse
+        while remaining:
+            value += 1
+            count = registers.count(value)
+            harmonic += count * inverse[value]
+            remaining -= count
+        estimate = self.scale / harmonic
+        if estimate <= 2.5 * self.m and zeros:
+            estimate = self.m * math.log(self.m / zeros)
+        return estimate
+
+
+def approximate_dependent_counts(graph, error: float = 0.05, sparse_limit: Optional[int] = None) -> List[int]:
+    """
+    Estimated reach per task; exact while a reach has at most `sparse_limit`
+    tasks (default 2^p / 8).
+    """
+    p = precision_for_error(error)
+    sketches = _Sketches(len(graph), p)
+    limit = sketches.m // 8 if sparse_limit is None else sparse_limit
+    counts = graph.dependent_counts()
+    order, acyclic, pending = _sweep_setup(graph)
+    r_off, r_idx = graph.rdep_offsets, graph.rdep_indices
+    union, from_positions, estimate = sketches.union, sketches.from_positions, sketches.estimate
+    # per position: a set (exact) or an int (sketch) and the sketch's estimate
+    reach: List = [None] * len(graph)
+    estimates = array("d", bytes(8 * len(graph)))
+
+    for node in reversed(order):
+        exact = set()
+        sketch = base_sketch = None
+        base = -1
+        for dep in r_idx[r_off[node]:r_off[node + 1]]:
+            exact.add(dep)
+            if acyclic[dep]:
+                theirs = reach[dep]
+                if type(theirs) is int:
+                    if sketch is None:
+                        sketch = base_sketch = theirs
+                        base = dep
+                    else:
+                        sketch = union(sketch, theirs)
+                else:
+                    exact |= theirs
+                pending[dep] -= 1
+                if not pending[dep]:
+                    reach[dep] = None
+            if len(exact) > limit:
+                folded = from_positions(exact)
+                sketch = folded if sketch is None else union(sketch, folded)
+                exact = set()
+        if sketch is None:
+            counts[node] = len(exact)
+            result = exact
+        else:
+            if exact:
+                sketch = union(sketch, from_positions(exact))
+            # merging often leaves every register as it was in one dependent's
+            # sketch; its estimate is then reused
+            if sketch == base_sketch:
+                value = estimates[base]
+            else:
+                value = estimate(sketch)
+            estimates[node] = value
+            counts[node] = round(value)
+            result = sketch
+        if pending[node]:
+            reach[node] = result
+    return counts
+
+
+def dependent_reach(graph, mode: str = "direct", error: float = 0.05) -> List[int]:
+    """Dependent count per position for a dependency_mode (unknown modes count direct dependents)."""
+    if mode == "transitive":
+        return transitive_dependent_counts(graph)
+    if mode == "approximate":
+        return approximate_dependent_counts(graph, error)
+    return graph.dependent_counts()
+
+
+def reach_by_task(task_map, mode: str, error: float = 0.05) -> Dict[int, int]:
+    """Reach of every task in an analyze task map, keyed by id(task)."""
+    tasks = list(task_map.values())
+    counts = dependent_reach(TaskGraph.from_task_map(task_map), mode, error)
+    return {id(task): count for task, count in zip(tasks, counts)}
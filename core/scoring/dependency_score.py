@@ -10,3 +10,17 @@ def compute_dependency_score(task, task_map):
         if task.id in t.dependencies:
             count += 1
     return count
+
+
+def count_dependents(tasks):
+    """
+    Single pass over all dependency lists.
+
+    Returns mapping id -> number of tasks listing that id as a dependency,
+    matching compute_dependency_score for every task without the O(n^2) scan.
+    """
+    counts = {}
+    for t in tasks:
+        for dep in set(t.dependencies):
+            counts[dep] = counts.get(dep, 0) + 1
+    return counts
@@ -0,0 +1,40 @@
+"""
+Eisenhower Quadrants
+--------------------
+
+Classifies tasks into urgent/important quadrants from their urgency and
+importance component values.
+
+Quadrants:
+- Q1_TOP: urgent and important
+- Q2_URGENT: urgent only
+- Q3_IMPORTANT: important only
+- Q4_LOW: neither
+"""
+
+QUADRANTS = ("Q1_TOP", "Q2_URGENT", "Q3_IMPORTANT", "Q4_LOW")
+
+
+def classify_quadrant(urgency, importance, config):
+    urgent = urgency >= config.eisenhower_urgency_cutoff
+    important = importance >= config.eisenhower_importance_cutoff
+    if urgent:
+        return "Q1_TOP" if important else "Q2_URGENT"
+    return "Q3_IMPORTANT" if important else "Q4_LOW"
+
+
+def classify_quadrant_column(urgency_col, importance_col, config):
+    """Quadrant label per task, aligned with the component columns."""
+    u_cut = config.eisenhower_urgency_cutoff
+    i_cut = config.eisenhower_importance_cutoff
+    # index = 2 * (not urgent) + (not important) -> QUADRANTS order
+    return [
+        QUADRANTS[(u < u_cut) * 2 + (i < i_cut)]
+        for u, i in zip(urgency_col, importance_col)
+    ]
+
+
+def apply_quadrant_multipliers(scores, quadrants, config):
+    """Scale scores by the configured multiplier of their quadrant."""
+    multipliers = config.q_multipliers
+    return [s * multipliers.get(q, 1.0) for s, q in zip(scores, quadrants)]
@@ -6,41 +6,331 @@ Combines all scoring components to compute a final score.
 
 Methods:
 - score_tasks(tasks: List[TaskEntity]) -> List[(task, score)]
+- component_columns(tasks) -> Dict[component -> List[float]]
+- combine(columns, weights) -> List[float]
+- score_breakdowns(tasks) -> List[ScoreBreakdown]
+- critical_path(tasks) -> CriticalPathResult
+- component_timings -> seconds spent per component in the last batch pass
+- project_scores(tasks, columns, days) -> per-day score columns
+- explain_task(task, task_map) -> str
 
-This file orchestrates the multi-factor scoring process.
+This file orchestrates the multi-factor scoring process. The batch helpers
+compute every component once per task as parallel columns so callers can
+re-weight them (e.g. weight sweeps) without rescoring. The components
+themselves come from the registry in components.py, so custom factors plug
+into the same column pass.
 """
 
-from .urgency import compute_urgency
+import time
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Dict, NamedTuple, Optional
+
+from .urgency import compute_urgency, compute_urgency_column
 from .importance import compute_importance
 from .effort import compute_effort
 from .dependency_score import compute_dependency_score
+from .dependency_reach import REACH_MODES, reach_by_task
+from .components import BUILTIN_COMPONENTS, BatchContext, resolve_components
+from .eisenhower import apply_quadrant_multipliers, classify_quadrant, classify_quadrant_column
+from core.models.task_graph import TaskGraph
+from core.scheduling.critical_path import CriticalPathResult, compute_critical_path
+
+COMPONENTS = tuple(c.name for c in BUILTIN_COMPONENTS)
+
+WEIGHT_FIELDS = {c.name: c.weight_field for c in BUILTIN_COMPONENTS}
+
+
+class ScoreBreakdown(NamedTuple):
+    """Per-task component values captured in the same pass as the score."""
+    urgency: float
+    importance: float
+    effort: float
+    dependency: int
+    critical_path: float
+    slack_hours: Optional[float]
+    overdue_days: int
+    quadrant: str
+    score: float
+    # values of non built-in components by name, None when there are none
+    factors: Optional[Dict[str, float]] = None
+
 
 class PriorityEngine:
 
     def __init__(self, config):
         self.config = config
+        self.components = resolve_components(config)
+        self.component_timings: Dict[str, float] = {}
+        # (task_map, size, reach by id(task)) of the last score_task sweep
+        self._reach_cache = None
+        # (task_map, size, today, CriticalPathResult, position by id(task))
+        self._critical_cache = None
+
+    def _reach(self, task_map):
+        """
+        Reach per task for score_task, swept once per task map (per-task
+        callers pass the same map for every task). A map that grew or shrank
+        is swept again; dependencies edited in place are not noticed, so pass
+        a new map after such edits.
+        """
+        cached = self._reach_cache
+        if cached is None or cached[0] is not task_map or cached[1] != len(task_map):
+            reach = reach_by_task(task_map, self.config.dependency_mode, self.config.dependency_error)
+            cached = self._reach_cache = (task_map, len(task_map), reach)
+        return cached[2]
+
+    def _map_critical(self, task_map, today):
+        """
+        critical_path over task_map.values() and each task's position in it,
+        computed once per task map and date (same invalidation as _reach).
+        """
+        cached = self._critical_cache
+        if (cached is None or cached[0] is not task_map or cached[1] != len(task_map)
+                or cached[2] != today):
+            tasks = list(task_map.values())
+            result = self.critical_path(tasks, today=today)
+            cached = self._critical_cache = (
+                task_map, len(task_map), today, result, {id(t): pos for pos, t in enumerate(tasks)},
+            )
+        return cached[3], cached[4]
+
+    def _critical_for(self, tasks, task_map, today):
+        """
+        The map-wide critical path restricted to `tasks`, so a subset (e.g.
+        explain_task's single task) keeps its place in the whole chain.
+        Tasks that are not in the map score 0 with no slack.
+        """
+        full, positions = self._map_critical(task_map, today)
+        picks = [positions.get(id(t)) for t in tasks]
+        local = {pos: i for i, pos in enumerate(picks) if pos is not None}
+        return CriticalPathResult(
+            path=[local[pos] for pos in full.path if pos in local],
+            length=full.length,
+            earliest_finish=[full.earliest_finish[pos] if pos is not None else None for pos in picks],
+            criticality=[full.criticality[pos] if pos is not None else 0.0 for pos in picks],
+            slack=[full.slack[pos] if pos is not None else None for pos in picks],
+        )
 
     def score_task(self, task, task_map):
         urgency = compute_urgency(task, self.config)
         importance = compute_importance(task)
         effort = compute_effort(task)
-        dependency = compute_dependency_score(task, task_map)
+        if self.config.dependency_mode in REACH_MODES:
+            dependency = self._reach(task_map).get(id(task), 0) if task.id is not None else 0
+        else:
+            dependency = compute_dependency_score(task, task_map)
+        critical = 0.0
+        if self.config.weight_critical_path:
+            full, positions = self._map_critical(task_map, date.today())
+            pos = positions.get(id(task))
+            if pos is not None:
+                critical = full.criticality[pos]
 
         score = (
             self.config.weight_urgency * urgency +
             self.config.weight_importance * importance +
             self.config.weight_effort * effort +
-            self.config.weight_dependency * dependency
+            self.config.weight_dependency * dependency +
+            self.config.weight_critical_path * critical
         )
+        extras = self.components[len(BUILTIN_COMPONENTS):]
+        if extras:
+            context = BatchContext([task], self.config, date.today(), [(task.due_date - date.today()).days])
+            for component in extras:
+                weight = component.weight(self.config)
+                if weight:
+                    score += weight * component.compute(context)[0]
+
+        if self.config.enable_eisenhower:
+            quadrant = classify_quadrant(urgency, importance, self.config)
+            score *= self.config.q_multipliers.get(quadrant, 1.0)
 
         return score
 
+    def weights(self):
+        """Current weight vector in self.components order."""
+        return tuple(c.weight(self.config) for c in self.components)
+
+    def weight_keys(self):
+        """Weight mapping keys in self.components order (weight_* field, or component name)."""
+        return tuple(c.weight_key for c in self.components)
+
+    def critical_path(self, tasks, today=None, graph=None):
+        """
+        Longest hours-weighted dependency chain over `tasks` with slack per
+        task against its due date (end of due day, hours_per_day per day).
+        `graph` is an optional TaskGraph aligned with `tasks`.
+        """
+        today = today or date.today()
+        hours_per_day = self.config.hours_per_day
+        return compute_critical_path(
+            [t.estimated_hours for t in tasks],
+            graph if graph is not None else TaskGraph.from_tasks(tasks),
+            [((t.due_date - today).days + 1) * hours_per_day for t in tasks],
+        )
+
+    def component_columns(self, tasks, today=None, task_map=None, graph=None, critical=None):
+        """
+        Compute every scoring component for all tasks in one pass.
+
+        Inputs:
+            tasks: list of task-like objects
+            today: reference date (defaults to date.today())
+            task_map: optional id -> task mapping used for dependent counts,
+                      mirroring score_task; defaults to `tasks`
+            graph: optional TaskGraph aligned with `tasks`; when given, dependent
+                   counts and the critical path come from it
+            critical: optional precomputed critical_path(tasks) result; without
+                      it and without a graph, a task_map's critical path is
+                      computed over the whole map
+
+        Output:
+            mapping component name -> list of floats aligned with `tasks`,
+            plus days_until_due, overdue_days, slack_hours and quadrant
+
+        Seconds spent per component are left in self.component_timings.
+        """
+        today = today or date.today()
+        timings = {}
+        clock = time.perf_counter
+        if critical is None:
+            started = clock()
+            if graph is None and task_map is not None:
+                critical = self._critical_for(tasks, task_map, today)
+            else:
+                critical = self.critical_path(tasks, today=today, graph=graph)
+            timings["critical_path_analysis"] = clock() - started
+
+        deltas = [(t.due_date - today).days for t in tasks]
+        columns = {
+            "days_until_due": deltas,
+            "overdue_days": [-d if d < 0 else 0 for d in deltas],
+            "slack_hours": critical.slack,
+        }
+        context = BatchContext(tasks, self.config, today, deltas, task_map, graph, critical, columns)
+        for component in self.components:
+            started = clock()
+            columns[component.name] = component.compute(context)
+            timings[component.name] = clock() - started
+        columns["quadrant"] = classify_quadrant_column(columns["urgency"], columns["importance"], self.config)
+        self.component_timings = timings
+        return columns
+
+    def combine(self, columns, weights=None):
+        """
+        Weighted sum of component columns; defaults to the configured weights.
+        Extra components are added column by column, skipping zero weights.
+        The Eisenhower multiplier stage runs here when enabled.
+        """
+        weights = weights if weights is not None else self.weights()
+        builtin = len(BUILTIN_COMPONENTS)
+        wu, wi, we, wd, wc = weights[:builtin]
+        scores = [
+            wu * u + wi * i + we * e + wd * d + wc * c
+            for u, i, e, d, c in zip(
+                columns["urgency"], columns["importance"],
+                columns["effort"], columns["dependency"], columns["critical_path"],
+            )
+        ]
+        for component, weight in zip(self.components[builtin:], weights[builtin:]):
+            if not weight:
+                continue
+            scores = [score + weight * value for score, value in zip(scores, columns[component.name])]
+        if self.config.enable_eisenhower:
+            scores = apply_quadrant_multipliers(scores, columns["quadrant"], self.config)
+        return scores
+
+    def project_scores(self, tasks, columns, days, today=None, task_map=None, graph=None, critical=None):
+        """
+        Yield score columns for day offsets 0..days.
+
+        `columns` is component_columns(tasks, ...) for `today`, and task_map,
+        graph and critical must be the ones it was computed with. Each later
+        day shifts days_until_due by the offset and slack by hours_per_day
+        per day, then recomputes only the dated components (urgency and
+        registered factors; see components.py) plus the quadrant they drive.
+        Every other column is reused as is.
+        """
+        today = today or date.today()
+        if critical is None:
+            critical = self.critical_path(tasks, today=today, graph=graph)
+        # zero-weight factors are never added; urgency also drives the quadrant
+        dated = [
+            component for component, weight in zip(self.components, self.weights())
+            if component.dated and (weight or component.name == "urgency")
+        ]
+        deltas = columns["days_until_due"]
+        for offset in range(days + 1):
+            if not offset:
+                yield self.combine(columns)
+                continue
+            shift = offset * self.config.hours_per_day
+            day_critical = replace(critical, slack=[s - shift if s is not None else None for s in critical.slack])
+            day_deltas = [d - offset for d in deltas]
+            day_columns = {
+                **columns,
+                "days_until_due": day_deltas,
+                "overdue_days": [-d if d < 0 else 0 for d in day_deltas],
+                "slack_hours": day_critical.slack,
+            }
+            context = BatchContext(
+                tasks, self.config, today + timedelta(days=offset), day_deltas,
+                task_map, graph, day_critical, day_columns,
+            )
+            for component in dated:
+                day_columns[component.name] = component.compute(context)
+            day_columns["quadrant"] = classify_quadrant_column(day_columns["urgency"], columns["importance"], self.config)
+            yield self.combine(day_columns)
+
+    def score_breakdowns(self, tasks, task_map=None, today=None, graph=None, critical=None):
+        """
+        Score all tasks and keep their component values.
+
+        Output:
+            list of ScoreBreakdown aligned with `tasks`
+        """
+        columns = self.component_columns(tasks, today=today, task_map=task_map, graph=graph, critical=critical)
+        extras = [c.name for c in self.components[len(BUILTIN_COMPONENTS):]]
+        if extras:
+            factors = [dict(zip(extras, values)) for values in zip(*(columns[name] for name in extras))]
+        else:
+            factors = [None] * len(tasks)
+        return list(map(
+            ScoreBreakdown,
+            columns["urgency"], columns["importance"], columns["effort"],
+            columns["dependency"], columns["critical_path"], columns["slack_hours"],
+            columns["overdue_days"], columns["quadrant"],
+            self.combine(columns), factors,
+        ))
+
+    @staticmethod
+    def describe(breakdown):
+        """Human readable summary of a ScoreBreakdown."""
+        parts = []
+        if breakdown.overdue_days:
+            parts.append(f"overdue by {breakdown.overdue_days} day(s)")
+        parts.append(f"urgency {breakdown.urgency:.2f}")
+        parts.append(f"importance {breakdown.importance}")
+        parts.append(f"effort {breakdown.effort:.2f}")
+        if breakdown.dependency:
+            parts.append(f"unblocks {breakdown.dependency} task(s)")
+        if breakdown.critical_path >= 1.0 - 1e-9:
+            parts.append("on critical path")
+        if breakdown.slack_hours is not None and breakdown.slack_hours < 0:
+            parts.append(f"{-breakdown.slack_hours:.1f}h behind schedule")
+        for name, value in (breakdown.factors or {}).items():
+            if value:
+                parts.append(f"{name} {value:g}")
+        return ", ".join(parts)
+
+    def explain_task(self, task, task_map):
+        return self.describe(self.score_breakdowns([task], task_map=task_map)[0])
+
     def score_tasks(self, tasks):
+        tasks = list(tasks)
         task_map = {t.id: t for t in tasks}
-        result = []
-
-        for task in tasks:
-            score = self.score_task(task, task_map)
-            result.append((task, score))
+        scores = self.combine(self.component_columns(tasks, task_map=task_map))
+        result = list(zip(tasks, scores))
 
         return sorted(result, key=lambda x: x[1], reverse=True)
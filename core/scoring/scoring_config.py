@@ -5,7 +5,18 @@ ScoringConfig
 Configuration object for weights + modes.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+def _default_q_multipliers() -> Dict[str, float]:
+    return {
+        "Q1_TOP": 1.3,
+        "Q2_URGENT": 1.1,
+        "Q3_IMPORTANT": 1.0,
+        "Q4_LOW": 0.9
+    }
+
 
 @dataclass
 class ScoringConfig:
@@ -13,6 +24,13 @@ class ScoringConfig:
     weight_importance: float = 1.0
     weight_effort: float = 0.5
     weight_dependency: float = 1.0
+    weight_critical_path: float = 0.0
+
+    # dependency component: "direct" dependents, "transitive" (exact downstream
+    # reach) or "approximate" (sketched reach within dependency_error relative
+    # standard error), see core.scoring.dependency_reach
+    dependency_mode: str = "direct"
+    dependency_error: float = 0.05
 
     urgency_mode: str = "linear"
 
@@ -22,3 +40,19 @@ class ScoringConfig:
     urgency_threshold: int = 2
     high_urgency_value: float = 2
     low_urgency_value: float = 0.5
+
+    # work hours per calendar day, used to turn due dates into hour deadlines
+    hours_per_day: float = 8
+
+    # Eisenhower stage: classify by cut-offs, optionally scale scores per quadrant
+    enable_eisenhower: bool = False
+    eisenhower_urgency_cutoff: float = 0.5
+    eisenhower_importance_cutoff: float = 7
+    q_multipliers: Dict[str, float] = field(default_factory=_default_q_multipliers)
+
+    # weights for registered or raw-field components beyond the built-in five,
+    # keyed by component name (see core.scoring.components)
+    component_weights: Dict[str, float] = field(default_factory=dict)
+    # per-request factors read from raw task fields:
+    # name -> {"field": ..., "values": {category: number} (optional), "default": 0.0}
+    raw_factors: Dict[str, Dict] = field(default_factory=dict)
@@ -10,15 +10,16 @@ Input:
 
 Output:
 - float urgency score
+
+Batch helpers work on precomputed "days remaining" columns so the mode
+branch is resolved once per batch instead of once per task.
 """
 
 import math
 from datetime import date
 
-def compute_urgency(task, config):
-    today = date.today()
-    delta = (task.due_date - today).days
 
+def compute_urgency_from_delta(delta, config):
     # overdue case
     if delta < 0:
         overdue_days = abs(delta)
@@ -36,3 +37,34 @@ def compute_urgency(task, config):
         return config.low_urgency_value
 
     return 0
+
+
+def compute_urgency(task, config):
+    today = date.today()
+    delta = (task.due_date - today).days
+    return compute_urgency_from_delta(delta, config)
+
+
+def compute_urgency_column(deltas, config):
+    """Urgency for a column of day deltas; same values as compute_urgency."""
+    base = config.overdue_base
+    growth = config.overdue_growth
+    mode = config.urgency_mode
+
+    if mode == "linear":
+        return [base + -d * growth if d < 0 else 1 / max(d, 1) for d in deltas]
+
+    if mode == "exponential":
+        exp = math.exp
+        return [base + -d * growth if d < 0 else exp(-d) for d in deltas]
+
+    if mode == "threshold":
+        threshold = config.urgency_threshold
+        high = config.high_urgency_value
+        low = config.low_urgency_value
+        return [
+            base + -d * growth if d < 0 else (high if d <= threshold else low)
+            for d in deltas
+        ]
+
+    return [base + -d * growth if d < 0 else 0 for d in deltas]
@@ -1,6 +1,41 @@
 """Lightweight task validation utilities."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class ValidationBudgetExceeded(Exception):
+	"""Raised by batch validation once more issues than allowed were found."""
+
+	def __init__(self, issues: List[Dict[str, Any]], max_issues: int):
+		super().__init__(f"validation found more than {max_issues} issue(s)")
+		self.issues = issues
+		self.max_issues = max_issues
+
+	def __reduce__(self):
+		# keep the exception picklable across process pools
+		return (type(self), (self.issues, self.max_issues))
+
+
+def _int_issue(value: Any) -> Optional[str]:
+	if value is None:
+		return "importance missing"
+	try:
+		if int(value) < 0:
+			return "importance must be positive"
+	except Exception:
+		return "importance must be an integer"
+	return None
+
+
+def _hours_issue(value: Any) -> Optional[str]:
+	if value is None:
+		return "estimated hours required"
+	try:
+		if float(value) <= 0:
+			return "estimated hours must be positive"
+	except Exception:
+		return "estimated hours must be numeric"
+	return None
 
 
 class TaskValidator:
@@ -46,3 +81,58 @@ class TaskValidator:
 			issues.append({"field": "dependencies", "message": "dependencies must be a list"})
 
 		return (len(issues) == 0), issues
+
+	def validate_batch(self, tasks: Sequence[Any], max_issues: Optional[int] = None) -> Dict[int, List[Dict[str, str]]]:
+		"""
+		Validate many tasks column by column.
+
+		Each field is pulled into a column once and checked with a single
+		comprehension; well-typed values skip the per-value coercion. Issues per
+		task match validate(). When max_issues is set, checking stops and
+		ValidationBudgetExceeded is raised as soon as the budget is exceeded.
+
+		Returns mapping task index -> issues, only for tasks with issues.
+		"""
+
+		found: List[Tuple[int, int, Dict[str, str]]] = []
+
+		def _add(field_rank: int, field: str, bad: List[Tuple[int, str]]) -> None:
+			for idx, message in bad:
+				found.append((idx, field_rank, {"field": field, "message": message}))
+			if max_issues is not None and len(found) > max_issues:
+				kept = found[:max(max_issues, 1)]
+				raise ValidationBudgetExceeded(
+					[{"index": idx, **issue} for idx, _, issue in kept], max_issues
+				)
+
+		titles = [getattr(t, "title", "") or "" for t in tasks]
+		_add(0, "title", [
+			(i, "title is required") for i, v in enumerate(titles)
+			if not (v.strip() if type(v) is str else str(v).strip())
+		])
+
+		importances = [getattr(t, "importance", None) for t in tasks]
+		_add(1, "importance", [
+			(i, msg) for i, v in enumerate(importances)
+			if (type(v) is not int or v < 0) and (msg := _int_issue(v))
+		])
+
+		due_dates = [getattr(t, "due_date", None) for t in tasks]
+		_add(2, "due_date", [(i, "due date required") for i, v in enumerate(due_dates) if v is None])
+
+		hours = [getattr(t, "estimated_hours", None) for t in tasks]
+		_add(3, "estimated_hours", [
+			(i, msg) for i, v in enumerate(hours)
+			if (type(v) not in (float, int) or v <= 0) and (msg := _hours_issue(v))
+		])
+
+		deps = [getattr(t, "dependencies", None) for t in tasks]
+		_add(4, "dependencies", [
+			(i, "dependencies must be a list") for i, v in enumerate(deps)
+			if v is not None and not isinstance(v, list)
+		])
+
+		by_index: Dict[int, List[Dict[str, str]]] = {}
+		for idx, _, issue in sorted(found, key=lambda row: (row[0], row[1])):
+			by_index.setdefault(idx, []).append(issue)
+		return by_index
@@ -0,0 +1,55 @@
+"""
+Gunicorn configuration for the API-only profile.
+
+Startup model:
+- the master imports Django, the URL conf and every view once (preload_app)
+- the GC is paused while loading and the loaded heap is frozen before each
+  fork, so collections in workers do not touch (and copy) shared pages
+- workers are recycled after max_requests (+ jitter) to cap slow leaks
+- with TASK_JOB_COST_THRESHOLD set, background jobs need the process that
+  accepted them: one threaded worker (WEB_CONCURRENCY threads) that is never
+  recycled
+
+Environment:
+- PORT (default 80), WEB_CONCURRENCY (default 2 * cores + 1),
+  GUNICORN_MAX_REQUESTS (default 2000), GUNICORN_TIMEOUT (default 60)
+"""
+
+import gc
+import multiprocessing
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_analyzer.settings_api")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '80')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+preload_app = True
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+if int(os.getenv("TASK_JOB_COST_THRESHOLD", "0")) > 0:
+    # jobs are held in worker memory (infrastructure/api/jobs.py)
+    threads = workers
+    workers = 1
+    max_requests = max_requests_jitter = 0
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+accesslog = "-"
+
+# no collections while the app is imported in the master
+gc.disable()
+
+
+def when_ready(server):
+    """Import URL patterns (and with them every view/service) in the master."""
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    gc.collect()
+
+
+def pre_fork(server, worker):
+    # move everything allocated so far to the permanent generation
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
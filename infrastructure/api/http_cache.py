@@ -0,0 +1,67 @@
+"""
+HTTP conditional-request helpers for the Tasks API.
+
+Purpose:
+- derive strong validators (ETags) from a payload digest, the request
+  options that change the answer, and the as-of date used for urgency
+- short-circuit requests whose If-None-Match already names that ETag:
+  304 for GET/HEAD, 412 for other methods (RFC 9110 section 13.1.2)
+
+Inputs:
+- raw request bytes or JSON-compatible payloads, plus extra option values
+
+Outputs:
+- quoted ETag strings and 304 / 412 responses
+"""
+
+import hashlib
+import json
+from datetime import date
+from typing import Any, Iterable
+
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def payload_digest(payload: Any) -> str:
+    """Stable digest of a JSON-compatible payload (key order independent)."""
+    if isinstance(payload, (bytes, bytearray)):
+        data = bytes(payload)
+    else:
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def compute_etag(digest: str, *options: Any, as_of: date = None) -> str:
+    """Quoted ETag for a payload digest, request options and the as-of date."""
+    if not isinstance(digest, str) or not digest:
+        raise ValueError("compute_etag needs a payload digest")
+    as_of = as_of or date.today()
+    material = "|".join([digest, as_of.isoformat(), *(json.dumps(o, sort_keys=True, default=str) for o in options)])
+    return '"' + hashlib.sha256(material.encode("utf-8")).hexdigest()[:40] + '"'
+
+
+def _candidate_tags(header: str) -> Iterable[str]:
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            # GZipMiddleware weakens ETags on compressed responses
+            tag = tag[2:]
+        if tag:
+            yield tag
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True when If-None-Match lists `etag` (or '*')."""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    return any(tag == "*" or tag == etag for tag in _candidate_tags(header))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def precondition_failed(etag: str) -> Response:
+    return Response(status=status.HTTP_412_PRECONDITION_FAILED, headers={"ETag": etag})
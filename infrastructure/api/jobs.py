@@ -0,0 +1,189 @@
+"""
+Background jobs for oversized API requests.
+
+Admission control for expensive requests: the cost of an analyze payload is
+estimated from its task and dependency-edge counts; requests above
+settings.TASK_JOB_COST_THRESHOLD are queued on a local thread pool and the
+client polls the job instead of holding a worker until the analysis is done.
+
+Settings:
+- TASK_JOB_COST_THRESHOLD: estimated cost above which requests are queued
+  (0, the default, disables background jobs)
+- TASK_JOB_WORKERS: threads running jobs
+- TASK_JOB_MAX_QUEUED: jobs allowed to wait for a thread; beyond that new
+  jobs are refused (QueueFull)
+- TASK_JOB_RESULT_TTL: seconds finished jobs are kept for polling
+
+Job states: queued -> running -> done | failed; queued or running jobs can be
+cancelled. A running job cannot be interrupted, so cancelling it only
+discards its result.
+
+Jobs live in the memory of the process that accepted them: polls reaching
+another process get 404 and a recycled process loses its queue. Enable them
+only with a single long-lived server process; gunicorn.conf.py runs one
+threaded worker without max_requests recycling when the threshold is set.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class QueueFull(Exception):
+    """Raised when the job queue is at TASK_JOB_MAX_QUEUED."""
+
+
+def estimate_request_cost(tasks: Any) -> int:
+    """Tasks plus declared dependency edges; non-list input counts as 0."""
+    if not isinstance(tasks, list):
+        return 0
+    cost = len(tasks)
+    for task in tasks:
+        if isinstance(task, dict):
+            deps = task.get("dependencies")
+            if isinstance(deps, list):
+                cost += len(deps)
+    return cost
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    cost: int
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    http_status: Optional[int] = None
+    result: Any = None
+    future: Any = None
+
+    def describe(self, include_result: bool = True) -> Dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "cost": self.cost,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result and self.status in ("done", "failed"):
+            data["http_status"] = self.http_status
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+
+    def __init__(self, workers: int = 2, max_queued: int = 8, result_ttl: float = 600.0):
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="task-job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def queued_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status == "queued")
+
+    def submit(self, kind: str, cost: int, fn: Callable[[], tuple]) -> Job:
+        """
+        Queue `fn`, which returns (http_status, body). Raises QueueFull when
+        max_queued jobs are already waiting.
+        """
+        with self._lock:
+            self._expire()
+            waiting = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if waiting >= self.max_queued:
+                raise QueueFull(f"{waiting} job(s) already queued")
+            job = Job(id=uuid.uuid4().hex, kind=kind, cost=cost)
+            self._jobs[job.id] = job
+            job.future = self._executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: Job, fn: Callable[[], tuple]) -> None:
+        with self._lock:
+            if job.status != "queued":
+                return
+            job.status = "running"
+            job.started_at = time.time()
+        try:
+            http_status, body = fn()
+        except Exception as exc:
+            http_status, body = 500, {"error": "job_failed", "details": str(exc)}
+        with self._lock:
+            job.finished_at = time.time()
+            if job.status == "cancelled":
+                return
+            job.http_status = http_status
+            job.result = body
+            job.status = "done" if http_status < 400 else "failed"
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued or running job; finished jobs are left as they are."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in ("queued", "running"):
+                return job
+            if job.status == "queued":
+                job.future.cancel()
+                job.finished_at = time.time()
+            job.status = "cancelled"
+            return job
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_MANAGER: Optional[JobManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def cost_threshold() -> int:
+    from django.conf import settings
+
+    return int(getattr(settings, "TASK_JOB_COST_THRESHOLD", 0))
+
+
+def get_job_manager() -> JobManager:
+    """Process-wide manager, created from settings on first use."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            from django.conf import settings
+
+            _MANAGER = JobManager(
+                workers=int(getattr(settings, "TASK_JOB_WORKERS", 2)),
+                max_queued=int(getattr(settings, "TASK_JOB_MAX_QUEUED", 8)),
+                result_ttl=float(getattr(settings, "TASK_JOB_RESULT_TTL", 600)),
+            )
+        return _MANAGER
+
+
+def reset_job_manager() -> None:
+    """Drop the process-wide manager after its jobs finish (settings changes, tests)."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        manager, _MANAGER = _MANAGER, None
+    if manager is not None:
+        manager.shutdown()
@@ -0,0 +1,218 @@
+"""
+Live ranking updates for server-sent event subscribers.
+
+Views that change a project's tasks (analyze, suggest seeding, diff) call
+publish(project, tasks, config). When the project has subscribers, the
+ranking is recomputed once on a background thread and the resulting diff is
+pushed to every subscriber; publishes that arrive while a computation runs
+are coalesced into one follow-up computation.
+
+Payloads are only kept while a project has subscribers: publishes to a
+project nobody watches are dropped, and a project's payload and ranking are
+released when its last subscriber leaves. Until the first subscriber of the
+process arrives (never under WSGI, where the stream endpoint answers 501)
+publish_tasks returns without touching the broadcaster at all. This keeps
+client payloads out of memory as TASK_PAYLOAD_CACHE_MODE=none promises.
+
+Events (see infrastructure.api.views.live_view for the wire format):
+- snapshot: current top-K on subscribe when the project is already ranked
+  (it has other subscribers), after the first publish otherwise, and after
+  a subscriber fell behind
+- ranking: diff_rankings output; only sent when something changed for the
+  subscriber's top_k / rank_threshold
+- error: the ranking could not be computed
+
+Subscribers live in the process that accepted them; publishes must reach
+the same process (a single ASGI worker process, or sticky routing).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from application.services.ranking_diff_service import compact_ranking, diff_rankings
+
+DEFAULT_PROJECT = "default"
+
+# queued in place of events a slow subscriber missed; answered with a snapshot
+RESYNC = ("resync", None, None)
+
+
+class Subscriber:
+    """One open stream: an asyncio queue fed from the publishing thread."""
+
+    def __init__(self, project: str, loop, top_k: int, rank_threshold: int, queue_size: int = 16):
+        self.project = project
+        self.loop = loop
+        self.top_k = top_k
+        self.rank_threshold = rank_threshold
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, event: Tuple) -> None:
+        """Queue an event (call on self.loop); a full queue is replaced by RESYNC."""
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = RESYNC
+        self.queue.put_nowait(event)
+
+    def deliver(self, event: Tuple) -> None:
+        """Thread-safe offer."""
+        try:
+            self.loop.call_soon_threadsafe(self.offer, event)
+        except RuntimeError:
+            # the subscriber's loop is closed; it will unsubscribe itself
+            pass
+
+
+class _Channel:
+    __slots__ = ("payload", "ranking", "version", "subscribers", "dirty", "pending")
+
+    def __init__(self):
+        self.payload: Optional[Tuple[List, Dict]] = None
+        self.ranking: Optional[Dict] = None
+        self.version = 0
+        self.subscribers: Set[Subscriber] = set()
+        self.dirty = False
+        self.pending = False
+
+
+def _counts(ranking: Dict) -> Dict:
+    return {"task_count": len(ranking["ranks"]), "blocked_count": len(ranking["blocked"])}
+
+
+class RankingBroadcaster:
+
+    def __init__(self):
+        # only projects with subscribers have a channel
+        self._channels: Dict[str, _Channel] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-ranking")
+
+    def _schedule(self, project: str, channel: _Channel) -> None:
+        """Mark the channel dirty and start a computation unless one is running (lock held)."""
+        channel.dirty = True
+        if not channel.pending:
+            channel.pending = True
+            self._executor.submit(self._recompute, project, channel)
+
+    def publish(self, project: str, tasks: List, config: Optional[Dict] = None) -> None:
+        with self._lock:
+            channel = self._channels.get(project)
+            if channel is None:
+                return
+            channel.payload = (list(tasks), dict(config or {}))
+            self._schedule(project, channel)
+
+    def subscribe(self, project: str, loop, top_k: int = 10, rank_threshold: int = 5) -> Subscriber:
+        subscriber = Subscriber(project, loop, top_k, rank_threshold)
+        with self._lock:
+            channel = self._channels.get(project)
+            if channel is None:
+                channel = self._channels[project] = _Channel()
+            channel.subscribers.add(subscriber)
+            if channel.ranking is not None:
+                subscriber.offer(self._snapshot(channel, subscriber))
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            channel = self._channels.get(subscriber.project)
+            if channel is not None:
+                channel.subscribers.discard(subscriber)
+                if not channel.subscribers:
+                    # an in-flight computation still holds the channel; its
+                    # result reaches nobody and is dropped with it
+                    del self._channels[subscriber.project]
+
+    def snapshot(self, subscriber: Subscriber) -> Optional[Tuple]:
+        with self._lock:
+            channel = self._channels.get(subscriber.project)
+            if channel is None or channel.ranking is None:
+                return None
+            return self._snapshot(channel, subscriber)
+
+    @staticmethod
+    def _snapshot(channel: _Channel, subscriber: Subscriber) -> Tuple:
+        top = diff_rankings(None, channel.ranking, top_k=subscriber.top_k)["top"]
+        return ("snapshot", channel.version, {"top": top, **_counts(channel.ranking)})
+
+    def _recompute(self, project: str, channel: _Channel) -> None:
+        while True:
+            with self._lock:
+                if not channel.dirty:
+                    channel.pending = False
+                    return
+                channel.dirty = False
+                tasks, config = channel.payload
+
+            try:
+                current = compact_ranking(tasks, config)
+            except Exception as exc:
+                with self._lock:
+                    subscribers = list(channel.subscribers)
+                for subscriber in subscribers:
+                    subscriber.deliver(("error", None, {"error": "ranking_failed", "details": str(exc)}))
+                continue
+
+            with self._lock:
+                previous, channel.ranking = channel.ranking, current
+                channel.version += 1
+                version = channel.version
+                subscribers = list(channel.subscribers)
+            self._fan_out(previous, current, version, subscribers)
+
+    @staticmethod
+    def _fan_out(previous: Optional[Dict], current: Dict, version: int, subscribers: List[Subscriber]) -> None:
+        """One diff per distinct (top_k, rank_threshold), shared by its subscribers."""
+        events: Dict[Tuple[int, int], Optional[Tuple]] = {}
+        for subscriber in subscribers:
+            params = (subscriber.top_k, subscriber.rank_threshold)
+            if params not in events:
+                diff = diff_rankings(previous, current, top_k=params[0], rank_threshold=params[1])
+                if previous is None:
+                    events[params] = ("snapshot", version, {"top": diff["top"], **_counts(current)})
+                else:
+                    previous_top = diff_rankings(None, previous, top_k=params[0])["top"]
+                    changed = diff["top"] != previous_top or any(
+                        value for key, value in diff.items() if key not in ("baseline", "top")
+                    )
+                    events[params] = ("ranking", version, {**diff, **_counts(current)}) if changed else None
+            if events[params] is not None:
+                subscriber.deliver(events[params])
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_BROADCASTER: Optional[RankingBroadcaster] = None
+_BROADCASTER_LOCK = threading.Lock()
+
+
+def get_broadcaster() -> RankingBroadcaster:
+    """Process-wide broadcaster, created by the first stream subscription."""
+    global _BROADCASTER
+    with _BROADCASTER_LOCK:
+        if _BROADCASTER is None:
+            _BROADCASTER = RankingBroadcaster()
+        return _BROADCASTER
+
+
+def reset_broadcaster() -> None:
+    """Drop the process-wide broadcaster (settings changes, tests)."""
+    global _BROADCASTER
+    with _BROADCASTER_LOCK:
+        broadcaster, _BROADCASTER = _BROADCASTER, None
+    if broadcaster is not None:
+        broadcaster.shutdown()
+
+
+def publish_tasks(project: Optional[str], tasks: List, config: Optional[Dict] = None) -> None:
+    """
+    Publish a project's new task list (project None means DEFAULT_PROJECT).
+    A no-op until a stream subscribed in this process.
+    """
+    broadcaster = _BROADCASTER
+    if broadcaster is not None:
+        broadcaster.publish(project or DEFAULT_PROJECT, tasks, config)
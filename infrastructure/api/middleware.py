@@ -0,0 +1,19 @@
+"""
+HTTP middleware for the Tasks API.
+
+GZipMiddleware: Django's gzip compression, except for server-sent event
+streams. Compressed event streams are held back by proxies and browsers
+until a gzip block fills up, which defeats live updates; they go out as
+plain text/event-stream instead.
+"""
+
+from django.middleware.gzip import GZipMiddleware as DjangoGZipMiddleware
+
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+class GZipMiddleware(DjangoGZipMiddleware):
+    def process_response(self, request, response):
+        if response.get("Content-Type", "").split(";")[0].strip() in UNCOMPRESSED_TYPES:
+            return response
+        return super().process_response(request, response)
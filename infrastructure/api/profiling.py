@@ -0,0 +1,200 @@
+"""
+On-demand profiling of single API requests.
+
+A request carrying `X-Profile-Token: <settings.TASK_PROFILING_TOKEN>` runs
+under cProfile; adding `X-Profile-Memory: 1` also traces allocations with
+tracemalloc. The profile is saved to a ring buffer on disk and its id is
+returned in the `X-Profile-Id` response header. Requests without the header
+only pay for one header lookup.
+
+Settings:
+- TASK_PROFILING_TOKEN: shared secret; empty disables profiling
+- TASK_PROFILE_DIR: directory of the ring buffer
+- TASK_PROFILE_KEEP: profiles kept; the oldest are deleted first
+
+Each profile is a pair of files: "<id>.prof" (pstats format, open with
+`python -m pstats` or snakeviz) and "<id>.json" (request details, the
+slowest functions and, with memory tracing, the peak and top allocation sites).
+"""
+
+import cProfile
+import functools
+import hmac
+import io
+import json
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Dict, List, Optional
+
+from rest_framework import status
+from rest_framework.response import Response
+
+TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+MEMORY_HEADER = "HTTP_X_PROFILE_MEMORY"
+
+_PROFILE_ID = re.compile(r"^[0-9]+-[0-9a-f]{8}$")
+# cProfile and tracemalloc are process-wide: one profiled request at a time
+_CAPTURE_LOCK = threading.Lock()
+_STORE_LOCK = threading.Lock()
+
+
+def _settings():
+    from django.conf import settings
+
+    return (
+        getattr(settings, "TASK_PROFILING_TOKEN", ""),
+        getattr(settings, "TASK_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "task-profiles")),
+        int(getattr(settings, "TASK_PROFILE_KEEP", 20)),
+    )
+
+
+def token_valid(request) -> bool:
+    """True when profiling is enabled and the request carries its token."""
+    token = _settings()[0]
+    supplied = request.META.get(TOKEN_HEADER, "")
+    return bool(token) and hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8"))
+
+
+def forbidden() -> Response:
+    return Response({"error": "profiling_forbidden"}, status=status.HTTP_403_FORBIDDEN)
+
+
+class ProfileStore:
+    """Ring buffer of saved profiles in one directory."""
+
+    def __init__(self, directory: str, keep: int = 20):
+        self.directory = directory
+        self.keep = max(keep, 1)
+
+    def _path(self, profile_id: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.{suffix}")
+
+    def ids(self) -> List[str]:
+        """Saved profile ids, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        ids = [name[:-5] for name in names if name.endswith(".json") and _PROFILE_ID.match(name[:-5])]
+        return sorted(ids, key=lambda pid: int(pid.split("-")[0]))
+
+    def save(self, profiler: cProfile.Profile, meta: Dict) -> str:
+        profile_id = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        with _STORE_LOCK:
+            os.makedirs(self.directory, exist_ok=True)
+            profiler.dump_stats(self._path(profile_id, "prof"))
+            # metadata last: a profile is listed only once both files exist
+            with open(self._path(profile_id, "json"), "w", encoding="utf-8") as fh:
+                json.dump({"id": profile_id, **meta}, fh, default=str)
+            for old in self.ids()[:-self.keep]:
+                for suffix in ("json", "prof"):
+                    try:
+                        os.remove(self._path(old, suffix))
+                    except FileNotFoundError:
+                        pass
+        return profile_id
+
+    def meta(self, profile_id: str) -> Optional[Dict]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        try:
+            with open(self._path(profile_id, "json"), encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return None
+
+    def profile_path(self, profile_id: str) -> Optional[str]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = self._path(profile_id, "prof")
+        return path if os.path.exists(path) else None
+
+
+def get_profile_store() -> ProfileStore:
+    _, directory, keep = _settings()
+    return ProfileStore(directory, keep)
+
+
+def _top_functions(profiler: cProfile.Profile, limit: int = 25) -> List[Dict]:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "total_s": round(total, 6),
+            "cumulative_s": round(cumulative, 6),
+        }
+        for (filename, line, name), (_, calls, total, cumulative, _) in rows
+    ]
+
+
+def _allocation_stats(snapshot, peak: int, limit: int = 25) -> Dict:
+    top = snapshot.statistics("lineno")[:limit]
+    return {
+        "peak_bytes": peak,
+        "top": [
+            {"site": str(stat.traceback[0]), "size_bytes": stat.size, "count": stat.count}
+            for stat in top
+        ],
+    }
+
+
+def profiled(kind: str):
+    """
+    Decorator for APIView handlers: profile the call when the request opts in
+    (see module docstring). A wrong or disabled token gets 403. Inside the
+    call `request.profiling` is True so handlers can stay synchronous.
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            if TOKEN_HEADER not in request.META:
+                return handler(view, request, *args, **kwargs)
+            if not token_valid(request):
+                return forbidden()
+
+            trace_memory = request.META.get(MEMORY_HEADER, "") in ("1", "true", "yes")
+            request.profiling = True
+            with _CAPTURE_LOCK:
+                started_tracing = trace_memory and not tracemalloc.is_tracing()
+                if started_tracing:
+                    tracemalloc.start()
+                if trace_memory:
+                    tracemalloc.reset_peak()
+                profiler = cProfile.Profile()
+                started = time.perf_counter()
+                try:
+                    response = profiler.runcall(handler, view, request, *args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    allocations = None
+                    if trace_memory:
+                        allocations = _allocation_stats(tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+                    if started_tracing:
+                        tracemalloc.stop()
+
+            profile_id = get_profile_store().save(profiler, {
+                "kind": kind,
+                "method": request.method,
+                "path": request.path,
+                "created_at": time.time(),
+                "duration_s": round(elapsed, 6),
+                "status": response.status_code,
+                "request_bytes": int(request.META.get("CONTENT_LENGTH") or 0),
+                "top_functions": _top_functions(profiler),
+                "allocations": allocations,
+            })
+            response["X-Profile-Id"] = profile_id
+            return response
+
+        return wrapper
+
+    return decorator
@@ -30,6 +30,9 @@ class SingleTaskSerializer(serializers.Serializer):
       - estimated_hours: optional float
       - importance: optional integer
       - dependencies: optional list of strings
+
+    Any other keys are passed through unchanged so they can be echoed under
+    "raw" or selected via passthrough_fields.
     """
     id = serializers.CharField(required=False, allow_null=True, allow_blank=True)
     title = serializers.CharField(required=False, allow_null=True, allow_blank=True)
@@ -42,6 +45,14 @@ class SingleTaskSerializer(serializers.Serializer):
         allow_empty=True
     )
 
+    def to_internal_value(self, data):
+        validated = super().to_internal_value(data)
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key not in self.fields:
+                    validated[key] = value
+        return validated
+
 
 class AnalyzePayloadSerializer(serializers.Serializer):
     """
@@ -55,3 +66,103 @@ class AnalyzePayloadSerializer(serializers.Serializer):
     """
     tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
     config = serializers.DictField(required=False)
+
+
+class SweepPayloadSerializer(serializers.Serializer):
+    """
+    Serializer for weight sweep request payload.
+
+    Expected top level shape:
+    {
+      "tasks": [ { ... } ],
+      "weight_sets": [ { "weight_urgency": 2.0, ... }, ... ],
+      "config": { optional base overrides },
+      "top_k": 10
+    }
+    """
+    tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
+    weight_sets = serializers.ListField(
+        child=serializers.DictField(child=serializers.FloatField()),
+        allow_empty=False,
+        max_length=200
+    )
+    config = serializers.DictField(required=False)
+    top_k = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=10)
+
+
+class SchedulePayloadSerializer(serializers.Serializer):
+    """
+    Serializer for multi-day schedule request payload.
+
+    Expected top level shape:
+    {
+      "tasks": [ { ... } ],
+      "config": { optional overrides },
+      "daily_hours": 8 or [8, 8, 8, 8, 8, 0, 0],
+      "start_date": "YYYY-MM-DD",
+      "horizon_days": 365
+    }
+    """
+    tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
+    config = serializers.DictField(required=False)
+    daily_hours = serializers.JSONField(required=False, default=8.0)
+    start_date = serializers.DateField(required=False)
+    horizon_days = serializers.IntegerField(required=False, min_value=1, max_value=3650, default=365)
+
+
+class SimulatePayloadSerializer(serializers.Serializer):
+    """
+    Serializer for multi-worker dispatch simulation payload.
+
+    Expected top level shape:
+    {
+      "tasks": [ { ... } ],
+      "config": { optional overrides },
+      "workers": 3,
+      "daily_hours": 8 or [8, 8, 8, 8, 8, 0, 0],
+      "start_date": "YYYY-MM-DD"
+    }
+    """
+    tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
+    config = serializers.DictField(required=False)
+    workers = serializers.IntegerField(required=False, min_value=1, max_value=500, default=2)
+    daily_hours = serializers.JSONField(required=False, default=8.0)
+    start_date = serializers.DateField(required=False)
+
+
+class ProjectionPayloadSerializer(serializers.Serializer):
+    """
+    Serializer for score projection request payload.
+
+    Expected top level shape:
+    {
+      "tasks": [ { ... } ],
+      "config": { optional overrides },
+      "days": 14,
+      "top_k": 10
+    }
+    """
+    tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
+    config = serializers.DictField(required=False)
+    days = serializers.IntegerField(required=False, min_value=1, max_value=365, default=14)
+    top_k = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=10)
+
+
+class RankingDiffPayloadSerializer(serializers.Serializer):
+    """
+    Serializer for ranking diff request payload.
+
+    Expected top level shape:
+    {
+      "project": "project or session key",
+      "tasks": [ { ... } ],
+      "config": { optional overrides },
+      "top_k": 10,
+      "rank_threshold": 5
+    }
+    """
+    project = serializers.CharField(required=True, max_length=200)
+    tasks = serializers.ListSerializer(child=SingleTaskSerializer(), required=True)
+    config = serializers.DictField(required=False)
+    top_k = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=10)
+    rank_threshold = serializers.IntegerField(required=False, min_value=1, default=5)
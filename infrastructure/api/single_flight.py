@@ -0,0 +1,199 @@
+"""
+Coalescing of identical concurrent requests.
+
+When many clients send the same analyze or suggest request at once (a shared
+dashboard opening), only the first one computes; requests with the same key
+that arrive while it runs wait for it and share its result (or exception).
+Nothing is cached: once the computation finishes, the next request with that
+key computes again.
+
+Keys are canonical hashes of everything that changes the answer: the
+payload digest (key-order independent), the request options and today's
+date (see http_cache.compute_etag).
+
+Both paths share one table of in-flight calls:
+- do(key, fn) from synchronous views (waiters block their thread)
+- await do_async(key, fn) from async views (the leader runs fn in a worker
+  thread; waiters await without blocking the event loop)
+
+Under ASGI, Django runs synchronous views one at a time on a single thread,
+so identical requests would never overlap there. async_coalesced() wraps a
+synchronous view in an async entry point that coalesces on do_async and
+runs the view itself in a worker thread; the API routes use it for analyze
+and suggest when TASK_ASYNC_VIEWS is on (set by task_analyzer/asgi.py).
+
+Settings:
+- TASK_COALESCE_REQUESTS: set to false to run every request on its own
+- TASK_ASYNC_VIEWS: route analyze and suggest through async_coalesced
+
+Coalescing is per process; identical requests on different workers still
+compute once each.
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "shared", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.shared = 0
+        # (loop, future) of async waiters, resolved on their own loops
+        self.waiters: List[Tuple[Any, "asyncio.Future"]] = []
+
+
+def _resolve(future: "asyncio.Future", call: _Call) -> None:
+    if future.done():
+        return
+    if call.error is not None:
+        future.set_exception(call.error)
+    else:
+        future.set_result(call.result)
+
+
+class SingleFlight:
+    """In-flight calls by key; see module docstring."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def _join(self, key: str) -> Tuple[_Call, bool]:
+        """The call for `key` and whether the caller leads it (lock held by caller)."""
+        call = self._calls.get(key)
+        if call is not None:
+            call.shared += 1
+            return call, False
+        call = self._calls[key] = _Call()
+        return call, True
+
+    def _finish(self, key: str, call: _Call) -> None:
+        with self._lock:
+            del self._calls[key]
+            waiters, call.waiters = call.waiters, []
+        call.done.set()
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, call)
+            except RuntimeError:
+                # the waiter's loop is closed
+                pass
+
+    def _run(self, key: str, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+        finally:
+            self._finish(key, call)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn, or wait for the identical call already running.
+
+        Output:
+            tuple(result, shared); shared is True when another caller computed it
+        """
+        with self._lock:
+            call, leader = self._join(key)
+        if leader:
+            self._run(key, call, fn)
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
+
+    async def do_async(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Awaitable do(); fn (synchronous) runs in a worker thread when leading."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call, leader = self._join(key)
+            if not leader:
+                future = loop.create_future()
+                call.waiters.append((loop, future))
+        if leader:
+            await asyncio.to_thread(self._run, key, call, fn)
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+        return await future, True
+
+
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Process-wide SingleFlight, or None when TASK_COALESCE_REQUESTS is off."""
+    from django.conf import settings
+
+    return _SINGLE_FLIGHT if getattr(settings, "TASK_COALESCE_REQUESTS", True) else None
+
+
+def coalesce(key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+    """do(key, fn) on the process-wide SingleFlight; runs fn directly when disabled."""
+    flight = get_single_flight()
+    if flight is None:
+        return fn(), False
+    return flight.do(key, fn)
+
+
+async def coalesce_async(key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+    """Async coalesce(); fn runs in a worker thread."""
+    flight = get_single_flight()
+    if flight is None:
+        return await asyncio.to_thread(fn), False
+    return await flight.do_async(key, fn)
+
+
+def _snapshot(response) -> Tuple[bytes, int, list]:
+    """Rendered body, status and headers, taken before middleware touches the response."""
+    if hasattr(response, "render"):
+        response.render()
+    return response.content, response.status_code, list(response.items())
+
+
+def async_coalesced(view: Callable, key_for: Callable) -> Callable:
+    """
+    Async entry point for a synchronous view (see module docstring).
+
+    key_for(request) returns the coalescing key of a raw Django request, or
+    None to run the view on its own. Requests that waited get a copy of the
+    leader's rendered response with X-Coalesced: 1.
+    """
+
+    @functools.wraps(view)
+    async def handler(request, *args, **kwargs):
+        # keys hash the payload: keep that off the event loop too
+        key = await sync_to_async(key_for, thread_sensitive=False)(request)
+        if key is None:
+            return await sync_to_async(view)(request, *args, **kwargs)
+
+        def run():
+            response = view(request, *args, **kwargs)
+            return response, _snapshot(response)
+
+        # own namespace, so the view's inner coalesce() never waits on itself
+        (response, (content, status, headers)), shared = await coalesce_async("async|" + key, run)
+        if not shared:
+            return response
+        copy = HttpResponse(content, status=status)
+        for header, value in headers:
+            copy[header] = value
+        copy["X-Coalesced"] = "1"
+        return copy
+
+    return handler
@@ -1,18 +1,111 @@
-"""Lightweight shared state for API interactions."""
+"""
+Lightweight shared state for API interactions.
 
-from typing import Any, List, Optional
+The cached payload is kept according to settings.TASK_PAYLOAD_CACHE_MODE:
+- "full" (default): the task list itself
+- "compact": zlib-compressed canonical JSON, decoded only when a request
+  actually needs the tasks (not for a 304)
+- "none": nothing is retained once the request finishes
 
-_LAST_ANALYZED_PAYLOAD: Optional[List[Any]] = None
+The previous ranking of each project (see the diff endpoint) is kept in a
+small LRU bounded by settings.TASK_RANKING_HISTORY_SIZE.
+"""
+
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from infrastructure.api.http_cache import payload_digest
+
+CACHE_MODES = ("full", "compact", "none")
+
+
+class CachedTasks(NamedTuple):
+    """
+    One seeded payload. The digest is read without decoding, so conditional
+    requests never pay for decompression; tasks() decodes on demand.
+    """
+
+    digest: str
+    count: int
+    payload: Optional[List[Any]] = None
+    compact: Optional[bytes] = None
+
+    def tasks(self) -> List[Any]:
+        if self.compact is not None:
+            return json.loads(zlib.decompress(self.compact))
+        return self.payload
+
+
+# replaced as a whole, so readers never see one payload's digest with
+# another payload's tasks
+_LAST_ANALYZED: Optional[CachedTasks] = None
+
+_RANKINGS: "OrderedDict[str, Dict]" = OrderedDict()
+_RANKINGS_LOCK = threading.Lock()
+
+
+def _cache_mode() -> str:
+    from django.conf import settings
+
+    mode = getattr(settings, "TASK_PAYLOAD_CACHE_MODE", "full")
+    return mode if mode in CACHE_MODES else "full"
 
 
 def set_last_analyzed_payload(tasks: List[Any]) -> None:
     """Persist the last analyzed tasks payload in memory."""
 
-    global _LAST_ANALYZED_PAYLOAD
-    _LAST_ANALYZED_PAYLOAD = list(tasks) if tasks is not None else None
+    global _LAST_ANALYZED
+    mode = _cache_mode()
+    if tasks is None or mode == "none":
+        _LAST_ANALYZED = None
+    elif mode == "compact":
+        encoded = json.dumps(list(tasks), sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        _LAST_ANALYZED = CachedTasks(payload_digest(encoded), len(tasks), compact=zlib.compress(encoded, 6))
+    else:
+        payload = list(tasks)
+        # digest once per seed so conditional GETs never re-hash the payload
+        _LAST_ANALYZED = CachedTasks(payload_digest(payload), len(payload), payload=payload)
+
+
+def get_last_analyzed() -> Optional[CachedTasks]:
+    """The cached payload snapshot, if any (see CachedTasks)."""
+
+    return _LAST_ANALYZED
 
 
 def get_last_analyzed_payload() -> Optional[List[Any]]:
     """Retrieve the cached tasks payload, if any."""
 
-    return _LAST_ANALYZED_PAYLOAD
+    cached = _LAST_ANALYZED
+    return cached.tasks() if cached is not None else None
+
+
+def get_last_analyzed_digest() -> Optional[str]:
+    """Digest of the cached tasks payload, if any."""
+
+    cached = _LAST_ANALYZED
+    return cached.digest if cached is not None else None
+
+
+def swap_project_ranking(project: str, ranking: Dict) -> Optional[Dict]:
+    """Store a project's ranking and return the one it replaces, if any."""
+
+    from django.conf import settings
+
+    limit = max(int(getattr(settings, "TASK_RANKING_HISTORY_SIZE", 256)), 1)
+    with _RANKINGS_LOCK:
+        previous = _RANKINGS.pop(project, None)
+        _RANKINGS[project] = ranking
+        while len(_RANKINGS) > limit:
+            _RANKINGS.popitem(last=False)
+    return previous
+
+
+def clear_project_rankings() -> None:
+    """Forget every stored project ranking."""
+
+    with _RANKINGS_LOCK:
+        _RANKINGS.clear()
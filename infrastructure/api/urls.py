@@ -5,13 +5,49 @@ Routes:
 - POST /api/tasks/analyze/ -> AnalyzeView.post
 - GET  /api/tasks/suggest/  -> SuggestView.get
 - POST /api/tasks/suggest/ -> SuggestView.post (cache update)
+- POST /api/tasks/sweep/   -> SweepView.post (what-if weight sweep)
+- POST /api/tasks/schedule/ -> ScheduleView.post (multi-day capacity plan)
+- POST /api/tasks/projection/ -> ProjectionView.post (score trajectory)
+- POST /api/tasks/simulate/ -> SimulateView.post (multi-worker dispatch)
+- POST /api/tasks/diff/ -> RankingDiffView.post (changes since the previous ranking)
+- GET  /api/tasks/jobs/<id>/ -> JobView.get (background job status/result)
+- DELETE /api/tasks/jobs/<id>/ -> JobView.delete (cancel)
+- GET  /api/tasks/live/<project>/ -> live_rankings_view (server-sent events, ASGI)
+- GET  /api/tasks/profiles/ -> ProfileListView.get (saved request profiles)
+- GET  /api/tasks/profiles/<id>/ -> ProfileDetailView.get (download)
 """
 
+from django.conf import settings
 from django.urls import path, include # pyright: ignore[reportMissingModuleSource]
-from infrastructure.api.views.analyze_view import AnalyzeView
-from infrastructure.api.views.suggest_view import SuggestView
+from infrastructure.api.single_flight import async_coalesced
+from infrastructure.api.views.analyze_view import AnalyzeView, analyze_coalesce_key
+from infrastructure.api.views.suggest_view import SuggestView, suggest_coalesce_key
+from infrastructure.api.views.sweep_view import SweepView
+from infrastructure.api.views.schedule_view import ScheduleView
+from infrastructure.api.views.projection_view import ProjectionView
+from infrastructure.api.views.simulate_view import SimulateView
+from infrastructure.api.views.jobs_view import JobView
+from infrastructure.api.views.diff_view import RankingDiffView
+from infrastructure.api.views.profiles_view import ProfileDetailView, ProfileListView
+from infrastructure.api.views.live_view import live_rankings_view
+
+analyze_view = AnalyzeView.as_view()
+suggest_view = SuggestView.as_view()
+if getattr(settings, "TASK_ASYNC_VIEWS", False):
+    # under ASGI: coalesce identical requests (see single_flight)
+    analyze_view = async_coalesced(analyze_view, analyze_coalesce_key)
+    suggest_view = async_coalesced(suggest_view, suggest_coalesce_key)
 
 urlpatterns = [
-    path("analyze/", AnalyzeView.as_view(), name="api-tasks-analyze"),
-    path("suggest/", SuggestView.as_view(), name="api-tasks-suggest"),
+    path("analyze/", analyze_view, name="api-tasks-analyze"),
+    path("suggest/", suggest_view, name="api-tasks-suggest"),
+    path("sweep/", SweepView.as_view(), name="api-tasks-sweep"),
+    path("schedule/", ScheduleView.as_view(), name="api-tasks-schedule"),
+    path("projection/", ProjectionView.as_view(), name="api-tasks-projection"),
+    path("simulate/", SimulateView.as_view(), name="api-tasks-simulate"),
+    path("diff/", RankingDiffView.as_view(), name="api-tasks-diff"),
+    path("jobs/<str:job_id>/", JobView.as_view(), name="api-tasks-job"),
+    path("live/<str:project>/", live_rankings_view, name="api-tasks-live"),
+    path("profiles/", ProfileListView.as_view(), name="api-tasks-profiles"),
+    path("profiles/<str:profile_id>/", ProfileDetailView.as_view(), name="api-tasks-profile"),
 ]
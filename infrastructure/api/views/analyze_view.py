@@ -14,13 +14,23 @@ Outputs:
 - HTTP JSON response with analysis results or validation/error details
 """
 
+import json
+
+from django.urls import reverse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
 from infrastructure.api.serializers.task_serializer import AnalyzePayloadSerializer
 from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.config_service import InvalidConfig
+from core.validators.task_validator import ValidationBudgetExceeded
 from infrastructure.api.state import set_last_analyzed_payload
+from infrastructure.api.http_cache import compute_etag, etag_matches, payload_digest, precondition_failed
+from infrastructure.api.jobs import QueueFull, cost_threshold, estimate_request_cost, get_job_manager
+from infrastructure.api.live import publish_tasks
+from infrastructure.api.profiling import TOKEN_HEADER, profiled
+from infrastructure.api.single_flight import coalesce
 
 
 class AnalyzeView(APIView):
@@ -39,29 +49,129 @@ class AnalyzeView(APIView):
       "blocked_tasks": [...],
       "needs_attention": [...],
       "warnings": [...],
+      "facets": { ... },          (only with config "facets")
       "config_used": { ... }
     }
+
+    The response carries an ETag derived from the canonical request payload
+    (key order and whitespace ignored) and today's date. As this is a POST, a
+    request whose If-None-Match names it gets 412 Precondition Failed without
+    analysis; its tasks still reseed the suggest cache and live subscribers.
+
+    Requests whose estimated cost (tasks + dependency edges) exceeds
+    TASK_JOB_COST_THRESHOLD are queued as background jobs: the response is
+    202 with the job id and a status URL to poll (503 when the queue is full).
+
+    The analyzed tasks are published to live ranking subscribers of the
+    `project` query param (default project without it).
+
+    With a valid X-Profile-Token header the request runs synchronously under
+    the profiler (see infrastructure.api.profiling).
+
+    Identical requests (same canonical payload, config and project) that
+    arrive while one is being analyzed share its response, marked with
+    X-Coalesced: 1 (see infrastructure.api.single_flight; under ASGI via
+    analyze_coalesce_key).
     """
 
+    @profiled("analyze")
     def post(self, request):
-        serializer = AnalyzePayloadSerializer(data=request.data)
-        if not serializer.is_valid():
+        data = request.data
+        project = request.query_params.get("project")
+        # one canonical digest for the validator and the coalescing key
+        digest = payload_digest(data)
+        etag = compute_etag(digest, "analyze")
+        if etag_matches(request, etag):
+            serializer = AnalyzePayloadSerializer(data=data)
+            if serializer.is_valid():
+                # the client holds the result, but the tasks are still the
+                # latest ones for cache-backed suggest and live subscribers
+                remember_tasks(serializer.validated_data, project)
+                return precondition_failed(etag)
+        cost = estimate_request_cost(data.get("tasks") if isinstance(data, dict) else None)
+        threshold = cost_threshold()
+        if threshold and cost > threshold and not getattr(request, "profiling", False):
+            try:
+                job = get_job_manager().submit("analyze", cost, lambda: run_analysis(data, project))
+            except QueueFull as exc:
+                return Response(
+                    {"error": "queue_full", "details": str(exc)},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={"Retry-After": "30"},
+                )
+            location = reverse("api-tasks-job", kwargs={"job_id": job.id})
             return Response(
-                {"error": "invalid_payload", "details": serializer.errors},
-                status=status.HTTP_400_BAD_REQUEST
+                {**job.describe(include_result=False), "status_url": location},
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Location": location},
             )
 
-        validated = serializer.validated_data
-        tasks_payload = validated.get("tasks", [])
-        config_overrides = validated.get("config", {})
+        if getattr(request, "profiling", False):
+            # a profile has to cover the computation itself
+            (http_status, body), shared = run_analysis(data, project), False
+        else:
+            key = compute_etag(digest, "analyze", project)
+            (http_status, body), shared = coalesce(key, lambda: run_analysis(data, project))
+        headers = {"ETag": etag} if http_status == status.HTTP_200_OK else {}
+        if shared:
+            headers["X-Coalesced"] = "1"
+        return Response(body, status=http_status, headers=headers)
 
-        try:
-            result = analyze_tasks_service(tasks_payload, config_overrides)
-            set_last_analyzed_payload(tasks_payload)
-            return Response({"results": result}, status=status.HTTP_200_OK)
-        except Exception as exc:
-            # Log the exception in production; return minimal error info here
-            return Response(
-                {"error": "analysis_failed", "details": str(exc)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+
+def analyze_coalesce_key(request):
+    """
+    Coalescing key of a raw (not yet DRF-parsed) analyze request for the
+    async entry point, or None when it must run on its own: conditional,
+    profiled, queued as a job, or not a JSON object.
+    """
+    if request.META.get("HTTP_IF_NONE_MATCH") or request.META.get(TOKEN_HEADER):
+        return None
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    threshold = cost_threshold()
+    if threshold and estimate_request_cost(data.get("tasks")) > threshold:
+        return None
+    return compute_etag(payload_digest(data), "analyze", request.GET.get("project"))
+
+
+def remember_tasks(validated, project=None) -> None:
+    """Seed the suggest cache and publish the tasks to live subscribers of `project`."""
+    tasks_payload = validated.get("tasks", [])
+    set_last_analyzed_payload(tasks_payload)
+    publish_tasks(project, tasks_payload, validated.get("config", {}))
+
+
+def run_analysis(data, project=None):
+    """
+    Validate and analyze one request body; on success the tasks are
+    published to live subscribers of `project`.
+
+    Output:
+        tuple(http_status, response body); shared by the synchronous path
+        and background jobs
+    """
+    serializer = AnalyzePayloadSerializer(data=data)
+    if not serializer.is_valid():
+        return status.HTTP_400_BAD_REQUEST, {"error": "invalid_payload", "details": serializer.errors}
+
+    validated = serializer.validated_data
+    tasks_payload = validated.get("tasks", [])
+    config_overrides = validated.get("config", {})
+
+    try:
+        result = analyze_tasks_service(tasks_payload, config_overrides)
+        remember_tasks(validated, project)
+        return status.HTTP_200_OK, {"results": result}
+    except InvalidConfig as exc:
+        return status.HTTP_400_BAD_REQUEST, {"error": "invalid_config", "details": str(exc)}
+    except ValidationBudgetExceeded as exc:
+        return status.HTTP_422_UNPROCESSABLE_ENTITY, {
+            "error": "validation_failed", "details": str(exc), "issues": exc.issues,
+        }
+    except Exception as exc:
+        # Log the exception in production; return minimal error info here
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, {"error": "analysis_failed", "details": str(exc)}
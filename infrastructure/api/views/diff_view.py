@@ -0,0 +1,91 @@
+"""
+HTTP view adapter for the ranking diff endpoint.
+
+Purpose:
+- receive POST requests with a project key and its current tasks
+- validate HTTP payload using serializers
+- call application service to rank the tasks and diff them against the
+  ranking stored for the project by the previous call
+- return only what changed, and publish the tasks to live subscribers
+
+Inputs:
+- HTTP request with JSON body matching RankingDiffPayloadSerializer
+
+Outputs:
+- HTTP JSON response with the diff or validation/error details
+"""
+
+from functools import partial
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.serializers.task_serializer import RankingDiffPayloadSerializer
+from infrastructure.api.live import publish_tasks
+from infrastructure.api.state import swap_project_ranking
+from application.services.config_service import InvalidConfig
+from application.services.ranking_diff_service import ranking_diff_service
+
+
+class RankingDiffView(APIView):
+    """
+    POST handler for ranking diffs between syncs.
+
+    Request body:
+    {
+      "project": "project or session key",
+      "tasks": [ { task objects } ],
+      "config": { optional config overrides },
+      "top_k": 10,
+      "rank_threshold": 5
+    }
+
+    Response (first call for a project: baseline true, top only):
+    {
+      "baseline": false,
+      "top": ["id", ...],
+      "entered_top": [ { "id": "...", "rank": 2, "previous_rank": 14 } ],
+      "left_top": [ { "id": "...", "rank": 11, "previous_rank": 3 } ],
+      "moved": [ { "id": "...", "previous_rank": 40, "rank": 12, "delta": 28 } ],
+      "newly_blocked": [...],
+      "unblocked": [...],
+      "added": [...],
+      "removed": [...],
+      "new_cycles": [[...]],
+      "resolved_cycles": [[...]],
+      "task_count": 120,
+      "blocked_count": 3
+    }
+    """
+
+    def post(self, request):
+        serializer = RankingDiffPayloadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_payload", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated = serializer.validated_data
+
+        try:
+            result = ranking_diff_service(
+                validated.get("tasks", []),
+                partial(swap_project_ranking, validated["project"]),
+                validated.get("config", {}),
+                top_k=validated["top_k"],
+                rank_threshold=validated["rank_threshold"],
+            )
+            publish_tasks(validated["project"], validated.get("tasks", []), validated.get("config", {}))
+            return Response({"results": result}, status=status.HTTP_200_OK)
+        except InvalidConfig as exc:
+            return Response(
+                {"error": "invalid_config", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as exc:
+            return Response(
+                {"error": "diff_failed", "details": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
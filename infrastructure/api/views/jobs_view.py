@@ -0,0 +1,50 @@
+"""
+HTTP view adapter for background jobs.
+
+Purpose:
+- report the status of a queued analyze request and, once finished, its result
+- cancel a queued or running job
+
+Inputs:
+- job id from the URL (returned by a 202 analyze response)
+
+Outputs:
+- HTTP JSON response with the job description, or 404 for unknown/expired jobs
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.jobs import get_job_manager
+
+
+class JobView(APIView):
+    """
+    GET: job status; finished jobs include "http_status" and "result" (the
+    body the synchronous request would have returned).
+    DELETE: cancel the job (a running job's result is discarded).
+
+    Response:
+    {
+      "job_id": "...",
+      "kind": "analyze",
+      "status": "queued" | "running" | "done" | "failed" | "cancelled",
+      "cost": 123456,
+      "submitted_at": ..., "started_at": ..., "finished_at": ...,
+      "http_status": 200,
+      "result": { "results": { ... } }
+    }
+    """
+
+    def get(self, request, job_id):
+        job = get_job_manager().get(job_id)
+        if job is None:
+            return Response({"error": "job_not_found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job.describe(), status=status.HTTP_200_OK)
+
+    def delete(self, request, job_id):
+        job = get_job_manager().cancel(job_id)
+        if job is None:
+            return Response({"error": "job_not_found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job.describe(include_result=False), status=status.HTTP_200_OK)
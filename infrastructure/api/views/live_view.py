@@ -0,0 +1,128 @@
+"""
+HTTP view adapter for the live ranking stream.
+
+Purpose:
+- subscribe a client to a project's ranking changes as server-sent events
+- replace dashboard polling of the suggest endpoint: the ranking is computed
+  once per change and fanned out to every subscriber
+
+Inputs:
+- project key from the URL; optional top_k and rank_threshold query params
+
+Outputs:
+- text/event-stream response (ASGI only; 501 under WSGI)
+
+Wire format:
+    retry: 3000
+
+    id: 3
+    event: ranking
+    data: {"top": [...], "entered_top": [...], "moved": [...], ...}
+
+Comment lines (": keep-alive") are sent every TASK_LIVE_HEARTBEAT_SECONDS,
+and streams end after TASK_LIVE_MAX_SECONDS (EventSource reconnects), so
+streams of vanished clients do not linger.
+"""
+
+import asyncio
+import json
+import time
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+
+from infrastructure.api.live import RESYNC, get_broadcaster
+
+
+def _int_param(request, name: str, default: int, low: int, high: int) -> int:
+    raw = request.GET.get(name)
+    if raw is None:
+        return default
+    value = int(raw)
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be between {low} and {high}")
+    return value
+
+
+def format_event(kind: str, event_id, data) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {kind}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":"), default=str))
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStream:
+    """
+    Async iterable of SSE chunks for one subscriber. close() (called by
+    Django once the response is finished) unsubscribes it.
+    """
+
+    def __init__(self, broadcaster, subscriber, heartbeat: float, max_seconds: float):
+        self.broadcaster = broadcaster
+        self.subscriber = subscriber
+        self.heartbeat = heartbeat
+        self.max_seconds = max_seconds
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        deadline = time.monotonic() + self.max_seconds
+        queue = self.subscriber.queue
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(queue.get(), min(self.heartbeat, remaining))
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is RESYNC:
+                    event = self.broadcaster.snapshot(self.subscriber)
+                    if event is None:
+                        continue
+                yield format_event(*event)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.broadcaster.unsubscribe(self.subscriber)
+
+
+async def live_rankings_view(request, project):
+    """
+    GET /api/tasks/live/<project>/?top_k=10&rank_threshold=5
+
+    Publishes to <project> come from analyze (POST ...?project=<project>),
+    suggest seeding (same query param) and the diff endpoint; without the
+    query param they go to the "default" project.
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "method_not_allowed"}, status=405)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"error": "asgi_required", "details": "serve task_analyzer.asgi to stream events"}, status=501)
+    try:
+        top_k = _int_param(request, "top_k", 10, 1, 1000)
+        rank_threshold = _int_param(request, "rank_threshold", 5, 1, 10 ** 9)
+    except ValueError as exc:
+        return JsonResponse({"error": "invalid_params", "details": str(exc)}, status=400)
+
+    broadcaster = get_broadcaster()
+    subscriber = broadcaster.subscribe(project, asyncio.get_running_loop(), top_k, rank_threshold)
+    response = StreamingHttpResponse(
+        EventStream(
+            broadcaster, subscriber,
+            float(getattr(settings, "TASK_LIVE_HEARTBEAT_SECONDS", 15)),
+            float(getattr(settings, "TASK_LIVE_MAX_SECONDS", 600)),
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
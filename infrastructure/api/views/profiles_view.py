@@ -0,0 +1,68 @@
+"""
+HTTP view adapter for saved request profiles.
+
+Purpose:
+- list the profiles captured for opted-in analyze/suggest requests
+- download one profile (pstats file) or its JSON summary
+
+Inputs:
+- X-Profile-Token header matching settings.TASK_PROFILING_TOKEN
+- profile id from the URL (the X-Profile-Id header of the profiled response)
+
+Outputs:
+- HTTP JSON listing, the .prof file, or 403/404 error details
+"""
+
+from django.http import FileResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.profiling import forbidden, get_profile_store, token_valid
+
+
+class ProfileListView(APIView):
+    """
+    GET: saved profiles, newest first, without their function/allocation tables.
+
+    Response:
+    {
+      "profiles": [ { "id": "...", "kind": "analyze", "created_at": ..., "duration_s": 1.2, "status": 200 } ]
+    }
+    """
+
+    def get(self, request):
+        if not token_valid(request):
+            return forbidden()
+        store = get_profile_store()
+        profiles = []
+        for profile_id in reversed(store.ids()):
+            meta = store.meta(profile_id)
+            if meta is not None:
+                meta.pop("top_functions", None)
+                allocations = meta.pop("allocations", None)
+                meta["peak_bytes"] = allocations["peak_bytes"] if allocations else None
+                profiles.append(meta)
+        return Response({"profiles": profiles}, status=status.HTTP_200_OK)
+
+
+class ProfileDetailView(APIView):
+    """
+    GET: the pstats file as an attachment; `?format=json` returns the summary
+    (slowest functions and allocation sites) instead.
+    """
+
+    def get(self, request, profile_id):
+        if not token_valid(request):
+            return forbidden()
+        store = get_profile_store()
+        if request.query_params.get("format") == "json":
+            meta = store.meta(profile_id)
+            if meta is None:
+                return Response({"error": "profile_not_found"}, status=status.HTTP_404_NOT_FOUND)
+            return Response(meta, status=status.HTTP_200_OK)
+        path = store.profile_path(profile_id)
+        if path is None:
+            return Response({"error": "profile_not_found"}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(open(path, "rb"), as_attachment=True, filename=f"{profile_id}.prof",
+                            content_type="application/octet-stream")
@@ -0,0 +1,75 @@
+"""
+HTTP view adapter for the score projection endpoint.
+
+Purpose:
+- receive POST requests with tasks and a projection horizon
+- validate HTTP payload using serializers
+- call application service that re-evaluates urgency per future day
+- return top-K per day and rank-change events
+
+Inputs:
+- HTTP request with JSON body matching ProjectionPayloadSerializer
+
+Outputs:
+- HTTP JSON response with projection results or validation/error details
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.serializers.task_serializer import ProjectionPayloadSerializer
+from application.services.config_service import InvalidConfig
+from application.services.projection_service import project_rankings_service
+
+
+class ProjectionView(APIView):
+    """
+    POST handler for multi-day score trajectories.
+
+    Request body:
+    {
+      "tasks": [ { task objects } ],
+      "config": { optional config overrides },
+      "days": 14,
+      "top_k": 10
+    }
+
+    Response:
+    {
+      "dates": [...],
+      "top_by_day": [ { "date": ..., "ids": [...] } ],
+      "events": [ { "date": ..., "id": ..., "event": "became_top", "rank": 1, "previous_rank": 2 } ],
+      "first_top": { "task-id": "YYYY-MM-DD" },
+      "config_used": { ... }
+    }
+    """
+
+    def post(self, request):
+        serializer = ProjectionPayloadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_payload", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated = serializer.validated_data
+
+        try:
+            result = project_rankings_service(
+                validated.get("tasks", []),
+                validated.get("config", {}),
+                days=validated["days"],
+                top_k=validated["top_k"],
+            )
+            return Response({"results": result}, status=status.HTTP_200_OK)
+        except InvalidConfig as exc:
+            return Response(
+                {"error": "invalid_config", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as exc:
+            return Response(
+                {"error": "projection_failed", "details": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
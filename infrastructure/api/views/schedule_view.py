@@ -0,0 +1,82 @@
+"""
+HTTP view adapter for the schedule endpoint.
+
+Purpose:
+- receive POST requests with tasks and a daily hour budget
+- validate HTTP payload using serializers
+- call application service to lay tasks out over days in dependency order
+- return the day-by-day plan with late tasks flagged
+
+Inputs:
+- HTTP request with JSON body matching SchedulePayloadSerializer
+
+Outputs:
+- HTTP JSON response with the plan or validation/error details
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.serializers.task_serializer import SchedulePayloadSerializer
+from application.services.config_service import InvalidConfig
+from application.services.schedule_tasks_service import schedule_tasks_service
+
+
+class ScheduleView(APIView):
+    """
+    POST handler for capacity-aware multi-day planning.
+
+    Request body:
+    {
+      "tasks": [ { task objects } ],
+      "config": { optional config overrides },
+      "daily_hours": 8 or [Mon..Sun hours],
+      "start_date": "YYYY-MM-DD",
+      "horizon_days": 365
+    }
+
+    Response:
+    {
+      "days": [...],
+      "tasks": [...],
+      "unscheduled": [...],
+      "late_count": 0,
+      "config_used": { ... }
+    }
+    """
+
+    def post(self, request):
+        serializer = SchedulePayloadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_payload", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated = serializer.validated_data
+
+        try:
+            result = schedule_tasks_service(
+                validated.get("tasks", []),
+                validated.get("config", {}),
+                daily_hours=validated["daily_hours"],
+                start_date=validated.get("start_date"),
+                horizon_days=validated["horizon_days"],
+            )
+            return Response({"results": result}, status=status.HTTP_200_OK)
+        except InvalidConfig as exc:
+            return Response(
+                {"error": "invalid_config", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError as exc:
+            return Response(
+                {"error": "invalid_payload", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as exc:
+            return Response(
+                {"error": "schedule_failed", "details": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,84 @@
+"""
+HTTP view adapter for the simulate endpoint.
+
+Purpose:
+- receive POST requests with tasks, a worker count and a daily hour budget
+- validate HTTP payload using serializers
+- call application service to simulate parallel workers over the dependency graph
+- return per-worker timelines and projected completion dates
+
+Inputs:
+- HTTP request with JSON body matching SimulatePayloadSerializer
+
+Outputs:
+- HTTP JSON response with the simulation or validation/error details
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.serializers.task_serializer import SimulatePayloadSerializer
+from application.services.config_service import InvalidConfig
+from application.services.simulate_dispatch_service import simulate_dispatch_service
+
+
+class SimulateView(APIView):
+    """
+    POST handler for multi-worker dispatch simulation.
+
+    Request body:
+    {
+      "tasks": [ { task objects } ],
+      "config": { optional config overrides },
+      "workers": 3,
+      "daily_hours": 8 or [Mon..Sun hours],
+      "start_date": "YYYY-MM-DD"
+    }
+
+    Response:
+    {
+      "workers": [ { "worker": 0, "busy_hours": 12.0, "tasks": [...] } ],
+      "tasks": [...],
+      "makespan_hours": 12.0,
+      "completion_date": "YYYY-MM-DD",
+      "unscheduled": [...],
+      "late_count": 0,
+      "config_used": { ... }
+    }
+    """
+
+    def post(self, request):
+        serializer = SimulatePayloadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_payload", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated = serializer.validated_data
+
+        try:
+            result = simulate_dispatch_service(
+                validated.get("tasks", []),
+                validated.get("config", {}),
+                workers=validated["workers"],
+                daily_hours=validated["daily_hours"],
+                start_date=validated.get("start_date"),
+            )
+            return Response({"results": result}, status=status.HTTP_200_OK)
+        except InvalidConfig as exc:
+            return Response(
+                {"error": "invalid_config", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError as exc:
+            return Response(
+                {"error": "invalid_payload", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as exc:
+            return Response(
+                {"error": "simulation_failed", "details": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
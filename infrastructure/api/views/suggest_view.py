@@ -14,13 +14,71 @@ Outputs:
 - list of suggested tasks with short reasons and metadata
 """
 
+import json
+import math
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import JSONParser
 
-from application.services.suggest_tasks_service import suggest_tasks_service
-from infrastructure.api.state import get_last_analyzed_payload, set_last_analyzed_payload
+from application.services.suggest_tasks_service import fill_day_service, suggest_tasks_service
+from infrastructure.api.state import get_last_analyzed, set_last_analyzed_payload
+from infrastructure.api.http_cache import compute_etag, etag_matches, not_modified, payload_digest
+from infrastructure.api.live import publish_tasks
+from infrastructure.api.profiling import TOKEN_HEADER, profiled
+from infrastructure.api.single_flight import coalesce
+
+# upper bound for ?hours= (a year of round-the-clock work)
+MAX_FILL_HOURS = 24 * 366
+
+
+def suggest_options(query_params):
+    """
+    (top_n, hours) from the query string; top_n falls back to 3.
+
+    Raises:
+        ValueError when hours is given but not in (0, MAX_FILL_HOURS]
+    """
+    try:
+        top_n = int(query_params.get("top_n") or 3)
+    except Exception:
+        top_n = 3
+
+    hours = query_params.get("hours")
+    if hours is not None:
+        try:
+            hours = float(hours)
+        except ValueError:
+            hours = -1.0
+        if not (math.isfinite(hours) and 0 < hours <= MAX_FILL_HOURS):
+            raise ValueError("invalid hours")
+    return top_n, hours
+
+
+def suggest_coalesce_key(request):
+    """
+    Coalescing key of a raw suggest GET for the async entry point, or None
+    when it must run on its own (conditional, profiled, bad options, or
+    nothing to suggest from).
+    """
+    if request.method != "GET" or request.META.get("HTTP_IF_NONE_MATCH") or request.META.get(TOKEN_HEADER):
+        return None
+    try:
+        top_n, hours = suggest_options(request.GET)
+        body = json.loads(request.body) if request.body else {}
+    except ValueError:
+        return None
+    tasks_payload = body.get("tasks") if isinstance(body, dict) else None
+    if isinstance(tasks_payload, list):
+        digest = payload_digest(tasks_payload)
+    else:
+        cached = get_last_analyzed()
+        if cached is None:
+            return None
+        digest = cached.digest
+    # inline payloads are published to ?project=, so it is part of the key
+    return compute_etag(digest, "suggest", top_n, hours, request.GET.get("project"))
 
 
 class SuggestView(APIView):
@@ -34,10 +92,21 @@ class SuggestView(APIView):
       cached payload to compute suggestions
     - Accepts optional query parameter 'top_n' to control how many suggestions to
       return. Defaults to three.
+    - Optional query parameter 'hours' switches to "fill my day": the
+      unblocked tasks with the highest total score that fit in that many hours
+      (at most MAX_FILL_HOURS; anything else is 400 invalid_hours).
+    - Responses carry an ETag over the task payload, top_n and today's date;
+      If-None-Match with that ETag returns 304 before any analysis runs.
+    - With a valid X-Profile-Token header the request runs under the
+      profiler (see infrastructure.api.profiling).
+    - Concurrent requests with the same ETag share one computation; the
+      responses that waited carry X-Coalesced: 1 (under ASGI via
+      suggest_coalesce_key).
     """
 
     parser_classes = [JSONParser]
 
+    @profiled("suggest")
     def get(self, request):
         try:
             # try to read JSON body if present
@@ -45,29 +114,56 @@ class SuggestView(APIView):
             tasks_payload = body.get("tasks") if isinstance(body, dict) else None
 
             if isinstance(tasks_payload, list):
+              # this request's own digest: the cached one may already belong
+              # to another client's payload
+              digest = payload_digest(tasks_payload)
               set_last_analyzed_payload(tasks_payload)
+              publish_tasks(request.query_params.get("project"), tasks_payload)
+              cached = None
             else:
-              tasks_payload = get_last_analyzed_payload()
+              # digest and payload from one snapshot; a compact payload is
+              # only decoded once the ETag check below misses
+              cached = get_last_analyzed()
+              tasks_payload = None
+              digest = cached.digest if cached is not None else None
 
-            if not tasks_payload:
+            if not (tasks_payload or (cached is not None and cached.count)):
                 return Response({"results": [], "message": "no_tasks_provided"}, status=status.HTTP_200_OK)
 
-            # read top_n from query params; if missing fall back to default
             try:
-                top_n = int(request.query_params.get("top_n") or 3)
-            except Exception:
-                top_n = 3
-
-            suggestions = suggest_tasks_service(tasks_payload, top_n=top_n)
-            return Response({"results": suggestions}, status=status.HTTP_200_OK)
+                top_n, hours = suggest_options(request.query_params)
+            except ValueError:
+                return Response({"error": "invalid_hours"}, status=status.HTTP_400_BAD_REQUEST)
+
+            etag = compute_etag(digest, "suggest", top_n, hours)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+            if cached is not None:
+                tasks_payload = cached.tasks()
+            if hours is not None:
+                compute = lambda: fill_day_service(tasks_payload, hours)
+            else:
+                compute = lambda: {"results": suggest_tasks_service(tasks_payload, top_n=top_n)}
+            if getattr(request, "profiling", False):
+                # a profile has to cover the computation itself
+                body, shared = compute(), False
+            else:
+                body, shared = coalesce(etag, compute)
+            headers = {"ETag": etag, "X-Coalesced": "1"} if shared else {"ETag": etag}
+            return Response(body, status=status.HTTP_200_OK, headers=headers)
         except Exception as exc:
             return Response({"error": "suggest_failed", "details": str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def post(self, request):
-      """Allow clients to seed the suggestion cache with an explicit task list."""
+      """
+      Allow clients to seed the suggestion cache with an explicit task list;
+      the tasks are also published to live subscribers of ?project=.
+      """
 
       if isinstance(request.data, dict) and isinstance(request.data.get("tasks"), list):
         set_last_analyzed_payload(request.data.get("tasks"))
+        publish_tasks(request.query_params.get("project"), request.data.get("tasks"))
         return Response({"message": "cached"}, status=status.HTTP_200_OK)
 
       return Response({"error": "invalid_payload"}, status=status.HTTP_400_BAD_REQUEST)
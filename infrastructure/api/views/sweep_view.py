@@ -0,0 +1,73 @@
+"""
+HTTP view adapter for the weight sweep endpoint.
+
+Purpose:
+- receive POST requests with one tasks payload and many weight vectors
+- validate HTTP payload using serializers
+- call application service that scores components once and re-weights them
+- return top-K and rank changes per weight vector
+
+Inputs:
+- HTTP request with JSON body matching SweepPayloadSerializer
+
+Outputs:
+- HTTP JSON response with sweep results or validation/error details
+"""
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from infrastructure.api.serializers.task_serializer import SweepPayloadSerializer
+from application.services.config_service import InvalidConfig
+from application.services.sweep_weights_service import sweep_weights_service
+
+
+class SweepView(APIView):
+    """
+    POST handler for what-if weight sweeps.
+
+    Request body:
+    {
+      "tasks": [ { task objects } ],
+      "weight_sets": [ { "weight_urgency": 2.0 }, { "weight_effort": 1.5 } ],
+      "config": { optional base overrides },
+      "top_k": 10
+    }
+
+    Response:
+    {
+      "baseline": [...],
+      "sweeps": [ { "weights": {...}, "top": [...], "entered_top": [...], "left_top": [...] } ],
+      "config_used": { ... }
+    }
+    """
+
+    def post(self, request):
+        serializer = SweepPayloadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_payload", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated = serializer.validated_data
+
+        try:
+            result = sweep_weights_service(
+                validated.get("tasks", []),
+                validated["weight_sets"],
+                validated.get("config", {}),
+                top_k=validated["top_k"],
+            )
+            return Response({"results": result}, status=status.HTTP_200_OK)
+        except InvalidConfig as exc:
+            return Response(
+                {"error": "invalid_config", "details": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as exc:
+            return Response(
+                {"error": "sweep_failed", "details": str(exc)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,165 @@
+"""
+Task file readers and ranked-result writers for offline batch jobs.
+
+Readers yield raw task dicts one at a time, so the file text is never held
+in memory as a whole:
+- ndjson: one JSON task object per line (blank lines skipped)
+- json: a top-level array of tasks (decoded incrementally), or an object
+  with a "tasks" array (loaded in one go)
+- csv: header row with task fields; `dependencies` holds ids separated by
+  ";" and empty cells are treated as missing
+
+Writers take analyze-style records in rank order:
+- ndjson: one record per line
+- csv: flat columns with the score components
+
+Formats default to the file extension (.ndjson/.jsonl, .json, .csv).
+"""
+
+import csv
+import json
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+READ_FORMATS = ("ndjson", "json", "csv")
+WRITE_FORMATS = ("ndjson", "csv")
+
+CSV_COMPONENTS = ("urgency", "importance", "effort", "dependency", "critical_path", "slack_hours", "overdue_days", "quadrant")
+CSV_FIELDS = ("rank", "id", "title", "score", "blocked", "due_date", "estimated_hours", "importance_rating") + \
+    tuple(f"c_{name}" for name in CSV_COMPONENTS) + ("explanation",)
+
+
+def format_from_path(path: str, default: str = "ndjson") -> str:
+    lowered = path.lower()
+    if lowered.endswith(".csv"):
+        return "csv"
+    if lowered.endswith(".json"):
+        return "json"
+    if lowered.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return default
+
+
+def _task_object(item, where: str) -> Dict:
+    if not isinstance(item, dict):
+        raise ValueError(f"{where} is not a task object")
+    return item
+
+
+def iter_ndjson(fh: TextIO) -> Iterator[Dict]:
+    for number, line in enumerate(fh, start=1):
+        line = line.strip()
+        if line:
+            yield _task_object(json.loads(line), f"line {number}")
+
+
+def iter_csv(fh: TextIO) -> Iterator[Dict]:
+    for row in csv.DictReader(fh):
+        task = {k: v for k, v in row.items() if k and v not in (None, "")}
+        if "dependencies" in task:
+            task["dependencies"] = [d.strip() for d in task["dependencies"].split(";") if d.strip()]
+        yield task
+
+
+def iter_json(fh: TextIO, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    buf = ""
+    while not buf:
+        more = fh.read(chunk_size)
+        if not more:
+            return
+        buf = more.lstrip()
+    if buf.startswith("{"):
+        payload = json.loads(buf + fh.read())
+        for number, item in enumerate(payload.get("tasks", []), start=1):
+            yield _task_object(item, f"task {number}")
+        return
+    if not buf.startswith("["):
+        raise ValueError("JSON input must be an array of tasks or an object with a 'tasks' array")
+
+    decoder = json.JSONDecoder()
+    pos = 1
+    eof = False
+    number = 0
+    while True:
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos, eof = _refill(fh, buf, pos, chunk_size)
+        if pos >= len(buf):
+            raise ValueError("unexpected end of JSON task array")
+        if buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+        # an item touching the buffer end may be cut short (e.g. a number)
+        if end is not None and (end < len(buf) or eof):
+            number += 1
+            yield _task_object(item, f"task {number}")
+            pos = end
+            continue
+        buf, pos, eof = _refill(fh, buf, pos, chunk_size)
+
+
+def _refill(fh: TextIO, buf: str, pos: int, chunk_size: int):
+    more = fh.read(chunk_size)
+    return buf[pos:] + more, 0, not more
+
+
+def read_tasks(fh: TextIO, fmt: str) -> Iterator[Dict]:
+    if fmt == "ndjson":
+        return iter_ndjson(fh)
+    if fmt == "csv":
+        return iter_csv(fh)
+    if fmt == "json":
+        return iter_json(fh)
+    raise ValueError(f"unknown input format '{fmt}'")
+
+
+def _output_record(rank: Optional[int], rec: Dict, include_raw: bool) -> Dict:
+    out = {"rank": rank}
+    for key in ("id", "title", "score", "blocked", "due_date", "estimated_hours", "importance",
+                "dependencies", "components", "explanation"):
+        out[key] = rec[key]
+    if include_raw:
+        out["raw"] = rec["raw"]
+    return out
+
+
+def write_ndjson(fh: TextIO, ranked: Iterable, include_raw: bool = False) -> int:
+    count = 0
+    dumps = json.dumps
+    for rank, rec in ranked:
+        fh.write(dumps(_output_record(rank, rec, include_raw), default=str))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(fh: TextIO, ranked: Iterable, include_raw: bool = False) -> int:
+    writer = csv.writer(fh)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for rank, rec in ranked:
+        components = rec["components"]
+        writer.writerow(
+            [rank, rec["id"], rec["title"], rec["score"], rec["blocked"], rec["due_date"],
+             rec["estimated_hours"], rec["importance"]]
+            + [components.get(name) for name in CSV_COMPONENTS]
+            + [rec["explanation"]]
+        )
+        count += 1
+    return count
+
+
+def write_results(fh: TextIO, fmt: str, ranked: Iterable, include_raw: bool = False) -> int:
+    """Write (rank, record) pairs; rank is None for blocked tasks."""
+    if fmt == "ndjson":
+        return write_ndjson(fh, ranked, include_raw)
+    if fmt == "csv":
+        return write_csv(fh, ranked, include_raw)
+    raise ValueError(f"unknown output format '{fmt}'")
@@ -0,0 +1,126 @@
+"""
+Offline bulk analysis.
+
+Reads tasks from a JSON / NDJSON / CSV file, runs the analyze pipeline
+(optionally across several processes, split by dependency components) and
+writes the ranked tasks as NDJSON or CSV: unblocked tasks in rank order,
+then tasks blocked by cycles with an empty rank.
+
+Usage:
+    python manage.py analyze_bulk tasks.ndjson --output ranked.csv --workers 4
+    python manage.py analyze_bulk - --input-format csv < export.csv > ranked.ndjson
+
+A summary with throughput and peak memory goes to stderr.
+"""
+
+import json
+import sys
+import time
+from contextlib import nullcontext
+from itertools import chain
+
+from django.core.management.base import BaseCommand, CommandError
+
+from application.services.bulk_analysis_service import analyze_bulk_service
+from application.services.config_service import InvalidConfig
+from core.validators.task_validator import ValidationBudgetExceeded
+from infrastructure.files.task_files import READ_FORMATS, WRITE_FORMATS, format_from_path, read_tasks, write_results
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _peak_rss_mb() -> dict:
+    """Peak resident memory of this process and of finished worker processes."""
+    if resource is None:
+        return {}
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        "workers": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    }
+
+
+def load_config_option(value):
+    """Parse a --config value: inline JSON or @path to a JSON file."""
+    if not value:
+        return {}
+    try:
+        if value.startswith("@"):
+            with open(value[1:], encoding="utf-8") as fh:
+                config = json.load(fh)
+        else:
+            config = json.loads(value)
+    except (OSError, ValueError) as exc:
+        raise CommandError(f"invalid --config: {exc}")
+    if not isinstance(config, dict):
+        raise CommandError("--config must be a JSON object")
+    return config
+
+
+class Command(BaseCommand):
+    help = "Analyze a task export offline and write ranked results as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="input file, or - for stdin")
+        parser.add_argument("--input-format", choices=READ_FORMATS, help="defaults to the input file extension")
+        parser.add_argument("--output", default="-", help="output file, or - for stdout (default)")
+        parser.add_argument("--output-format", choices=WRITE_FORMATS, help="defaults to the output file extension")
+        parser.add_argument("--workers", type=int, default=1, help="analysis processes (default 1)")
+        parser.add_argument("--config", help="config overrides as JSON, or @path to a JSON file")
+        parser.add_argument("--include-raw", action="store_true", help="echo each task's raw input in NDJSON output")
+
+    def handle(self, *args, **options):
+        in_path, out_path = options["input"], options["output"]
+        in_format = options["input_format"] or format_from_path(in_path)
+        out_format = options["output_format"] or format_from_path(out_path)
+        if out_format not in WRITE_FORMATS:
+            raise CommandError(f"cannot write {out_format}; use --output-format ndjson or csv")
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+        config = load_config_option(options["config"])
+
+        started = time.perf_counter()
+        with (nullcontext(sys.stdin) if in_path == "-" else open(in_path, encoding="utf-8", newline="")) as fh:
+            try:
+                tasks = list(read_tasks(fh, in_format))
+            except ValueError as exc:
+                raise CommandError(f"could not read {in_path}: {exc}")
+        read_done = time.perf_counter()
+
+        try:
+            result = analyze_bulk_service(tasks, config, workers=options["workers"])
+        except ValidationBudgetExceeded as exc:
+            raise CommandError(f"{exc} (first: {exc.issues[:1]})")
+        except InvalidConfig as exc:
+            raise CommandError(f"invalid --config: {exc}")
+        analyze_done = time.perf_counter()
+
+        ranked = chain(
+            enumerate(result["priority_list"], start=1),
+            ((None, rec) for rec in result["blocked_tasks"]),
+        )
+        with (nullcontext(sys.stdout) if out_path == "-" else open(out_path, "w", encoding="utf-8", newline="")) as fh:
+            written = write_results(fh, out_format, ranked, include_raw=options["include_raw"])
+        finished = time.perf_counter()
+
+        elapsed = finished - started
+        summary = {
+            "tasks": len(tasks),
+            "written": written,
+            "blocked": len(result["blocked_tasks"]),
+            "warnings": len(result["warnings"]),
+            "parts": result["parts"],
+            "seconds": {
+                "read": round(read_done - started, 3),
+                "analyze": round(analyze_done - read_done, 3),
+                "write": round(finished - analyze_done, 3),
+                "total": round(elapsed, 3),
+            },
+            "tasks_per_second": round(len(tasks) / elapsed) if elapsed > 0 else None,
+            "peak_rss_mb": {k: round(v, 1) for k, v in _peak_rss_mb().items()},
+        }
+        self.stderr.write(json.dumps(summary))
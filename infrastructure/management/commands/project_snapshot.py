@@ -0,0 +1,85 @@
+"""
+Binary project snapshots from the command line.
+
+Usage:
+    python manage.py project_snapshot write tasks.ndjson project.snap [--config JSON|@file]
+    python manage.py project_snapshot show project.snap [--top 10]
+
+`write` analyzes a task file (JSON / NDJSON / CSV, see analyze_bulk) and
+stores the result as a memory-mappable snapshot. `show` maps a snapshot and
+prints its load time, counts and the top unblocked tasks by score.
+"""
+
+import heapq
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from application.services.snapshot_service import snapshot_project_service
+from infrastructure.files.task_files import READ_FORMATS, format_from_path, read_tasks
+from infrastructure.management.commands.analyze_bulk import load_config_option
+from infrastructure.storage.snapshot import SnapshotError, load_snapshot, write_snapshot
+
+
+class Command(BaseCommand):
+    help = "Write or inspect memory-mapped binary project snapshots."
+
+    def add_arguments(self, parser):
+        sub = parser.add_subparsers(dest="action", required=True)
+        write = sub.add_parser("write", help="analyze a task file and write a snapshot")
+        write.add_argument("input")
+        write.add_argument("snapshot")
+        write.add_argument("--input-format", choices=READ_FORMATS)
+        write.add_argument("--config", help="config overrides as JSON, or @path to a JSON file")
+        show = sub.add_parser("show", help="map a snapshot and print its top tasks")
+        show.add_argument("snapshot")
+        show.add_argument("--top", type=int, default=10)
+
+    def handle(self, *args, **options):
+        if options["action"] == "write":
+            self._write(options)
+        else:
+            self._show(options)
+
+    def _write(self, options):
+        started = time.perf_counter()
+        fmt = options["input_format"] or format_from_path(options["input"])
+        config = load_config_option(options["config"])
+        try:
+            with open(options["input"], encoding="utf-8", newline="") as fh:
+                tasks = list(read_tasks(fh, fmt))
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"could not read {options['input']}: {exc}")
+        project = snapshot_project_service(tasks, config)
+        size = write_snapshot(
+            options["snapshot"], project["keys"], project["graph"],
+            project["columns"], project["strings"], project["meta"],
+        )
+        self.stdout.write(json.dumps({
+            "tasks": len(project["keys"]),
+            "bytes": size,
+            "seconds": round(time.perf_counter() - started, 3),
+        }))
+
+    def _show(self, options):
+        started = time.perf_counter()
+        try:
+            snapshot = load_snapshot(options["snapshot"])
+        except (OSError, SnapshotError) as exc:
+            raise CommandError(f"could not load {options['snapshot']}: {exc}")
+        with snapshot:
+            loaded = time.perf_counter()
+            score = snapshot.section("score")
+            blocked = snapshot.section("blocked")
+            top = heapq.nlargest(
+                options["top"], (pos for pos in range(snapshot.task_count) if not blocked[pos]),
+                key=score.__getitem__,
+            )
+            keys, titles = snapshot.keys, snapshot.strings("titles")
+            self.stdout.write(json.dumps({
+                "tasks": snapshot.task_count,
+                "edges": snapshot.edge_count,
+                "load_ms": round((loaded - started) * 1000.0, 3),
+                "top": [{"key": keys[pos], "title": titles[pos], "score": score[pos]} for pos in top],
+            }))
@@ -0,0 +1,239 @@
+"""
+Binary project snapshots.
+
+A snapshot stores an analyzed project as flat, typed sections that can be
+mapped straight into memory: numeric columns, string tables (keys, titles),
+the CSR dependency adjacency of TaskGraph and the computed scores. Loading
+maps the file read-only and exposes every section as a zero-copy
+memoryview, so opening a large project costs a header parse rather than a
+JSON decode, and concurrent readers share the same page-cache pages.
+
+Layout (version 1, native little-endian):
+- header: magic "TASKSNAP", version, section count, task count, edge count
+- section table: name, typecode, byte offset, item count per section
+- sections, each starting on an 8-byte boundary
+
+Section kinds:
+- numeric column: array typecode "B" (uint8), "i" (int32), "q" (int64) or "d" (float64)
+- string table: "<name>.offsets" (q, n + 1) plus "<name>.blob" (B, UTF-8)
+- "meta": JSON blob (config used, free-form producer details)
+
+Inputs:
+- write_snapshot(path, keys, graph, columns, strings, meta)
+
+Outputs:
+- load_snapshot(path) -> ProjectSnapshot (use as a context manager or call
+  close() once done so the mapping can be released)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+from core.models.task_graph import TaskGraph
+
+MAGIC = b"TASKSNAP"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")
+_SECTION = struct.Struct("<24scxxxxxxxQQ")
+_ALIGN = 8
+
+GRAPH_SECTIONS = ("dep_offsets", "dep_indices", "rdep_offsets", "rdep_indices", "self_deps", "unknown_pos")
+
+
+class SnapshotError(ValueError):
+    """Raised for files that are not snapshots or use an unsupported version."""
+
+
+def _pad(size: int) -> int:
+    return -size % _ALIGN
+
+
+def _string_sections(name: str, values: Sequence[str]) -> Dict[str, Tuple[str, object]]:
+    blob = bytearray()
+    offsets = array("q", [0])
+    for value in values:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    return {f"{name}.offsets": ("q", offsets), f"{name}.blob": ("B", blob)}
+
+
+def write_snapshot(
+    path: str,
+    keys: Sequence[str],
+    graph: TaskGraph,
+    columns: Mapping[str, Tuple[str, Sequence]],
+    strings: Optional[Mapping[str, Sequence[str]]] = None,
+    meta: Optional[Mapping] = None,
+) -> int:
+    """
+    Write a snapshot; `columns` maps name -> (typecode, values) aligned with
+    `keys`. Returns the file size in bytes.
+    """
+    if sys.byteorder != "little":
+        raise SnapshotError("snapshots are written in little-endian byte order only")
+
+    sections: Dict[str, Tuple[str, object]] = {}
+    sections.update(_string_sections("keys", keys))
+    for name, values in (strings or {}).items():
+        sections.update(_string_sections(name, values))
+    sections["dep_offsets"] = ("q", array("q", graph.dep_offsets))
+    sections["dep_indices"] = ("q", array("q", graph.dep_indices))
+    sections["rdep_offsets"] = ("q", array("q", graph.rdep_offsets))
+    sections["rdep_indices"] = ("q", array("q", graph.rdep_indices))
+    sections["self_deps"] = ("q", array("q", graph.self_deps))
+    sections["unknown_pos"] = ("q", array("q", (pos for pos, _ in graph.unknown)))
+    sections.update(_string_sections("unknown_ids", [dep for _, dep in graph.unknown]))
+    for name, (typecode, values) in columns.items():
+        if name in sections:
+            raise SnapshotError(f"column '{name}' clashes with a built-in section")
+        sections[name] = (typecode, values if isinstance(values, array) and values.typecode == typecode else array(typecode, values))
+    sections["meta"] = ("B", json.dumps(meta or {}, sort_keys=True, default=str).encode("utf-8"))
+
+    for name in sections:
+        if len(name.encode("ascii")) > 24:
+            raise SnapshotError(f"section name '{name}' is longer than 24 bytes")
+
+    table_size = _HEADER.size + _SECTION.size * len(sections)
+    offset = table_size + _pad(table_size)
+    entries = []
+    for name, (typecode, data) in sections.items():
+        nbytes = len(data) * (data.itemsize if isinstance(data, array) else 1)
+        entries.append((name, typecode, offset, len(data), data, nbytes))
+        offset += nbytes + _pad(nbytes)
+
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), len(keys), graph.edge_count))
+        for name, typecode, start, count, _, _ in entries:
+            fh.write(_SECTION.pack(name.encode("ascii"), typecode.encode("ascii"), start, count))
+        fh.write(b"\0" * _pad(table_size))
+        for _, _, _, _, data, nbytes in entries:
+            fh.write(data)
+            fh.write(b"\0" * _pad(nbytes))
+    return offset
+
+
+class StringTable(Sequence):
+    """Lazily decoded UTF-8 strings over an offsets/blob section pair."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[i] for i in range(*pos.indices(len(self)))]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError(pos)
+        return str(self._blob[self._offsets[pos]:self._offsets[pos + 1]], "utf-8")
+
+
+class ProjectSnapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as fh:
+            # mmap refuses empty files with a bare ValueError
+            if os.fstat(fh.fileno()).st_size < _HEADER.size:
+                raise SnapshotError("file is too small to be a snapshot")
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        self._views: Dict[str, memoryview] = {}
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+        self._graph: Optional[TaskGraph] = None
+
+    def _read_header(self) -> None:
+        if len(self._buffer) < _HEADER.size:
+            raise SnapshotError("file is too small to be a snapshot")
+        magic, version, count, self.task_count, self.edge_count = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise SnapshotError("not a task snapshot file")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"unsupported snapshot version {version} (expected {FORMAT_VERSION})")
+        self._sections = {}
+        for i in range(count):
+            raw_name, typecode, start, length = _SECTION.unpack_from(self._buffer, _HEADER.size + i * _SECTION.size)
+            name = raw_name.rstrip(b"\0").decode("ascii")
+            typecode = typecode.decode("ascii")
+            nbytes = length * array(typecode).itemsize
+            if start + nbytes > len(self._buffer):
+                raise SnapshotError(f"section '{name}' runs past the end of the file")
+            self._sections[name] = (typecode, start, nbytes)
+
+    def section(self, name: str) -> memoryview:
+        """Zero-copy typed view of one section."""
+        view = self._views.get(name)
+        if view is None:
+            typecode, start, nbytes = self._sections[name]
+            view = self._views[name] = self._buffer[start:start + nbytes].cast(typecode)
+        return view
+
+    def has_section(self, name: str) -> bool:
+        return name in self._sections
+
+    def strings(self, name: str) -> StringTable:
+        return StringTable(self.section(f"{name}.offsets"), self.section(f"{name}.blob"))
+
+    @property
+    def keys(self) -> StringTable:
+        return self.strings("keys")
+
+    @property
+    def meta(self) -> Dict:
+        return json.loads(bytes(self.section("meta")))
+
+    @property
+    def graph(self) -> TaskGraph:
+        """TaskGraph whose adjacency arrays are views into the mapping."""
+        if self._graph is None:
+            unknown_ids = self.strings("unknown_ids")
+            self._graph = TaskGraph(
+                self.keys,
+                self.section("dep_offsets"),
+                self.section("dep_indices"),
+                self.section("rdep_offsets"),
+                self.section("rdep_indices"),
+                list(zip(self.section("unknown_pos"), unknown_ids)),
+                list(self.section("self_deps")),
+            )
+        return self._graph
+
+    def column_names(self):
+        reserved = set(GRAPH_SECTIONS) | {"meta"}
+        return [
+            name for name in self._sections
+            if name not in reserved and not name.endswith((".offsets", ".blob"))
+        ]
+
+    def close(self) -> None:
+        """Release the mapping; views (and slices of them) must not be used afterwards."""
+        self._graph = None
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ProjectSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_snapshot(path: str) -> ProjectSnapshot:
+    return ProjectSnapshot(path)
@@ -8,5 +8,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_analyzer.settings")
+# async analyze/suggest entry points, so identical requests can coalesce
+os.environ.setdefault("TASK_ASYNC_VIEWS", "true")
 
 application = get_asgi_application()
@@ -18,6 +18,7 @@ Domain + application logic should stay separate from Django.
 
 from pathlib import Path
 import os
+import tempfile
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -45,6 +46,7 @@ INSTALLED_APPS = [
     "rest_framework",
 
     # Internal apps will be registered here once created
+    "infrastructure",
     "tests",
 ]
 
@@ -52,6 +54,9 @@ INSTALLED_APPS = [
 # MIDDLEWARE
 # ---------------------------------------------------------
 MIDDLEWARE = [
+    # compresses responses for clients sending Accept-Encoding: gzip (except
+    # server-sent event streams)
+    "infrastructure.api.middleware.GZipMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -128,6 +133,44 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
 }
 
+# ---------------------------------------------------------
+# TASK API STATE
+# ---------------------------------------------------------
+# How the last analyzed payload is kept between requests:
+# "full" (list), "compact" (zlib-compressed JSON) or "none" (released)
+TASK_PAYLOAD_CACHE_MODE = os.getenv("TASK_PAYLOAD_CACHE_MODE", "full")
+# Projects whose previous ranking is kept for /api/tasks/diff/ (least recently
+# used projects are dropped first)
+TASK_RANKING_HISTORY_SIZE = int(os.getenv("TASK_RANKING_HISTORY_SIZE", "256"))
+# Live ranking streams (/api/tasks/live/<project>/, ASGI only): keep-alive
+# interval and maximum stream duration
+TASK_LIVE_HEARTBEAT_SECONDS = int(os.getenv("TASK_LIVE_HEARTBEAT_SECONDS", "15"))
+TASK_LIVE_MAX_SECONDS = int(os.getenv("TASK_LIVE_MAX_SECONDS", "600"))
+# Identical concurrent analyze/suggest requests share one computation
+TASK_COALESCE_REQUESTS = os.getenv("TASK_COALESCE_REQUESTS", "true").lower() == "true"
+# Serve analyze/suggest through async entry points so identical requests can
+# overlap (and coalesce) under ASGI; task_analyzer/asgi.py turns it on
+TASK_ASYNC_VIEWS = os.getenv("TASK_ASYNC_VIEWS", "false").lower() == "true"
+
+# ---------------------------------------------------------
+# Background jobs for oversized analyze requests: requests whose estimated
+# cost (tasks + dependency edges) exceeds the threshold are queued and polled
+# via /api/tasks/jobs/<id>/ (threshold 0, the default, disables queuing).
+# Jobs live in one process's memory: enable only with a single server
+# process that is not recycled (gunicorn.conf.py switches to that when set)
+TASK_JOB_COST_THRESHOLD = int(os.getenv("TASK_JOB_COST_THRESHOLD", "0"))
+TASK_JOB_WORKERS = int(os.getenv("TASK_JOB_WORKERS", "2"))
+TASK_JOB_MAX_QUEUED = int(os.getenv("TASK_JOB_MAX_QUEUED", "8"))
+TASK_JOB_RESULT_TTL = int(os.getenv("TASK_JOB_RESULT_TTL", "600"))
+
+# ---------------------------------------------------------
+# On-demand request profiling: analyze/suggest requests sending
+# X-Profile-Token with this token run under cProfile (empty disables it);
+# profiles are kept in a ring buffer of TASK_PROFILE_KEEP file pairs
+TASK_PROFILING_TOKEN = os.getenv("TASK_PROFILING_TOKEN", "")
+TASK_PROFILE_DIR = os.getenv("TASK_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "task-profiles"))
+TASK_PROFILE_KEEP = int(os.getenv("TASK_PROFILE_KEEP", "20"))
+
 # ---------------------------------------------------------
 # DEFAULT PRIMARY FIELD TYPE
 # ---------------------------------------------------------
@@ -0,0 +1,49 @@
+"""
+API-only Django settings for Smart Task Analyzer.
+
+Extends the default settings and strips everything the JSON API does not use:
+- no admin, auth, sessions, messages, staticfiles or the `tests` app
+- no CSRF/session/auth/message/clickjacking middleware
+- no templates and no database connection
+- DRF runs without authentication (requests are anonymous)
+
+Only `/api/tasks/` routes are mounted (see `task_analyzer.urls_api`); the
+single-page UI is served by the default profile.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=task_analyzer.settings_api gunicorn -c gunicorn.conf.py task_analyzer.wsgi:application
+"""
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    "rest_framework",
+    # management commands (analyze_bulk)
+    "infrastructure",
+]
+
+MIDDLEWARE = [
+    "infrastructure.api.middleware.GZipMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+ROOT_URLCONF = "task_analyzer.urls_api"
+
+TEMPLATES = []
+
+DATABASES = {}
+
+AUTH_PASSWORD_VALIDATORS = []
+
+STATICFILES_DIRS = []
+
+USE_I18N = False
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": [],
+    "UNAUTHENTICATED_USER": None,
+}
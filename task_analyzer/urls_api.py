@@ -0,0 +1,8 @@
+# task_analyzer/urls_api.py
+# URL conf for the API-only profile (task_analyzer.settings_api): no frontend view.
+
+from django.urls import path, include # pyright: ignore[reportMissingModuleSource]
+
+urlpatterns = [
+    path("api/tasks/", include("infrastructure.api.urls")),
+]
@@ -0,0 +1,134 @@
+"""
+Reference implementations for differential tests.
+
+Frozen copies of the original, straightforward algorithms: per-task
+PriorityEngine.score_tasks, compute_urgency and the recursive DFS of
+DependencyGraph. They define the semantics the optimized code paths must
+keep, so do not optimize them; change them only together with an intended
+behavior change.
+"""
+
+import math
+from datetime import date
+
+
+def compute_urgency(task, config):
+    today = date.today()
+    delta = (task.due_date - today).days
+
+    # overdue case
+    if delta < 0:
+        overdue_days = abs(delta)
+        return config.overdue_base + overdue_days * config.overdue_growth
+
+    if config.urgency_mode == "linear":
+        return 1 / max(delta, 1)
+
+    if config.urgency_mode == "exponential":
+        return math.exp(-delta)
+
+    if config.urgency_mode == "threshold":
+        if delta <= config.urgency_threshold:
+            return config.high_urgency_value
+        return config.low_urgency_value
+
+    return 0
+
+
+def compute_importance(task):
+    return task.importance
+
+
+def compute_effort(task):
+    return 1 / max(task.estimated_hours, 1)
+
+
+def compute_dependency_score(task, task_map):
+    count = 0
+    for t in task_map.values():
+        if task.id in t.dependencies:
+            count += 1
+    return count
+
+
+class PriorityEngine:
+    """Four-factor weighted sum, one task at a time (no critical path, no quadrants)."""
+
+    def __init__(self, config):
+        self.config = config
+
+    def score_task(self, task, task_map):
+        urgency = compute_urgency(task, self.config)
+        importance = compute_importance(task)
+        effort = compute_effort(task)
+        dependency = compute_dependency_score(task, task_map)
+
+        score = (
+            self.config.weight_urgency * urgency +
+            self.config.weight_importance * importance +
+            self.config.weight_effort * effort +
+            self.config.weight_dependency * dependency
+        )
+
+        return score
+
+    def score_tasks(self, tasks):
+        task_map = {t.id: t for t in tasks}
+        result = []
+
+        for task in tasks:
+            score = self.score_task(task, task_map)
+            result.append((task, score))
+
+        return sorted(result, key=lambda x: x[1], reverse=True)
+
+
+class DependencyGraph:
+    """Recursive DFS cycle detection over id -> task."""
+
+    def __init__(self, tasks_dict):
+        self.tasks = tasks_dict
+        self.visited = set()
+        self.rec_stack = set()
+        self.cycles = []
+
+    def _reset_state(self):
+        self.visited.clear()
+        self.rec_stack.clear()
+        self.cycles.clear()
+
+    def _dfs(self, task_id, path):
+        if task_id in self.rec_stack:
+            cycle_start = path.index(task_id)
+            self.cycles.append(path[cycle_start:])
+            return
+
+        if task_id in self.visited:
+            return
+
+        self.visited.add(task_id)
+        self.rec_stack.add(task_id)
+
+        task = self.tasks.get(task_id)
+        if not task:
+            self.rec_stack.remove(task_id)
+            return
+
+        for dep in task.dependencies:
+            self._dfs(dep, path + [dep])
+
+        self.rec_stack.remove(task_id)
+
+    def _detect_cycles(self):
+        self._reset_state()
+        for task_id in self.tasks:
+            self._dfs(task_id, [task_id])
+
+    def has_cycle(self):
+        self._detect_cycles()
+        return bool(self.cycles)
+
+    def get_cycles(self):
+        if not self.cycles:
+            self._detect_cycles()
+        return self.cycles
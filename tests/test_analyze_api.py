@@ -1,3 +1,5 @@
+import gzip
+import json
 from datetime import date, timedelta
 
 from rest_framework import status
@@ -41,6 +43,9 @@ class AnalyzeAPITests(APITestCase):
         self.assertEqual(scores, sorted(scores, reverse=True))
         self.assertEqual(results["blocked_tasks"], [])
         self.assertEqual(results["warnings"], [])
+        self.assertEqual(sum(results["quadrant_counts"].values()), 2)
+        self.assertEqual(results["quadrant_counts"]["Q2_URGENT"], 1)
+        self.assertEqual(results["critical_path"]["length_hours"], 2)
 
     def test_analyze_detects_cycles_and_reports_blocked_tasks(self):
         payload = {
@@ -74,3 +79,134 @@ class AnalyzeAPITests(APITestCase):
         response = self.client.post("/api/tasks/analyze/", data={"tasks": {}}, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("error", response.data)
+
+    def _assert_invalid_config(self, config, endpoint="/api/tasks/analyze/", **extra):
+        tasks = [{"id": "a", "title": "A", "due_date": date.today().isoformat(), "dependencies": []}]
+        response = self.client.post(endpoint, data={"tasks": tasks, "config": config, **extra}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, config)
+        self.assertEqual(response.data["error"], "invalid_config")
+
+    def test_analyze_rejects_bad_dependency_mode_config(self):
+        for config in (
+            {"dependency_mode": "transitiv"},
+            {"dependency_mode": "transitive", "dependency_error": 0},
+            {"dependency_mode": "approximate", "dependency_error": "x"},
+        ):
+            self._assert_invalid_config(config)
+        self._assert_invalid_config({"dependency_error": -1}, endpoint="/api/tasks/sweep/", weight_sets=[{}])
+
+    def test_analyze_rejects_bad_facet_config(self):
+        for config in (
+            {"facets": "quadrant"},
+            {"facets": ["bogus"]},
+            {"facets": ["due"], "facet_max_groups": "x"},
+            {"facets": ["raw.project"], "facet_max_groups": 0},
+            {"include_tasks": "false"},
+        ):
+            self._assert_invalid_config(config)
+
+    def test_analyze_rejects_bad_record_config(self):
+        for config in (
+            {"retain_raw": "false"},
+            {"retain_raw": False, "passthrough_fields": "due"},
+            {"retain_raw": False, "passthrough_fields": ["due", 3]},
+        ):
+            self._assert_invalid_config(config)
+
+    def test_analyze_rejects_bad_validation_config(self):
+        for config in (
+            {"validation_policy": "strict"},
+            {"validation_policy": "budget", "validation_error_budget": "3"},
+            {"validation_error_budget": 2.5},
+        ):
+            self._assert_invalid_config(config)
+
+    def test_analyze_rejects_bad_raw_factor_config(self):
+        for config in (
+            {"raw_factors": {"tier": {}}},
+            {"raw_factors": {"urgency": {"field": "urgency"}}},
+            {"raw_factors": {"tier": {"field": "tier", "default": "high"}}},
+            {"raw_factors": {"tier": {"field": "tier", "values": {"gold": "2"}}}},
+            {"raw_factors": ["tier"]},
+            {"component_weights": {"tier": "1"}},
+        ):
+            self._assert_invalid_config(config)
+
+    def test_analyze_ignores_non_finite_raw_values(self):
+        tasks = [{"id": "a", "title": "A", "due_date": date.today().isoformat(), "dependencies": [],
+                  "points": "nan"},
+                 {"id": "b", "title": "B", "due_date": date.today().isoformat(), "dependencies": [],
+                  "points": "inf"}]
+        config = {"raw_factors": {"points": {"field": "points", "default": 1}}, "component_weights": {"points": 1}}
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": tasks, "config": config}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = response.data["results"]["priority_list"]
+        self.assertEqual([row["components"]["factors"]["points"] for row in rows], [1.0, 1.0])
+
+    def test_analyze_budget_policy_fails_fast(self):
+        payload = {
+            "tasks": [
+                {"id": str(i), "title": f"T{i}", "estimated_hours": -1, "importance": 5}
+                for i in range(20)
+            ],
+            "config": {"validation_policy": "budget", "validation_error_budget": 3},
+        }
+        response = self.client.post("/api/tasks/analyze/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(response.data["error"], "validation_failed")
+        self.assertEqual(len(response.data["issues"]), 3)
+
+        payload["config"] = {"validation_policy": "collect"}
+        response = self.client.post("/api/tasks/analyze/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]["warnings"]), 20)
+
+    def test_analyze_etag_and_gzip(self):
+        payload = {
+            "tasks": [
+                {"id": f"t{i}", "title": f"Task {i}", "estimated_hours": 2, "importance": 5}
+                for i in range(30)
+            ]
+        }
+        response = self.client.post(
+            "/api/tasks/analyze/", data=payload, format="json", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        body = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(body["results"]["priority_list"]), 30)
+
+        again = self.client.post(
+            "/api/tasks/analyze/", data=payload, format="json", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(again.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_matched_analyze_precondition_reseeds_suggest_cache(self):
+        mine = {"tasks": [{"id": "mine", "title": "Mine", "due_date": date.today().isoformat(), "dependencies": []}]}
+        other = {"tasks": [{"id": "other", "title": "Other", "due_date": date.today().isoformat(), "dependencies": []}]}
+        etag = self.client.post("/api/tasks/analyze/", data=mine, format="json")["ETag"]
+        self.client.post("/api/tasks/analyze/", data=other, format="json")
+
+        again = self.client.post("/api/tasks/analyze/", data=mine, format="json", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(again.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        suggested = self.client.get("/api/tasks/suggest/")
+        self.assertEqual([r["id"] for r in suggested.data["results"]], ["mine"])
+
+    def test_analyze_etag_ignores_key_order_and_whitespace(self):
+        task = {"id": "a", "title": "A", "due_date": date.today().isoformat(), "dependencies": []}
+        first = self.client.post("/api/tasks/analyze/", data={"tasks": [task], "config": {}}, format="json")
+        reordered = json.dumps({"config": {}, "tasks": [dict(reversed(list(task.items())))]}, indent=2)
+        again = self.client.post(
+            "/api/tasks/analyze/", data=reordered, content_type="application/json", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+        self.assertEqual(again.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(again["ETag"], first["ETag"])
+
+    def test_analyze_passes_extra_fields_through(self):
+        payload = {
+            "tasks": [{"id": "a", "title": "A", "project": "apollo", "secret": "s"}],
+            "config": {"retain_raw": False, "passthrough_fields": ["project"]},
+        }
+        response = self.client.post("/api/tasks/analyze/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"]["priority_list"][0]["raw"], {"project": "apollo"})
@@ -0,0 +1,91 @@
+import copy
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, override_settings
+
+from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.config_service import InvalidConfig
+from infrastructure.api.state import get_last_analyzed_payload, set_last_analyzed_payload
+
+
+def _payload():
+    return [
+        {"id": "A", "title": "A", "due_date": date.today().isoformat(), "estimated_hours": -1,
+         "importance": 5, "dependencies": ["B"], "project": "apollo", "notes": "x" * 100},
+        {"id": "B", "title": "B", "due_date": (date.today() + timedelta(days=2)).isoformat(),
+         "estimated_hours": 2, "importance": 5, "dependencies": ["A"], "project": "gemini"},
+    ]
+
+
+class AnalyzeServiceRetentionTests(SimpleTestCase):
+    def test_analysis_never_mutates_input(self) -> None:
+        payload = _payload()
+        before = copy.deepcopy(payload)
+        result = analyze_tasks_service(payload)
+        self.assertEqual(payload, before)
+        echoed = {r["id"]: r["raw"] for r in result["blocked_tasks"]}
+        self.assertTrue(echoed["A"]["_blocked_by_cycle"])
+        self.assertTrue(echoed["A"]["_validation_issues"])
+        self.assertEqual(len(result["needs_attention"]), 1)
+
+    def test_no_retain_mode_keeps_only_passthrough_fields(self) -> None:
+        result = analyze_tasks_service(_payload(), {"retain_raw": False, "passthrough_fields": ["project"]})
+        raws = {r["id"]: r["raw"] for r in result["blocked_tasks"]}
+        self.assertEqual(raws["B"], {"project": "gemini", "_blocked_by_cycle": True})
+        self.assertNotIn("notes", raws["A"])
+        self.assertEqual(raws["A"]["project"], "apollo")
+
+
+class AnalyzeFacetTests(SimpleTestCase):
+    def test_facets_aggregate_in_the_record_pass(self) -> None:
+        payload = _payload() + [
+            {"id": "C", "title": "C", "due_date": (date.today() - timedelta(days=3)).isoformat(),
+             "estimated_hours": 4, "importance": 8, "dependencies": [], "project": "apollo"},
+            {"id": "D", "title": "D", "due_date": (date.today() + timedelta(days=30)).isoformat(),
+             "estimated_hours": 1, "importance": 2, "dependencies": []},
+        ]
+        config = {"facets": ["quadrant", "due", "blocked", "raw.project"]}
+        full = analyze_tasks_service(payload, config)
+        records = full["priority_list"] + full["blocked_tasks"]
+        scores = {r["id"]: r["score"] for r in records}
+        hours = {r["id"]: r["estimated_hours"] for r in records}
+        facets = full["facets"]
+
+        self.assertEqual(
+            {group: stats["count"] for group, stats in facets["due"].items()},
+            {"overdue": 1, "today": 1, "this_week": 1, "later": 1},
+        )
+        self.assertEqual(facets["blocked"]["blocked"]["count"], 2)
+        self.assertEqual(facets["blocked"]["blocked"]["max_score"], max(scores["A"], scores["B"]))
+        self.assertEqual(sum(s["count"] for s in facets["quadrant"].values()), 4)
+        self.assertEqual(facets["quadrant"], {
+            q: {**stats, "count": full["quadrant_counts"][q]} for q, stats in facets["quadrant"].items()
+        })
+        self.assertEqual(facets["raw.project"]["apollo"], {
+            "count": 2, "hours": hours["A"] + hours["C"], "max_score": max(scores["A"], scores["C"]),
+        })
+        self.assertEqual(facets["raw.project"]["_missing"]["count"], 1)
+
+        summary = analyze_tasks_service(payload, {**config, "include_tasks": False, "facet_max_groups": 1})
+        self.assertEqual((summary["priority_list"], summary["blocked_tasks"], summary["needs_attention"]), ([], [], []))
+        self.assertEqual(summary["facets"]["due"], facets["due"])
+        self.assertEqual(set(summary["facets"]["raw.project"]), {"apollo", "_other"})
+        self.assertNotIn("facets", analyze_tasks_service(payload))
+        with self.assertRaises(InvalidConfig):
+            analyze_tasks_service(payload, {"facets": ["colour"]})
+
+
+class PayloadCacheModeTests(SimpleTestCase):
+    def tearDown(self):
+        set_last_analyzed_payload(None)
+
+    @override_settings(TASK_PAYLOAD_CACHE_MODE="compact")
+    def test_compact_cache_round_trips(self) -> None:
+        payload = _payload()
+        set_last_analyzed_payload(payload)
+        self.assertEqual(get_last_analyzed_payload(), payload)
+
+    @override_settings(TASK_PAYLOAD_CACHE_MODE="none")
+    def test_none_cache_releases_payload(self) -> None:
+        set_last_analyzed_payload(_payload())
+        self.assertIsNone(get_last_analyzed_payload())
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import django
+django.setup()
+from django.conf import settings
+from django.test import Client
+assert "django.contrib.admin" not in settings.INSTALLED_APPS
+response = Client().post(
+    "/api/tasks/analyze/",
+    data={"tasks": [{"id": "a", "title": "A", "estimated_hours": 1}]},
+    content_type="application/json",
+)
+assert response.status_code == 200, response.content
+assert Client().get("/").status_code == 404
+print("ok")
+"""
+
+
+class ApiProfileTests(SimpleTestCase):
+    def test_api_profile_serves_analyze_without_admin_stack(self) -> None:
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "task_analyzer.settings_api"}
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "ok")
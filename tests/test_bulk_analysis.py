@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.bulk_analysis_service import analyze_bulk_service, partition_tasks
+
+
+def _payload():
+    today = date.today()
+    tasks = []
+    for group in range(4):
+        for i in range(5):
+            deps = [f"g{group}-{i - 1}"] if i else []
+            tasks.append({
+                "id": f"g{group}-{i}",
+                "title": f"Group {group} #{i}",
+                "due_date": (today + timedelta(days=group * 3 + i - 4)).isoformat(),
+                "estimated_hours": 1 + group + i,
+                "importance": 1 + (group * 5 + i) % 10,
+                "dependencies": deps,
+            })
+    tasks.append({"id": "loop-a", "title": "Loop A", "dependencies": ["loop-b"]})
+    tasks.append({"id": "loop-b", "title": "Loop B", "dependencies": ["loop-a"], "importance": "x"})
+    return tasks
+
+
+class BulkAnalysisTests(SimpleTestCase):
+    def test_partitions_keep_dependencies_together(self) -> None:
+        parts = partition_tasks(_payload(), 3)
+        self.assertEqual(sorted(pos for part in parts for pos in part), list(range(22)))
+        for part in parts:
+            self.assertEqual(part, sorted(part))
+            groups = {pos // 5 for pos in part if pos < 20}
+            for group in groups:
+                self.assertTrue(set(range(group * 5, group * 5 + 5)) <= set(part))
+            self.assertEqual(20 in part, 21 in part)
+
+    def test_multi_process_matches_single_analyze(self) -> None:
+        tasks = _payload()
+        single = analyze_tasks_service(tasks)
+        bulk = analyze_bulk_service(tasks, workers=3)
+        self.assertEqual(bulk["parts"], 3)
+
+        def strip(records):
+            return [
+                {**r, "components": {k: v for k, v in r["components"].items() if k != "critical_path"}}
+                for r in records
+            ]
+
+        self.assertEqual(strip(bulk["priority_list"]), strip(single["priority_list"]))
+        self.assertEqual(strip(bulk["blocked_tasks"]), strip(single["blocked_tasks"]))
+        for a, b in zip(bulk["priority_list"], single["priority_list"]):
+            self.assertAlmostEqual(a["components"]["critical_path"], b["components"]["critical_path"])
+        self.assertEqual(bulk["warnings"], single["warnings"])
+        self.assertEqual(bulk["quadrant_counts"], single["quadrant_counts"])
+        self.assertEqual(bulk["critical_path"], single["critical_path"])
+
+    def test_bulk_merges_facets_and_keeps_records(self) -> None:
+        tasks = _payload()
+        config = {"facets": ["due", "blocked"], "include_tasks": False}
+        single = analyze_tasks_service(tasks, config)
+        bulk = analyze_bulk_service(tasks, config, workers=3)
+        self.assertEqual(len(bulk["priority_list"]) + len(bulk["blocked_tasks"]), 22)
+        for name in ("due", "blocked"):
+            for group, stats in single["facets"][name].items():
+                merged = bulk["facets"][name][group]
+                self.assertEqual(merged["count"], stats["count"])
+                self.assertAlmostEqual(merged["hours"], stats["hours"])
+                self.assertAlmostEqual(merged["max_score"] or 0, stats["max_score"] or 0)
+
+    def test_command_reads_ndjson_and_writes_csv(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "tasks.ndjson")
+            target = os.path.join(tmp, "ranked.csv")
+            with open(source, "w", encoding="utf-8") as fh:
+                for task in _payload():
+                    fh.write(json.dumps(task) + "\n")
+            err = io.StringIO()
+            call_command("analyze_bulk", source, "--output", target, "--workers", "2", stderr=err)
+            with open(target, encoding="utf-8", newline="") as fh:
+                rows = list(csv.DictReader(fh))
+
+        summary = json.loads(err.getvalue())
+        self.assertEqual(summary["tasks"], 22)
+        self.assertEqual(summary["blocked"], 2)
+        self.assertIn("tasks_per_second", summary)
+        self.assertEqual(len(rows), 22)
+        self.assertEqual([row["rank"] for row in rows[:3]], ["1", "2", "3"])
+        self.assertEqual({row["id"] for row in rows if not row["rank"]}, {"loop-a", "loop-b"})
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import threading
+import time
+from unittest import mock
+
+from django.test import AsyncRequestFactory, Client, SimpleTestCase, override_settings
+
+from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.suggest_tasks_service import suggest_tasks_service
+from infrastructure.api import single_flight
+from infrastructure.api.single_flight import SingleFlight, async_coalesced
+from infrastructure.api.views.analyze_view import AnalyzeView, analyze_coalesce_key
+from infrastructure.api.state import set_last_analyzed_payload
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+def _waiting(flight, count):
+    return lambda: any(call.shared >= count for call in list(flight._calls.values()))
+
+
+class SingleFlightTests(SimpleTestCase):
+    def test_concurrent_sync_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return {"value": 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", compute))) for _ in range(5)]
+        threads[0].start()
+        _wait_for(lambda: flight.in_flight() == 1)
+        for thread in threads[1:]:
+            thread.start()
+        _wait_for(_waiting(flight, 4))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+        self.assertEqual(flight.in_flight(), 0)
+        # nothing is cached once the call finished
+        self.assertEqual(flight.do("k", lambda: "again"), ("again", False))
+
+    def test_errors_are_shared_with_waiters(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        def call():
+            try:
+                flight.do("k", fail)
+            except RuntimeError as exc:
+                errors.append(str(exc))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        _wait_for(lambda: flight.in_flight() == 1)
+        for thread in threads[1:]:
+            thread.start()
+        _wait_for(_waiting(flight, 2))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(errors, ["boom"] * 3)
+
+    async def test_async_waiters_share_sync_and_async_leaders(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return len(calls)
+
+        async def release_when(count):
+            while not _waiting(flight, count)():
+                await asyncio.sleep(0.005)
+            release.set()
+
+        # async leader, async waiters
+        results = await asyncio.gather(
+            flight.do_async("a", compute), flight.do_async("a", compute), flight.do_async("a", compute),
+            release_when(2),
+        )
+        self.assertEqual(results[:3], [(1, False), (1, True), (1, True)])
+
+        # sync leader in another thread, async waiter on the loop
+        release.clear()
+        leader = threading.Thread(target=flight.do, args=("b", compute))
+        leader.start()
+        while flight.in_flight() != 1:
+            await asyncio.sleep(0.005)
+        waited, _ = await asyncio.gather(flight.do_async("b", compute), release_when(1))
+        leader.join(5)
+        self.assertEqual(waited, (2, True))
+        self.assertEqual(len(calls), 2)
+
+
+class CoalescedRequestTests(SimpleTestCase):
+    def tearDown(self):
+        set_last_analyzed_payload(None)
+
+    def _concurrent_posts(self, count, payloads):
+        flight = single_flight._SINGLE_FLIGHT
+        release = threading.Event()
+        calls = []
+
+        def slow(tasks, config):
+            calls.append(1)
+            release.wait(5)
+            return analyze_tasks_service(tasks, config)
+
+        responses = [None] * count
+
+        def post(index):
+            responses[index] = Client().post(
+                "/api/tasks/analyze/", data=payloads[index], content_type="application/json",
+            )
+
+        with mock.patch("infrastructure.api.views.analyze_view.analyze_tasks_service", side_effect=slow):
+            threads = [threading.Thread(target=post, args=(i,)) for i in range(count)]
+            threads[0].start()
+            _wait_for(lambda: calls)
+            for thread in threads[1:]:
+                thread.start()
+            _wait_for(lambda: len(calls) + sum(c.shared for c in list(flight._calls.values())) >= count)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        return calls, responses
+
+    def test_identical_analyze_requests_compute_once(self):
+        tasks = [{"id": "a", "title": "A", "due_date": "2030-01-01", "estimated_hours": 2,
+                  "importance": 5, "dependencies": []}]
+        # same payload with a different key order is the same request
+        payloads = [{"tasks": tasks, "config": {"weight_urgency": 2, "weight_effort": 1}}] * 3 + [
+            {"config": {"weight_effort": 1, "weight_urgency": 2}, "tasks": tasks},
+        ]
+        calls, responses = self._concurrent_posts(4, payloads)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        self.assertEqual(sorted(r.get("X-Coalesced") or "0" for r in responses), ["0", "1", "1", "1"])
+        self.assertEqual(len({r.content for r in responses}), 1)
+
+    def test_different_payloads_are_not_coalesced(self):
+        payloads = [
+            {"tasks": [{"id": tid, "title": tid, "due_date": "2030-01-01", "estimated_hours": 1,
+                        "importance": 5, "dependencies": []}]}
+            for tid in ("a", "b")
+        ]
+        calls, responses = self._concurrent_posts(2, payloads)
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(any(r.has_header("X-Coalesced") for r in responses))
+
+    @override_settings(TASK_COALESCE_REQUESTS=False)
+    def test_setting_disables_coalescing(self):
+        self.assertIsNone(single_flight.get_single_flight())
+        self.assertEqual(single_flight.coalesce("k", lambda: 1), (1, False))
+
+    def test_concurrent_inline_suggest_payloads_keep_their_own_results(self):
+        def tasks(tid):
+            return {"tasks": [{"id": tid, "title": tid, "due_date": "2030-01-01", "estimated_hours": 1,
+                               "importance": 5, "dependencies": []}]}
+
+        flight = single_flight._SINGLE_FLIGHT
+        b_published = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def publish(project, payload):
+            # A stalls after seeding the cache until B has replaced it
+            if payload[0]["id"] == "a1":
+                b_published.wait(5)
+            else:
+                b_published.set()
+
+        def slow(payload, top_n):
+            calls.append(1)
+            release.wait(5)
+            return suggest_tasks_service(payload, top_n=top_n)
+
+        responses = {}
+
+        def get(tid):
+            responses[tid] = Client().generic(
+                "GET", "/api/tasks/suggest/", json.dumps(tasks(tid)), content_type="application/json",
+            )
+
+        with mock.patch("infrastructure.api.views.suggest_view.publish_tasks", side_effect=publish), \
+                mock.patch("infrastructure.api.views.suggest_view.suggest_tasks_service", side_effect=slow):
+            threads = [threading.Thread(target=get, args=(tid,)) for tid in ("a1", "b1")]
+            for thread in threads:
+                thread.start()
+            _wait_for(lambda: len(calls) + sum(c.shared for c in list(flight._calls.values())) >= 2)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(calls), 2)
+        for tid in ("a1", "b1"):
+            self.assertEqual([r["id"] for r in responses[tid].json()["results"]], [tid])
+            self.assertFalse(responses[tid].has_header("X-Coalesced"))
+        self.assertNotEqual(responses["a1"]["ETag"], responses["b1"]["ETag"])
+
+
+class AsyncCoalescingTests(SimpleTestCase):
+    def tearDown(self):
+        set_last_analyzed_payload(None)
+
+    async def test_async_entry_point_coalesces_identical_analyze_requests(self):
+        view = async_coalesced(AnalyzeView.as_view(), analyze_coalesce_key)
+        flight = single_flight._SINGLE_FLIGHT
+        release = threading.Event()
+        calls = []
+
+        def slow(tasks, config):
+            calls.append(1)
+            release.wait(5)
+            return analyze_tasks_service(tasks, config)
+
+        async def release_when(count):
+            while not _waiting(flight, count)():
+                await asyncio.sleep(0.005)
+            release.set()
+
+        tasks = [{"id": "a", "title": "A", "due_date": "2030-01-01", "dependencies": []}]
+        factory = AsyncRequestFactory()
+        bodies = [json.dumps({"tasks": tasks}), json.dumps({"tasks": tasks}, indent=2), json.dumps({"tasks": tasks})]
+        with mock.patch("infrastructure.api.views.analyze_view.analyze_tasks_service", side_effect=slow):
+            *responses, _ = await asyncio.gather(
+                *(view(factory.post("/api/tasks/analyze/", body, content_type="application/json")) for body in bodies),
+                release_when(2),
+            )
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        self.assertEqual(sorted(r.get("X-Coalesced") or "0" for r in responses), ["0", "1", "1"])
+        self.assertEqual(len({r.content for r in responses}), 1)
+
+        # conditional requests are not coalesced
+        conditional = factory.post(
+            "/api/tasks/analyze/", bodies[0], content_type="application/json", headers={"If-None-Match": '"x"'},
+        )
+        self.assertIsNone(analyze_coalesce_key(conditional))
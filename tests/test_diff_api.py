@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from application.services.ranking_diff_service import compact_ranking, diff_rankings
+from core.models.task_graph import TaskGraph
+from infrastructure.api.state import clear_project_rankings
+
+
+def _task(tid, importance, days=30, deps=None):
+    return {
+        "id": tid, "title": tid.title(), "importance": importance, "estimated_hours": 4,
+        "due_date": (date.today() + timedelta(days=days)).isoformat(), "dependencies": deps or [],
+    }
+
+
+class RankingDiffAPITests(APITestCase):
+    def setUp(self):
+        clear_project_rankings()
+        self.addCleanup(clear_project_rankings)
+
+    def post(self, project, tasks, **extra):
+        payload = {"project": project, "tasks": tasks, "top_k": 2, "rank_threshold": 2, **extra}
+        response = self.client.post("/api/tasks/diff/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def test_first_call_is_baseline_then_reports_changes(self):
+        tasks = [_task(f"t{i}", 10 - i) for i in range(6)]
+        first = self.post("alpha", tasks)
+        self.assertTrue(first["baseline"])
+        self.assertEqual(first["top"], ["t0", "t1"])
+
+        # t5 jumps to the top, t0/t1 form a cycle, t2 is dropped, t9 is new
+        tasks = [_task("t0", 9, deps=["t1"]), _task("t1", 9, deps=["t0"]), _task("t3", 7),
+                 _task("t4", 6), _task("t5", 10, days=1), _task("t9", 1)]
+        diff = self.post("alpha", tasks)
+        self.assertFalse(diff["baseline"])
+        self.assertEqual(diff["top"], ["t5", "t3"])
+        self.assertEqual(diff["entered_top"], [
+            {"id": "t5", "rank": 1, "previous_rank": 6},
+            {"id": "t3", "rank": 2, "previous_rank": 4},
+        ])
+        self.assertEqual([e["id"] for e in diff["left_top"]], ["t0", "t1"])
+        self.assertIsNone(diff["left_top"][0]["rank"])
+        self.assertEqual(diff["moved"], [
+            {"id": "t5", "previous_rank": 6, "rank": 1, "delta": 5},
+            {"id": "t3", "previous_rank": 4, "rank": 2, "delta": 2},
+            {"id": "t4", "previous_rank": 5, "rank": 3, "delta": 2},
+        ])
+        self.assertEqual(diff["newly_blocked"], ["t0", "t1"])
+        self.assertEqual(diff["new_cycles"], [["t0", "t1"]])
+        self.assertEqual(diff["added"], ["t9"])
+        self.assertEqual(diff["removed"], ["t2"])
+        self.assertEqual((diff["task_count"], diff["blocked_count"]), (4, 2))
+
+        # breaking the cycle unblocks both tasks; other projects are unaffected
+        tasks[1]["dependencies"] = []
+        diff = self.post("alpha", tasks)
+        self.assertEqual(diff["unblocked"], ["t0", "t1"])
+        self.assertEqual(diff["resolved_cycles"], [["t0", "t1"]])
+        self.assertTrue(self.post("beta", tasks)["baseline"])
+
+    def test_missing_project_is_rejected(self):
+        response = self.client.post("/api/tasks/diff/", data={"tasks": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_identical_rankings_produce_empty_diff(self):
+        ranking = {"ranks": {"a": 1, "b": 2}, "blocked": [], "cycles": []}
+        diff = diff_rankings(ranking, ranking, top_k=1, rank_threshold=1)
+        changes = {k: v for k, v in diff.items() if k not in ("baseline", "top") and v}
+        self.assertEqual(changes, {})
+
+    def test_compact_ranking_blocks_only_cycle_members_and_searches_once(self):
+        tasks = [_task("a", 5, deps=["b"]), _task("b", 5, deps=["a"]), _task("c", 5, deps=["a"])]
+        with mock.patch.object(TaskGraph, "find_cycles", autospec=True, side_effect=TaskGraph.find_cycles) as find:
+            ranking = compact_ranking(tasks)
+        self.assertEqual(find.call_count, 1)
+        self.assertEqual(ranking["blocked"], ["a", "b"])
+        self.assertEqual(ranking["cycles"], [["a", "b"]])
+        self.assertEqual(list(ranking["ranks"]), ["c"])
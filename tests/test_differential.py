@@ -0,0 +1,157 @@
+"""
+Randomized differential tests: optimized scoring and graph code against the
+reference implementations in tests/reference_impl.py.
+
+Each iteration builds a random payload (overdue and missing due dates, tasks
+without ids that fall back to their title, duplicate keys, dangling, self
+and cyclic dependencies) and a random config, then compares per-task scores
+with a tolerance, rank order, urgency and the reported cycles.
+
+Long local sessions:
+    DIFF_FUZZ_ITERATIONS=20000 DIFF_FUZZ_SEED=random python manage.py test tests.test_differential
+Failures report the seed and iteration so a case can be replayed with
+DIFF_FUZZ_SEED=<seed>.
+"""
+
+import math
+import os
+import random
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+
+from application.dto.task_dto import to_task_dto
+from application.services.analyze_tasks_service import _build_task_map, _date_parser
+from application.services.config_service import build_scoring_config, merge_config
+from core.models.dependency_graph import DependencyGraph
+from core.models.task_graph import TaskGraph
+from core.scoring.priority_engine import PriorityEngine
+from core.scoring.urgency import compute_urgency, compute_urgency_column
+from tests import reference_impl
+
+ITERATIONS = int(os.getenv("DIFF_FUZZ_ITERATIONS", "150"))
+SEED = os.getenv("DIFF_FUZZ_SEED", "20240917")
+
+REL_TOL = 1e-9
+ABS_TOL = 1e-9
+
+
+def _seed() -> int:
+    return random.SystemRandom().randrange(2 ** 32) if SEED == "random" else int(SEED)
+
+
+def random_payload(rng: random.Random):
+    count = rng.randint(0, 40)
+    titles = [f"T{rng.randrange(count + 5)}" for _ in range(count)]
+    ids = [None if rng.random() < 0.2 else rng.choice((str(i), i, f"k{i}")) for i in range(count)]
+    names = [str(i) for i in ids if i is not None] + titles + ["ghost", "missing-1"]
+    today = date.today()
+    payload = []
+    for pos in range(count):
+        raw = {"title": titles[pos]}
+        if ids[pos] is not None:
+            raw["id"] = ids[pos]
+        roll = rng.random()
+        if roll < 0.3:
+            raw["due_date"] = (today - timedelta(days=rng.randint(1, 400))).isoformat()
+        elif roll < 0.9:
+            raw["due_date"] = (today + timedelta(days=rng.randint(0, 60))).isoformat()
+        elif roll < 0.95:
+            raw["due_date"] = "not a date"
+        if rng.random() < 0.9:
+            raw["estimated_hours"] = rng.choice((0, -2, 0.25, rng.uniform(0.1, 40), rng.randint(1, 16)))
+        if rng.random() < 0.9:
+            raw["importance"] = rng.randint(1, 10)
+        deps = []
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 3, 5))):
+            deps.append(rng.choice(names) if names else "ghost")
+        if rng.random() < 0.05:
+            deps.append(str(ids[pos]) if ids[pos] is not None else titles[pos])
+        raw["dependencies"] = deps
+        payload.append(raw)
+    return payload
+
+
+def random_config(rng: random.Random):
+    overrides = {
+        "urgency_mode": rng.choice(("linear", "exponential", "threshold")),
+        "urgency_threshold": rng.randint(0, 10),
+        "overdue_base": rng.uniform(0, 20),
+        "overdue_growth": rng.uniform(0, 3),
+        "weight_urgency": rng.uniform(0, 5),
+        "weight_importance": rng.uniform(0, 5),
+        "weight_effort": rng.uniform(0, 5),
+        "weight_dependency": rng.uniform(0, 5),
+    }
+    return build_scoring_config(merge_config(overrides))
+
+
+class DifferentialEquivalenceTests(SimpleTestCase):
+    def _cases(self):
+        seed = _seed()
+        rng = random.Random(seed)
+        for iteration in range(ITERATIONS):
+            dtos = [to_task_dto(raw, _date_parser) for raw in random_payload(rng)]
+            yield f"seed={seed} iteration={iteration}", dtos, random_config(rng)
+
+    def assertScoresClose(self, optimized, reference, where):
+        self.assertEqual(len(optimized), len(reference), where)
+        for pos, (got, want) in enumerate(zip(optimized, reference)):
+            self.assertTrue(
+                math.isclose(got, want, rel_tol=REL_TOL, abs_tol=ABS_TOL),
+                f"{where}: task {pos} scored {got!r}, reference {want!r}",
+            )
+
+    def assertRankOrderConsistent(self, ranked, reference_scores, where):
+        """Ranks may swap only between tasks whose reference scores tie within tolerance."""
+        scores = [reference_scores[id(task)] for task, _ in ranked]
+        for pos, (higher, lower) in enumerate(zip(scores, scores[1:])):
+            self.assertTrue(
+                higher >= lower or math.isclose(higher, lower, rel_tol=REL_TOL, abs_tol=ABS_TOL),
+                f"{where}: rank {pos + 1} ({higher!r}) below rank {pos + 2} ({lower!r})",
+            )
+
+    def test_urgency_matches_reference(self):
+        for where, dtos, config in self._cases():
+            expected = [reference_impl.compute_urgency(t, config) for t in dtos]
+            self.assertScoresClose([compute_urgency(t, config) for t in dtos], expected, where)
+            deltas = [(t.due_date - date.today()).days for t in dtos]
+            self.assertScoresClose(compute_urgency_column(deltas, config), expected, where)
+
+    def test_score_tasks_matches_reference(self):
+        for where, dtos, config in self._cases():
+            ranked = PriorityEngine(config).score_tasks(dtos)
+            reference = reference_impl.PriorityEngine(config).score_tasks(dtos)
+            want = {id(task): score for task, score in reference}
+            self.assertScoresClose([s for _, s in ranked], [want[id(t)] for t, _ in ranked], where)
+            self.assertRankOrderConsistent(ranked, want, where)
+
+    def test_graph_scoring_matches_reference(self):
+        """The analyze path: task map keys (title fallback) and a shared TaskGraph."""
+        for where, dtos, config in self._cases():
+            task_map = _build_task_map(dtos)
+            tasks = list(task_map.values())
+            graph = TaskGraph.from_task_map(task_map)
+            engine = PriorityEngine(config)
+            scores = engine.combine(engine.component_columns(tasks, task_map=task_map, graph=graph))
+            reference = reference_impl.PriorityEngine(config)
+            self.assertScoresClose(scores, [reference.score_task(t, task_map) for t in tasks], where)
+
+    def test_cycles_match_reference(self):
+        """
+        Same cycles in the same order. TaskGraph collapses repeated entries in
+        a dependency list into one edge, where the reference DFS reports the
+        cycle again for every repeat, so repeats are dropped before comparing.
+        """
+        for where, dtos, _ in self._cases():
+            task_map = _build_task_map(dtos)
+            self.assertEqual(
+                _distinct(DependencyGraph(task_map).get_cycles()),
+                _distinct(reference_impl.DependencyGraph(task_map).get_cycles()),
+                where,
+            )
+
+
+def _distinct(cycles):
+    seen = set()
+    return [c for c in cycles if not (tuple(c) in seen or seen.add(tuple(c)))]
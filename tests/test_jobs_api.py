@@ -0,0 +1,87 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from infrastructure.api.jobs import JobManager, QueueFull, estimate_request_cost, reset_job_manager
+
+
+def _tasks(count):
+    return [
+        {"id": f"t{i}", "title": f"Task {i}", "estimated_hours": 1, "importance": 5,
+         "dependencies": [f"t{i - 1}"] if i else []}
+        for i in range(count)
+    ]
+
+
+class JobManagerTests(SimpleTestCase):
+    def test_cost_counts_tasks_and_edges(self) -> None:
+        self.assertEqual(estimate_request_cost(_tasks(4)), 7)
+        self.assertEqual(estimate_request_cost(None), 0)
+
+    def test_queue_limit_and_cancellation(self) -> None:
+        manager = JobManager(workers=1, max_queued=1)
+        release = threading.Event()
+        try:
+            running = manager.submit("test", 1, lambda: (release.wait(5), (200, {}))[1])
+            while manager.get(running.id).status != "running":
+                time.sleep(0.01)
+            waiting = manager.submit("test", 1, lambda: (200, {"ok": True}))
+            with self.assertRaises(QueueFull):
+                manager.submit("test", 1, lambda: (200, {}))
+
+            self.assertEqual(manager.cancel(waiting.id).status, "cancelled")
+            self.assertEqual(manager.cancel(running.id).status, "cancelled")
+            release.set()
+            running.future.result(timeout=5)
+            self.assertEqual(manager.get(running.id).status, "cancelled")
+            self.assertIsNone(manager.get(running.id).result)
+        finally:
+            release.set()
+            manager.shutdown()
+
+
+@override_settings(TASK_JOB_COST_THRESHOLD=10)
+class AnalyzeJobAPITests(APITestCase):
+    def setUp(self) -> None:
+        reset_job_manager()
+
+    def tearDown(self) -> None:
+        reset_job_manager()
+
+    def test_small_requests_stay_synchronous(self):
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": _tasks(3)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_large_request_is_queued_and_polled(self):
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": _tasks(8)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["cost"], 15)
+        status_url = response["Location"]
+        self.assertEqual(status_url, response.data["status_url"])
+
+        for _ in range(500):
+            job = self.client.get(status_url).data
+            if job["status"] in ("done", "failed"):
+                break
+            time.sleep(0.01)
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["http_status"], 200)
+        self.assertEqual(len(job["result"]["results"]["priority_list"]), 8)
+
+        self.assertEqual(self.client.get("/api/tasks/jobs/missing/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_queued_payload_fails_the_job(self):
+        tasks = _tasks(8)
+        tasks[0]["estimated_hours"] = "many"
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": tasks}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        for _ in range(500):
+            job = self.client.get(response["Location"]).data
+            if job["status"] in ("done", "failed"):
+                break
+            time.sleep(0.01)
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["http_status"], 400)
@@ -0,0 +1,66 @@
+import itertools
+import random
+
+from django.test import SimpleTestCase
+
+from core.scheduling.knapsack import GREEDY_GUARANTEE, select_within_budget
+
+
+def _brute_force(values, weights, capacity):
+    best = 0.0
+    for r in range(len(values) + 1):
+        for combo in itertools.combinations(range(len(values)), r):
+            if sum(weights[i] for i in combo) <= capacity:
+                best = max(best, sum(values[i] for i in combo))
+    return best
+
+
+class KnapsackTests(SimpleTestCase):
+    def test_exact_mode_matches_brute_force(self) -> None:
+        rng = random.Random(7)
+        for _ in range(30):
+            n = rng.randint(1, 9)
+            values = [rng.uniform(0.5, 20) for _ in range(n)]
+            weights = [rng.choice([0.5, 1, 1.5, 2, 4, 6, 8, 16]) for _ in range(n)]
+            result = select_within_budget(values, weights, 8)
+            self.assertEqual(result.method, "exact")
+            self.assertLessEqual(result.total_weight, 8)
+            self.assertAlmostEqual(result.total_value, _brute_force(values, weights, 8))
+
+    def test_off_grid_weights_are_not_reported_exact(self) -> None:
+        result = select_within_budget([3.0, 3.0, 3.0], [2.7, 2.7, 2.7], 8.1)
+        self.assertEqual(result.method, "grid")
+        self.assertEqual(len(result.chosen), 3)
+
+        rng = random.Random(5)
+        for _ in range(30):
+            n = rng.randint(1, 8)
+            values = [rng.uniform(0.5, 20) for _ in range(n)]
+            weights = [round(rng.uniform(0.3, 5), 2) for _ in range(n)]
+            result = select_within_budget(values, weights, 7.9)
+            self.assertIn(result.method, ("exact", "grid"))
+            self.assertLessEqual(result.total_weight, 7.9 + 1e-9)
+            self.assertGreaterEqual(result.total_value, GREEDY_GUARANTEE * _brute_force(values, weights, 7.9))
+
+    def test_no_candidates_skips_the_table(self) -> None:
+        result = select_within_budget([5.0, 0.0], [1e12, 2.0], 1e9)
+        self.assertEqual((result.chosen, result.total_value, result.method), ([], 0, "exact"))
+
+    def test_negative_hours_are_never_free(self) -> None:
+        result = select_within_budget([9.0, 3.0, 2.0], [-5.0, 0.0, 2.0], 2)
+        self.assertEqual(sorted(result.chosen), [1, 2])
+        self.assertEqual((result.total_value, result.total_weight, result.upper_bound), (5.0, 2.0, 5.0))
+
+    def test_greedy_mode_respects_budget_and_bound(self) -> None:
+        rng = random.Random(3)
+        values = [rng.uniform(1, 10) for _ in range(3000)]
+        weights = [rng.choice([0.5, 1, 2, 3, 5, 8]) for _ in range(3000)]
+        result = select_within_budget(values, weights, 40, exact_cell_limit=1000)
+        self.assertEqual(result.method, "greedy")
+        self.assertLessEqual(result.total_weight, 40)
+        self.assertGreaterEqual(result.total_value, GREEDY_GUARANTEE * result.upper_bound)
+
+    def test_prefers_several_small_tasks_over_one_large(self) -> None:
+        # one 8h task scoring 10 vs four 2h tasks scoring 4 each
+        result = select_within_budget([10, 4, 4, 4, 4], [8, 2, 2, 2, 2], 8)
+        self.assertEqual(sorted(result.chosen), [1, 2, 3, 4])
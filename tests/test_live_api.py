@@ -0,0 +1,97 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase
+
+from infrastructure.api import live
+from infrastructure.api.live import reset_broadcaster
+
+
+def _tasks(importance_by_id):
+    return [
+        {"id": tid, "title": tid.upper(), "due_date": "2030-01-01", "estimated_hours": 2,
+         "importance": importance, "dependencies": []}
+        for tid, importance in importance_by_id.items()
+    ]
+
+
+def _parse(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return fields["event"], int(fields["id"]), json.loads(fields["data"])
+
+
+class LiveRankingTests(SimpleTestCase):
+    def setUp(self):
+        reset_broadcaster()
+        self.addCleanup(reset_broadcaster)
+
+    async def _next(self, events):
+        return await asyncio.wait_for(events.__anext__(), 5)
+
+    async def test_stream_pushes_snapshot_then_changes_only(self):
+        post = sync_to_async(self.client.post)
+        response = await self.async_client.get(
+            "/api/tasks/live/p1/?top_k=2&rank_threshold=1", headers={"Accept-Encoding": "gzip"},
+        )
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        # event streams are never gzipped, whatever the client accepts
+        self.assertFalse(response.has_header("Content-Encoding"))
+        events = response.streaming_content.__aiter__()
+        try:
+            self.assertEqual(await self._next(events), b"retry: 3000\n\n")
+            await post("/api/tasks/analyze/?project=p1", data={"tasks": _tasks({"a": 9, "b": 5, "c": 1})},
+                       content_type="application/json")
+            kind, version, data = _parse(await self._next(events))
+            self.assertEqual((kind, version, data["top"], data["task_count"]), ("snapshot", 1, ["a", "b"], 3))
+
+            # unchanged ranking: nothing is pushed; then c jumps to the top
+            await post("/api/tasks/suggest/?project=p1", data={"tasks": _tasks({"a": 9, "b": 5, "c": 1})},
+                       content_type="application/json")
+            await post("/api/tasks/analyze/?project=p1", data={"tasks": _tasks({"a": 9, "b": 5, "c": 10, "d": 2})},
+                       content_type="application/json")
+            kind, version, data = _parse(await self._next(events))
+            self.assertEqual((kind, version), ("ranking", 3))
+            self.assertEqual(data["top"], ["c", "a"])
+            self.assertEqual(data["entered_top"], [{"id": "c", "rank": 1, "previous_rank": 3}])
+            self.assertEqual(data["added"], ["d"])
+        finally:
+            await events.aclose()
+            response.close()
+        # the last subscriber left: the project's payload is released
+        self.assertNotIn("p1", live.get_broadcaster()._channels)
+
+    async def test_late_subscriber_gets_current_snapshot(self):
+        broadcaster = live.get_broadcaster()
+        loop = asyncio.get_running_loop()
+        first = broadcaster.subscribe("p4", loop)
+        broadcaster.publish("p4", _tasks({"a": 1, "b": 2}))
+        await asyncio.wait_for(first.queue.get(), 5)
+        late = broadcaster.subscribe("p4", loop, top_k=1)
+        self.assertEqual(late.queue.get_nowait(), ("snapshot", 1, {"top": ["b"], "task_count": 2, "blocked_count": 0}))
+
+    def test_unwatched_projects_keep_no_payload(self):
+        # no stream was ever opened (the WSGI case): publishing does nothing
+        self.client.post("/api/tasks/analyze/?project=p5", data={"tasks": _tasks({"a": 1})},
+                         content_type="application/json")
+        self.assertIsNone(live._BROADCASTER)
+
+        broadcaster = live.get_broadcaster()
+        for project in ("p5", "p6"):
+            broadcaster.publish(project, _tasks({"a": 1}))
+        self.assertEqual(broadcaster._channels, {})
+
+    async def test_one_computation_is_shared_by_all_subscribers(self):
+        broadcaster = live.get_broadcaster()
+        loop = asyncio.get_running_loop()
+        subscribers = [broadcaster.subscribe("p2", loop, top_k=1) for _ in range(5)]
+        with mock.patch.object(live, "compact_ranking", wraps=live.compact_ranking) as compute:
+            broadcaster.publish("p2", _tasks({"a": 3, "b": 7}))
+            first = [await asyncio.wait_for(s.queue.get(), 5) for s in subscribers]
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(first, [("snapshot", 1, {"top": ["b"], "task_count": 2, "blocked_count": 0})] * 5)
+
+    def test_wsgi_requests_are_refused(self):
+        response = self.client.get("/api/tasks/live/p3/")
+        self.assertEqual(response.status_code, 501)
@@ -0,0 +1,30 @@
+import json
+
+from django.test import SimpleTestCase
+
+from benchmarks.memory_stages import REQUEST_STAGES, check_memory_budgets, measure_analyze_memory
+
+
+def _body(count):
+    tasks = [
+        {"id": f"t{i}", "title": f"Task {i}", "due_date": f"2030-01-{1 + i % 28:02d}",
+         "estimated_hours": 1 + i % 8, "importance": 1 + i % 10,
+         "dependencies": [f"t{i - 1}", f"t{i // 2}"] if i else []}
+        for i in range(count)
+    ]
+    return json.dumps({"tasks": tasks}).encode("utf-8")
+
+
+class MemoryBudgetTests(SimpleTestCase):
+    def test_analyze_stages_stay_within_budgets(self) -> None:
+        for count in (200, 2000):
+            report = measure_analyze_memory(_body(count))
+            self.assertEqual([s["stage"] for s in report["stages"]], list(REQUEST_STAGES))
+            self.assertEqual(report["tasks"], count)
+            self.assertEqual(check_memory_budgets(report), [], f"{count} tasks")
+
+    def test_budget_violations_name_the_stage(self) -> None:
+        report = measure_analyze_memory(_body(50))
+        over = check_memory_budgets(report, {"records": (0, 1)})
+        self.assertEqual(len(over), 1)
+        self.assertTrue(over[0].startswith("records: peak"))
@@ -1,12 +1,23 @@
+import random
 from datetime import date, timedelta
+from unittest import mock
 
 from django.test import SimpleTestCase
 
 from application.services.config_service import build_scoring_config, merge_config
 from core.models.dependency_graph import DependencyGraph
 from core.models.task_entity import TaskEntity
+from core.models.task_graph import TaskGraph
+from core.scheduling.critical_path import compute_critical_path
+from core.scoring.dependency_reach import (
+    approximate_dependent_counts,
+    precision_for_error,
+    reach_by_task,
+    transitive_dependent_counts,
+)
+from core.scoring.components import ScoringComponent, register_component, unregister_component
 from core.scoring.priority_engine import PriorityEngine
-from core.validators.task_validator import TaskValidator
+from core.validators.task_validator import TaskValidator, ValidationBudgetExceeded
 
 
 def _make_task(task_id: str, due_days: int = 1, hours: float = 2.0, importance: int = 5, deps=None) -> TaskEntity:
@@ -46,6 +57,28 @@ class TaskValidatorTests(SimpleTestCase):
         fields = {issue["field"] for issue in issues}
         self.assertTrue({"title", "due_date", "estimated_hours", "importance", "dependencies"}.issubset(fields))
 
+    def test_validate_batch_matches_per_task_validation(self) -> None:
+        good = _make_task("ok")
+        broken = TaskEntity(
+            id="bad",
+            title="",
+            due_date=None,
+            estimated_hours="lots",  # type: ignore[arg-type]
+            importance=-2,
+            dependencies="x",  # type: ignore[arg-type]
+        )
+        validator = TaskValidator()
+        by_index = validator.validate_batch([good, broken, good])
+        self.assertEqual(list(by_index), [1])
+        self.assertEqual(by_index[1], validator.validate(broken)[1])
+
+    def test_validate_batch_stops_when_budget_exceeded(self) -> None:
+        broken = [_make_task(str(i), importance=-1) for i in range(50)]
+        with self.assertRaises(ValidationBudgetExceeded) as ctx:
+            TaskValidator().validate_batch(broken, max_issues=5)
+        self.assertEqual(len(ctx.exception.issues), 5)
+        self.assertEqual(ctx.exception.issues[0]["index"], 0)
+
 
 class DependencyGraphTests(SimpleTestCase):
     def test_cycle_detection_and_stack_cleanup(self) -> None:
@@ -61,6 +94,110 @@ class DependencyGraphTests(SimpleTestCase):
         graph2 = DependencyGraph({t.id: t for t in [task_a, task_b, task_c]})
         self.assertFalse(graph2.has_cycle())
 
+    def test_critical_path_and_slack(self) -> None:
+        # 0 -> 1 -> 3 (2 + 5 + 1 hours) beats 0 -> 2 -> 3 (2 + 1 + 1 hours)
+        result = compute_critical_path(
+            hours=[2, 5, 1, 1, 3],
+            graph=TaskGraph.from_adjacency([[], [0], [0], [1, 2], [4]]),
+            deadline_hours=[100, 100, 100, 10, 100],
+        )
+        self.assertEqual(result.path, [0, 1, 3])
+        self.assertEqual(result.length, 8)
+        self.assertEqual(result.criticality[1], 1.0)
+        self.assertEqual(result.criticality[2], 4 / 8)
+        self.assertEqual(result.slack[3], 2)
+        self.assertEqual(result.slack[0], 2)
+        self.assertEqual(result.slack[2], 6)
+        self.assertIsNone(result.slack[4])
+        self.assertEqual(result.earliest_finish[4], None)
+
+    def test_task_graph_csr_adjacency_and_issues(self) -> None:
+        tasks = [
+            _make_task("A", deps=["B", "B", "ghost"]),
+            _make_task("B"),
+            _make_task("C", deps=["A", "B", "C"]),
+        ]
+        graph = TaskGraph.from_tasks(tasks)
+        self.assertEqual(list(graph.dependencies(0)), [1])
+        self.assertEqual(list(graph.dependents(1)), [0, 2])
+        self.assertEqual(graph.dependent_counts(), [1, 2, 1])
+        self.assertEqual(graph.unknown, [(0, "ghost")])
+        self.assertEqual(graph.self_deps, [2])
+        self.assertEqual(graph.topological_order(), [1, 0])
+        self.assertEqual(graph.find_cycles(), [[2, 2]])
+
+    def test_deep_chain_does_not_hit_recursion_limit(self) -> None:
+        chain = {str(i): _make_task(str(i), deps=[str(i + 1)]) for i in range(5000)}
+        chain["4999"].dependencies = ["0"]
+        cycles = DependencyGraph(chain).get_cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), 5001)
+
+
+class DependencyReachTests(SimpleTestCase):
+    def test_transitive_counts_chain_diamond_and_cycle(self) -> None:
+        # 0 <- 1 <- 2 <- 3 chain; 4 <- (5, 6) <- 7 diamond; 8 <-> 9 cycle with 10 behind 8
+        graph = TaskGraph.from_adjacency(
+            [[], [0], [1], [2], [], [4], [4], [5, 6], [9], [8], [8]]
+        )
+        self.assertEqual(
+            transitive_dependent_counts(graph),
+            [3, 2, 1, 0, 3, 1, 1, 0, 2, 1, 0],
+        )
+
+    def test_approximate_is_exact_below_sparse_limit(self) -> None:
+        graph = TaskGraph.from_adjacency([[i - 1, i // 2] if i else [] for i in range(40)])
+        self.assertEqual(approximate_dependent_counts(graph, 0.05), transitive_dependent_counts(graph))
+
+    def test_approximate_stays_within_error_bound(self) -> None:
+        rng = random.Random(11)
+        graph = TaskGraph.from_adjacency(
+            [sorted({rng.randrange(i) for _ in range(3)}) if i else [] for i in range(3000)]
+        )
+        exact = transitive_dependent_counts(graph)
+        approx = approximate_dependent_counts(graph, 0.05, sparse_limit=8)
+        errors = [abs(a - e) / e for e, a in zip(exact, approx) if e > 100]
+        self.assertTrue(errors)
+        self.assertLess(sum(errors) / len(errors), 0.05)
+        self.assertLess(max(errors), 0.25)
+        with self.assertRaises(ValueError):
+            precision_for_error(0)
+
+    def test_dependency_mode_changes_dependency_column(self) -> None:
+        tasks = [
+            _make_task("A"),
+            _make_task("B", deps=["A"]),
+            _make_task("C", deps=["B"]),
+        ]
+        task_map = {t.id: t for t in tasks}
+        for mode, expected in (("direct", [1, 1, 0]), ("transitive", [2, 1, 0]), ("approximate", [2, 1, 0])):
+            engine = PriorityEngine(build_scoring_config(merge_config({"dependency_mode": mode})))
+            columns = engine.component_columns(tasks)
+            self.assertEqual(columns["dependency"], expected)
+            self.assertEqual(engine.combine(columns), [engine.score_task(t, task_map) for t in tasks])
+
+    def test_reach_of_a_single_task_uses_the_task_map(self) -> None:
+        tasks = [_make_task("A"), _make_task("B", deps=["A"]), _make_task("C", deps=["B"])]
+        task_map = {t.id: t for t in tasks}
+        engine = PriorityEngine(build_scoring_config(merge_config({"dependency_mode": "transitive"})))
+        breakdown = engine.score_breakdowns([tasks[0]], task_map=task_map)[0]
+        self.assertEqual(breakdown.dependency, 2)
+        self.assertEqual(breakdown.score, engine.score_task(tasks[0], task_map))
+        self.assertIn("unblocks 2 task(s)", engine.explain_task(tasks[0], task_map))
+
+    def test_score_task_sweeps_reach_once_per_task_map(self) -> None:
+        tasks = [_make_task(str(i), deps=[str(i - 1)] if i else []) for i in range(50)]
+        task_map = {t.id: t for t in tasks}
+        engine = PriorityEngine(build_scoring_config(merge_config({"dependency_mode": "transitive"})))
+        with mock.patch("core.scoring.priority_engine.reach_by_task", wraps=reach_by_task) as sweep:
+            single = [engine.score_task(t, task_map) for t in tasks]
+            self.assertEqual(sweep.call_count, 1)
+            task_map["extra"] = _make_task("extra", deps=["49"])
+            engine.score_task(tasks[0], task_map)
+            self.assertEqual(sweep.call_count, 2)
+        del task_map["extra"]
+        self.assertEqual(single, engine.combine(engine.component_columns(tasks, task_map=task_map)))
+
 
 class ConfigAdapterTests(SimpleTestCase):
     def test_build_scoring_config_respects_overrides(self) -> None:
@@ -80,3 +217,131 @@ class PriorityEngineTests(SimpleTestCase):
         engine = PriorityEngine(scoring_config)
         scores = engine.score_tasks(tasks)
         self.assertEqual(scores[0][0].id, "A")
+
+    def test_component_columns_match_per_task_scores(self) -> None:
+        tasks = [
+            _make_task("A", due_days=-3, hours=1),
+            _make_task("B", due_days=4, hours=6, deps=["A"]),
+            _make_task("C", due_days=0, hours=0.5, deps=["A", "B"]),
+        ]
+        for mode in ("linear", "exponential", "threshold"):
+            engine = PriorityEngine(build_scoring_config(merge_config({"urgency_mode": mode})))
+            task_map = {t.id: t for t in tasks}
+            batch = engine.combine(engine.component_columns(tasks))
+            single = [engine.score_task(t, task_map) for t in tasks]
+            self.assertEqual(batch, single)
+
+    def test_score_breakdowns_capture_components(self) -> None:
+        tasks = [_make_task("A", due_days=-2, hours=4), _make_task("B", due_days=3, deps=["A"])]
+        engine = PriorityEngine(build_scoring_config(merge_config({})))
+        task_map = {t.id: t for t in tasks}
+        overdue, later = engine.score_breakdowns(tasks, task_map=task_map)
+        self.assertEqual(overdue.overdue_days, 2)
+        self.assertEqual(overdue.dependency, 1)
+        self.assertEqual(later.overdue_days, 0)
+        self.assertEqual(overdue.score, engine.score_task(tasks[0], task_map))
+        self.assertIn("overdue by 2", engine.explain_task(tasks[0], task_map))
+
+    def test_eisenhower_stage_scales_scores_by_quadrant(self) -> None:
+        tasks = [
+            _make_task("top", due_days=0, importance=9),
+            _make_task("urgent", due_days=1, importance=2),
+            _make_task("important", due_days=30, importance=9),
+            _make_task("low", due_days=30, importance=2),
+        ]
+        plain = PriorityEngine(build_scoring_config(merge_config({})))
+        staged = PriorityEngine(build_scoring_config(merge_config({
+            "enable_eisenhower": True,
+            "q_multipliers": {"Q1_TOP": 2.0},
+        })))
+        task_map = {t.id: t for t in tasks}
+        plain_rows = plain.score_breakdowns(tasks, task_map=task_map)
+        staged_rows = staged.score_breakdowns(tasks, task_map=task_map)
+        self.assertEqual([r.quadrant for r in staged_rows], ["Q1_TOP", "Q2_URGENT", "Q3_IMPORTANT", "Q4_LOW"])
+        self.assertAlmostEqual(staged_rows[0].score, plain_rows[0].score * 2.0)
+        self.assertAlmostEqual(staged_rows[3].score, plain_rows[3].score * 0.9)
+        self.assertAlmostEqual(staged.score_task(tasks[1], task_map), staged_rows[1].score)
+
+    def test_raw_field_factor_and_registered_component(self) -> None:
+        tasks = [_make_task("A"), _make_task("B")]
+        tasks[0].raw = {"tier": "gold", "sprint": True}
+        tasks[1].raw = {"tier": "bronze"}
+        base = PriorityEngine(build_scoring_config(merge_config({})))
+        engine = PriorityEngine(build_scoring_config(merge_config({
+            "raw_factors": {
+                "tier": {"field": "tier", "values": {"gold": 2, "silver": 1}},
+                "sprint": {"field": "sprint"},
+            },
+            "component_weights": {"tier": 0.5, "sprint": 3},
+        })))
+        task_map = {t.id: t for t in tasks}
+        rows = engine.score_breakdowns(tasks, task_map=task_map)
+        base_rows = base.score_breakdowns(tasks, task_map=task_map)
+        self.assertEqual(rows[0].factors, {"tier": 2.0, "sprint": 1.0})
+        self.assertEqual(rows[1].factors, {"tier": 0.0, "sprint": 0.0})
+        self.assertIsNone(base_rows[0].factors)
+        self.assertAlmostEqual(rows[0].score, base_rows[0].score + 4.0)
+        self.assertAlmostEqual(rows[1].score, base_rows[1].score)
+        self.assertAlmostEqual(engine.score_task(tasks[0], task_map), rows[0].score)
+        self.assertIn("tier", engine.component_timings)
+        self.assertIn("tier 2", engine.describe(rows[0]))
+
+        register_component(ScoringComponent("title_length", lambda ctx: [len(t.title) for t in ctx.tasks]))
+        try:
+            with self.assertRaises(ValueError):
+                register_component(ScoringComponent("urgency", lambda ctx: []), replace=True)
+            weighted = PriorityEngine(build_scoring_config(merge_config({"component_weights": {"title_length": 1}})))
+            self.assertIn("title_length", weighted.weight_keys())
+            scores = weighted.combine(weighted.component_columns(tasks, task_map=task_map))
+            self.assertAlmostEqual(scores[0], base_rows[0].score + len("Task A"))
+        finally:
+            unregister_component("title_length")
+
+    def test_explain_task_uses_the_whole_map_critical_path(self) -> None:
+        tasks = [
+            _make_task("A", hours=4),
+            _make_task("B", hours=4, deps=["A"]),
+            _make_task("C", hours=4, deps=["B"]),
+            _make_task("D", hours=1),
+        ]
+        task_map = {t.id: t for t in tasks}
+        engine = PriorityEngine(build_scoring_config(merge_config({"weight_critical_path": 5})))
+        with mock.patch.object(engine, "critical_path", wraps=engine.critical_path) as critical_path:
+            for task in tasks:
+                breakdown = engine.score_breakdowns([task], task_map=task_map)[0]
+                self.assertAlmostEqual(breakdown.score, engine.score_task(task, task_map))
+            # one critical path sweep serves every per-task call on the map
+            self.assertEqual(critical_path.call_count, 1)
+        self.assertIn("on critical path", engine.explain_task(tasks[2], task_map))
+        self.assertNotIn("on critical path", engine.explain_task(tasks[3], task_map))
+
+    def test_projection_recomputes_dated_components(self) -> None:
+        tasks = [_make_task("A", due_days=3, hours=4), _make_task("B", due_days=10, hours=4, deps=["A"])]
+        tasks[0].raw = {"points": 2}
+        tasks[1].raw = {"points": 1}
+        # "behind": hours behind schedule; "days_left": days to the due date
+        register_component(ScoringComponent(
+            "behind", lambda ctx: [max(-s, 0.0) if s is not None else 0.0 for s in ctx.columns["slack_hours"]],
+        ))
+        register_component(ScoringComponent("days_left", lambda ctx: [(t.due_date - ctx.today).days for t in ctx.tasks]))
+        try:
+            engine = PriorityEngine(build_scoring_config(merge_config({
+                "raw_factors": {"points": {"field": "points"}},
+                "component_weights": {"behind": 1, "days_left": 1, "points": 1},
+            })))
+            graph = TaskGraph.from_tasks(tasks)
+            columns = engine.component_columns(tasks, graph=graph)
+            projected = list(engine.project_scores(tasks, columns, 5, graph=graph))
+
+            today = date.today()
+            for offset, scores in enumerate(projected):
+                day = today + timedelta(days=offset)
+                # the projection matches scoring from scratch on that day
+                expected = engine.combine(engine.component_columns(tasks, today=day, graph=graph))
+                for got, want in zip(scores, expected):
+                    self.assertAlmostEqual(got, want)
+            self.assertEqual(engine.component_columns(tasks, graph=graph)["behind"], [0.0, 0.0])
+            self.assertGreater(engine.component_columns(tasks, today=today + timedelta(days=5), graph=graph)["behind"][0], 0)
+        finally:
+            unregister_component("behind")
+            unregister_component("days_left")
@@ -0,0 +1,78 @@
+import os
+import pstats
+import tempfile
+
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from infrastructure.api.jobs import reset_job_manager
+
+TASKS = [
+    {"id": "a", "title": "A", "due_date": "2030-01-01", "estimated_hours": 2, "importance": 5, "dependencies": []},
+    {"id": "b", "title": "B", "due_date": "2030-01-02", "estimated_hours": 4, "importance": 7, "dependencies": ["a"]},
+]
+
+
+class ProfilingAPITests(APITestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        patcher = override_settings(TASK_PROFILING_TOKEN="s3cret", TASK_PROFILE_DIR=self.directory, TASK_PROFILE_KEEP=2)
+        patcher.enable()
+        self.addCleanup(patcher.disable)
+
+    def test_requests_without_header_are_not_profiled(self):
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": TASKS}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_wrong_or_disabled_token_is_forbidden(self):
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": TASKS}, format="json", HTTP_X_PROFILE_TOKEN="nope")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with override_settings(TASK_PROFILING_TOKEN=""):
+            response = self.client.get("/api/tasks/profiles/", HTTP_X_PROFILE_TOKEN="")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_profiles_are_saved_listed_and_downloaded_in_a_ring(self):
+        ids = []
+        for _ in range(3):
+            response = self.client.post(
+                "/api/tasks/analyze/", data={"tasks": TASKS}, format="json",
+                HTTP_X_PROFILE_TOKEN="s3cret", HTTP_X_PROFILE_MEMORY="1",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["results"]["priority_list"]), 2)
+            ids.append(response["X-Profile-Id"])
+        response = self.client.get("/api/tasks/suggest/", HTTP_X_PROFILE_TOKEN="s3cret")
+        ids.append(response["X-Profile-Id"])
+
+        listing = self.client.get("/api/tasks/profiles/", HTTP_X_PROFILE_TOKEN="s3cret").data["profiles"]
+        self.assertEqual([p["id"] for p in listing], [ids[3], ids[2]])
+        self.assertEqual([p["kind"] for p in listing], ["suggest", "analyze"])
+        self.assertIsNone(listing[0]["peak_bytes"])
+        self.assertGreater(listing[1]["peak_bytes"], 0)
+
+        summary = self.client.get(f"/api/tasks/profiles/{ids[2]}/?format=json", HTTP_X_PROFILE_TOKEN="s3cret").data
+        self.assertTrue(any("analyze_tasks_service" in row["function"] for row in summary["top_functions"]))
+        self.assertTrue(summary["allocations"]["top"])
+
+        response = self.client.get(f"/api/tasks/profiles/{ids[3]}/", HTTP_X_PROFILE_TOKEN="s3cret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        path = os.path.join(self.directory, "download.prof")
+        with open(path, "wb") as fh:
+            fh.write(b"".join(response.streaming_content))
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
+
+        missing = self.client.get(f"/api/tasks/profiles/{ids[0]}/", HTTP_X_PROFILE_TOKEN="s3cret")
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(TASK_JOB_COST_THRESHOLD=1)
+    def test_profiled_request_skips_the_job_queue(self):
+        reset_job_manager()
+        self.addCleanup(reset_job_manager)
+        response = self.client.post("/api/tasks/analyze/", data={"tasks": TASKS}, format="json", HTTP_X_PROFILE_TOKEN="s3cret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("X-Profile-Id", response)
@@ -0,0 +1,32 @@
+from datetime import date, timedelta
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+class ProjectionAPITests(APITestCase):
+    def test_projection_reports_when_task_becomes_top(self):
+        today = date.today()
+        payload = {
+            "tasks": [
+                {"id": "steady", "title": "Steady", "due_date": (today + timedelta(days=60)).isoformat(),
+                 "estimated_hours": 8, "importance": 6},
+                {"id": "deadline", "title": "Deadline", "due_date": (today + timedelta(days=3)).isoformat(),
+                 "estimated_hours": 8, "importance": 5},
+            ],
+            "config": {"urgency_mode": "threshold", "urgency_threshold": 1},
+            "days": 5,
+            "top_k": 2,
+        }
+        response = self.client.post("/api/tasks/projection/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual(len(results["dates"]), 6)
+        self.assertEqual(results["top_by_day"][0]["ids"], ["steady", "deadline"])
+        # inside the 1-day threshold window on day 2, overdue (and climbing) from day 4
+        became_top = [e for e in results["events"] if e["event"] == "became_top"]
+        self.assertEqual(became_top[0]["id"], "deadline")
+        self.assertEqual(became_top[0]["date"], (today + timedelta(days=2)).isoformat())
+        self.assertEqual(results["first_top"]["deadline"], (today + timedelta(days=2)).isoformat())
+        self.assertEqual(results["first_top"]["steady"], today.isoformat())
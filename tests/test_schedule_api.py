@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models.task_graph import TaskGraph
+from core.scheduling.capacity_scheduler import schedule_by_capacity
+
+
+class CapacitySchedulerTests(SimpleTestCase):
+    def test_dependencies_run_before_higher_scoring_dependents(self) -> None:
+        # task 1 scores highest but needs task 0; task 2 is independent
+        plan = schedule_by_capacity(
+            hours=[4, 4, 6],
+            scores=[1.0, 10.0, 5.0],
+            graph=TaskGraph.from_adjacency([[], [0], []]),
+            start_date=date(2024, 1, 1),  # Monday
+            daily_hours=8,
+        )
+        self.assertEqual(plan.order, [2, 0, 1])
+        self.assertEqual(plan.start_day, [0, 1, 0])
+        self.assertEqual(plan.finish_day, [1, 1, 0])
+
+    def test_weekend_budget_and_cycles(self) -> None:
+        plan = schedule_by_capacity(
+            hours=[8, 2, 2],
+            scores=[1.0, 1.0, 1.0],
+            graph=TaskGraph.from_adjacency([[], [2], [1]]),
+            start_date=date(2024, 1, 5),  # Friday
+            daily_hours=[8, 8, 8, 8, 4, 0, 0],
+        )
+        self.assertEqual(plan.start_day[0], 0)
+        self.assertEqual(plan.finish_day[0], 3)  # 4h Friday, 4h Monday
+        self.assertEqual(plan.unscheduled, {1: "blocked_by_cycle", 2: "blocked_by_cycle"})
+
+
+class ScheduleAPITests(APITestCase):
+    def test_schedule_flags_late_tasks(self):
+        today = date.today()
+        payload = {
+            "tasks": [
+                {"id": "a", "title": "A", "due_date": today.isoformat(), "estimated_hours": 6, "importance": 9},
+                {"id": "b", "title": "B", "due_date": today.isoformat(), "estimated_hours": 6, "importance": 1},
+                {"id": "c", "title": "C", "due_date": (today + timedelta(days=30)).isoformat(),
+                 "estimated_hours": 1, "importance": 1, "dependencies": ["b"]},
+            ],
+            "daily_hours": 8,
+        }
+        response = self.client.post("/api/tasks/schedule/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual([t["id"] for t in results["tasks"]], ["a", "b", "c"])
+        by_id = {t["id"]: t for t in results["tasks"]}
+        self.assertFalse(by_id["a"]["late"])
+        self.assertTrue(by_id["b"]["late"])
+        self.assertEqual(results["late_count"], 1)
+        self.assertEqual(results["days"][0]["planned_hours"], 8)
+
+    def test_schedule_rejects_invalid_budget(self):
+        payload = {"tasks": [{"id": "a", "title": "A"}], "daily_hours": [0, 0, 0, 0, 0, 0, 0]}
+        response = self.client.post("/api/tasks/schedule/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,62 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models.task_graph import TaskGraph
+from core.scheduling.dispatch_simulator import simulate_dispatch, work_hours_to_day
+
+
+class DispatchSimulatorTests(SimpleTestCase):
+    def test_workers_take_highest_scoring_eligible_task(self) -> None:
+        # 0 and 2 start in parallel; 1 waits for 0 even though it scores highest; 3 is in a cycle with itself
+        sim = simulate_dispatch(
+            hours=[4, 2, 6, 1],
+            scores=[5.0, 10.0, 1.0, 8.0],
+            graph=TaskGraph.from_adjacency([[], [0], [], [3]]),
+            workers=2,
+        )
+        self.assertEqual(sim.start[:3], [0.0, 4.0, 0.0])
+        self.assertEqual(sim.worker[:3], [0, 0, 1])
+        self.assertEqual(sim.timelines, [[0, 1], [2]])
+        self.assertEqual(sim.makespan, 6.0)
+        self.assertEqual(sim.unscheduled, {3: "blocked_by_cycle"})
+
+    def test_work_hours_map_to_working_days(self) -> None:
+        budget = [8, 8, 8, 8, 8, 0, 0]
+        self.assertEqual(work_hours_to_day(8, budget, 0), 1)
+        self.assertEqual(work_hours_to_day(8, budget, 0, finishing=True), 0)
+        self.assertEqual(work_hours_to_day(40, budget, 0), 7)  # next Monday
+        self.assertEqual(work_hours_to_day(40, budget, 0, finishing=True), 4)
+
+
+class SimulateAPITests(APITestCase):
+    def test_simulate_returns_worker_timelines(self):
+        payload = {
+            "tasks": [
+                {"id": "a", "title": "A", "due_date": "2024-01-01", "estimated_hours": 8, "importance": 9},
+                {"id": "b", "title": "B", "due_date": "2024-01-01", "estimated_hours": 8, "importance": 8},
+                {"id": "c", "title": "C", "due_date": "2024-01-10", "estimated_hours": 4, "importance": 1,
+                 "dependencies": ["a", "b"]},
+            ],
+            "workers": 2,
+            "daily_hours": 8,
+            "start_date": "2024-01-01",
+        }
+        response = self.client.post("/api/tasks/simulate/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual([w["busy_hours"] for w in results["workers"]], [12.0, 8.0])
+        by_id = {t["id"]: t for t in results["tasks"]}
+        self.assertEqual(by_id["c"]["start_date"], "2024-01-02")
+        self.assertEqual(by_id["a"]["finish_date"], "2024-01-01")
+        self.assertEqual(results["makespan_hours"], 12.0)
+        self.assertEqual(results["completion_date"], "2024-01-02")
+        self.assertEqual(results["late_count"], 0)
+
+    def test_simulate_rejects_bad_budget(self):
+        payload = {"tasks": [], "daily_hours": [8, 8]}
+        response = self.client.post("/api/tasks/simulate/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
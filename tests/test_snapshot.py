@@ -0,0 +1,84 @@
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from application.services.analyze_tasks_service import analyze_tasks_service
+from application.services.snapshot_service import snapshot_project_service
+from infrastructure.storage.snapshot import FORMAT_VERSION, SnapshotError, load_snapshot, write_snapshot
+
+TASKS = [
+    {"id": "a", "title": "Write spec", "due_date": "2030-01-10", "estimated_hours": 3, "importance": 8},
+    {"id": "b", "title": "Build", "due_date": "2030-01-20", "estimated_hours": 10, "importance": 6, "dependencies": ["a", "ghost"]},
+    {"id": "c", "title": "Ship ✓", "due_date": "2030-01-05", "estimated_hours": 1, "importance": 9, "dependencies": ["b"]},
+    {"title": "No id", "estimated_hours": 2, "importance": 3, "dependencies": ["No id"]},
+]
+
+
+class SnapshotTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "project.snap")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _write(self):
+        project = snapshot_project_service(TASKS)
+        write_snapshot(self.path, project["keys"], project["graph"], project["columns"], project["strings"], project["meta"])
+        return project
+
+    def test_round_trip_is_zero_copy_and_matches_analysis(self) -> None:
+        project = self._write()
+        analyzed = analyze_tasks_service(TASKS)
+        scores = {r["id"] or r["title"]: r["score"] for r in analyzed["priority_list"] + analyzed["blocked_tasks"]}
+
+        with load_snapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.task_count, 4)
+            self.assertEqual(list(snapshot.keys), ["a", "b", "c", "No id"])
+            self.assertEqual(snapshot.strings("titles")[2], "Ship ✓")
+            score = snapshot.section("score")
+            self.assertIsInstance(score, memoryview)
+            self.assertEqual(score.format, "d")
+            self.assertEqual({key: score[pos] for pos, key in enumerate(snapshot.keys)}, scores)
+            self.assertEqual(list(snapshot.section("blocked")), [0, 0, 0, 1])
+            self.assertEqual(list(snapshot.section("has_id")), [1, 1, 1, 0])
+
+            graph = snapshot.graph
+            self.assertEqual(graph.topological_order(), project["graph"].topological_order())
+            self.assertEqual(graph.find_cycles(), [[3, 3]])
+            self.assertEqual(list(graph.dependents(0)), [1])
+            self.assertEqual(graph.issues(), project["graph"].issues())
+            self.assertEqual(snapshot.meta["task_count"], 4)
+
+    def test_rejects_other_versions(self) -> None:
+        self._write()
+        with open(self.path, "r+b") as fh:
+            fh.seek(8)
+            fh.write((FORMAT_VERSION + 1).to_bytes(4, "little"))
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    def test_rejects_empty_file(self) -> None:
+        open(self.path, "wb").close()
+        with self.assertRaisesMessage(SnapshotError, "too small"):
+            load_snapshot(self.path)
+        with self.assertRaisesMessage(CommandError, "too small"):
+            call_command("project_snapshot", "show", self.path, stdout=io.StringIO())
+
+    def test_command_writes_and_shows_snapshot(self) -> None:
+        source = os.path.join(self.tmp.name, "tasks.json")
+        with open(source, "w", encoding="utf-8") as fh:
+            json.dump(TASKS, fh)
+        out = io.StringIO()
+        call_command("project_snapshot", "write", source, self.path, stdout=out)
+        self.assertEqual(json.loads(out.getvalue())["tasks"], 4)
+
+        out = io.StringIO()
+        call_command("project_snapshot", "show", self.path, "--top", "2", stdout=out)
+        shown = json.loads(out.getvalue())
+        self.assertEqual(len(shown["top"]), 2)
+        self.assertNotIn("No id", [t["key"] for t in shown["top"]])
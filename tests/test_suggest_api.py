@@ -1,8 +1,12 @@
+import json
 from datetime import date, timedelta
+from unittest import mock
 
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from infrastructure.api.http_cache import compute_etag
 from infrastructure.api.state import set_last_analyzed_payload
 
 
@@ -61,3 +65,81 @@ class SuggestAPITests(APITestCase):
         response_get = self.client.get("/api/tasks/suggest/")
         self.assertEqual(response_get.status_code, status.HTTP_200_OK)
         self.assertEqual(response_get.data["results"][0]["id"], "seed")
+
+    def test_suggest_reason_flags_overdue_tasks(self):
+        overdue = {
+            "id": "late",
+            "title": "Late",
+            "due_date": (date.today() - timedelta(days=3)).isoformat(),
+            "estimated_hours": 5,
+            "importance": 5,
+        }
+        self.client.post("/api/tasks/suggest/", data={"tasks": [overdue]}, format="json")
+        response = self.client.get("/api/tasks/suggest/?top_n=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("past due", response.data["results"][0]["reason"])
+
+    def test_suggest_conditional_get_returns_not_modified(self):
+        self._analyze()
+        first = self.client.get("/api/tasks/suggest/?top_n=1")
+        etag = first["ETag"]
+        self.assertTrue(etag)
+
+        cached = self.client.get("/api/tasks/suggest/?top_n=1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        other_top_n = self.client.get("/api/tasks/suggest/?top_n=2", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(other_top_n.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(other_top_n["ETag"], etag)
+
+    @override_settings(TASK_PAYLOAD_CACHE_MODE="compact")
+    def test_suggest_conditional_get_skips_decoding_compact_cache(self):
+        self._analyze()
+        etag = self.client.get("/api/tasks/suggest/?top_n=1")["ETag"]
+        with mock.patch("infrastructure.api.state.zlib.decompress", side_effect=AssertionError("decoded")):
+            cached = self.client.get("/api/tasks/suggest/?top_n=1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(TASK_PAYLOAD_CACHE_MODE="none")
+    def test_suggest_inline_tasks_without_payload_cache(self):
+        tasks = [{"id": "inline", "title": "Inline", "due_date": date.today().isoformat(), "dependencies": []}]
+        response = self.client.generic(
+            "GET", "/api/tasks/suggest/", json.dumps({"tasks": tasks}), content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["id"], "inline")
+        self.assertTrue(response.has_header("ETag"))
+
+        # nothing was retained for a later cache-backed request
+        response = self.client.get("/api/tasks/suggest/")
+        self.assertEqual(response.data.get("message"), "no_tasks_provided")
+        with self.assertRaises(ValueError):
+            compute_etag(None, "suggest")
+
+    def test_suggest_fills_hour_budget(self):
+        tasks = [
+            {"id": f"long{i}", "title": f"Long {i}", "due_date": date.today().isoformat(),
+             "estimated_hours": 16, "importance": 10}
+            for i in range(3)
+        ] + [
+            {"id": "short", "title": "Short", "due_date": date.today().isoformat(),
+             "estimated_hours": 3, "importance": 6},
+            # invalid negative hours must not count as free capacity
+            {"id": "negative", "title": "Negative", "due_date": date.today().isoformat(),
+             "estimated_hours": -4, "importance": 10},
+        ]
+        self.client.post("/api/tasks/suggest/", data={"tasks": tasks}, format="json")
+        response = self.client.get("/api/tasks/suggest/?hours=8")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r["id"] for r in response.data["results"]], ["short"])
+        self.assertEqual(response.data["budget"]["planned_hours"], 3)
+        self.assertEqual(response.data["budget"]["method"], "exact")
+
+        bad = self.client.get("/api/tasks/suggest/?hours=-2")
+        self.assertEqual(bad.status_code, status.HTTP_400_BAD_REQUEST)
+        too_many = self.client.get("/api/tasks/suggest/?hours=2e6")
+        self.assertEqual(too_many.status_code, status.HTTP_400_BAD_REQUEST)
+        for value in ("inf", "nan"):
+            response = self.client.get(f"/api/tasks/suggest/?hours={value}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {"error": "invalid_hours"})
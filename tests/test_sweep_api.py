@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+class SweepAPITests(APITestCase):
+    def _tasks(self):
+        return [
+            {
+                "id": "urgent",
+                "title": "Urgent Task",
+                "due_date": date.today().isoformat(),
+                "estimated_hours": 8,
+                "importance": 3,
+                "dependencies": [],
+            },
+            {
+                "id": "important",
+                "title": "Important Task",
+                "due_date": (date.today() + timedelta(days=10)).isoformat(),
+                "estimated_hours": 8,
+                "importance": 9,
+                "dependencies": [],
+            },
+        ]
+
+    def test_sweep_reports_rank_changes_per_weight_set(self):
+        payload = {
+            "tasks": self._tasks(),
+            "weight_sets": [{"weight_urgency": 20.0, "weight_importance": 0.1}, {}],
+            "top_k": 2,
+        }
+        response = self.client.post("/api/tasks/sweep/", data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual([e["id"] for e in results["baseline"]], ["important", "urgent"])
+
+        deadline_sweep, unchanged_sweep = results["sweeps"]
+        self.assertEqual(deadline_sweep["top"][0]["id"], "urgent")
+        self.assertEqual(deadline_sweep["top"][0]["rank_change"], 1)
+        self.assertEqual(deadline_sweep["weights"]["weight_urgency"], 20.0)
+        self.assertEqual(unchanged_sweep["top"], results["baseline"])
+
+    def test_sweep_requires_weight_sets(self):
+        response = self.client.post("/api/tasks/sweep/", data={"tasks": self._tasks()}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)